@@ -1,7 +1,33 @@
 from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
+
+from experimenter.notifications.models import Notification
 
 
 def google_analytics(request):
     """Context processor bits you need related to injecting Google Analytics
     in the rendered templates."""
     return {"USE_GOOGLE_ANALYTICS": settings.USE_GOOGLE_ANALYTICS}
+
+
+def unread_notifications(request):
+    """The signed in user's unread notifications, marked as read once they
+    are shown. A cached flag per user lets pages skip the query entirely
+    when there is nothing new."""
+
+    def get_unread_notifications():
+        user = getattr(request, "user", None)
+        if user is None or not user.is_authenticated:
+            return []
+
+        cache_key = Notification.HAS_UNREAD_CACHE_KEY.format(user_id=user.id)
+        if cache.get(cache_key) is False:
+            return []
+
+        # Cleared before reading so a notification created after the read
+        # sets it again
+        cache.set(cache_key, False)
+        return user.notifications.get_unread()
+
+    return {"unread_notifications": SimpleLazyObject(get_unread_notifications)}
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from experimenter.experiments.models import Experiment
+
+
+class Command(BaseCommand):
+    help = (
+        "Store the start, end and enrollment end dates of every experiment "
+        "so they can be filtered on"
+    )
+
+    def handle(self, **options):
+        updated = 0
+
+        with transaction.atomic():
+            for experiment in Experiment.objects.prefetch_related("changes"):
+                dates = {
+                    "computed_start_date": experiment.start_date,
+                    "computed_end_date": experiment.end_date,
+                    "computed_enrollment_end_date": (
+                        experiment.enrollment_end_date
+                    ),
+                }
+
+                if any(
+                    getattr(experiment, field) != date
+                    for field, date in dates.items()
+                ):
+                    Experiment.objects.filter(pk=experiment.pk).update(**dates)
+                    updated += 1
+
+        self.stdout.write("Updated dates of {} experiments".format(updated))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from experimenter.experiments.models import Experiment
+
+
+class Command(BaseCommand):
+    help = (
+        "Store which sections and reviews of every experiment are complete "
+        "so they can be filtered on"
+    )
+
+    def handle(self, **options):
+        updated = 0
+
+        with transaction.atomic():
+            for experiment in Experiment.objects.prefetch_related("variants"):
+                readiness = experiment.compute_readiness()
+
+                if experiment.readiness != readiness:
+                    Experiment.objects.filter(pk=experiment.pk).update(
+                        readiness=readiness
+                    )
+                    updated += 1
+
+        self.stdout.write(
+            "Updated readiness of {} experiments".format(updated)
+        )
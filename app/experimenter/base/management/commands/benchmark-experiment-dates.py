@@ -0,0 +1,105 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from experimenter.base.management.rollback import rolled_back
+from experimenter.experiments.models import Experiment, ExperimentChangeLog
+from experimenter.experiments.tests.factories import ExperimentFactory
+
+
+DATE_PROPERTIES = (
+    "start_date",
+    "end_date",
+    "enrollment_end_date",
+    "dates",
+    "enrollment_dates",
+    "observation_dates",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Times reading the date properties of experiments with long "
+        "changelogs, scanning the changelog for every date against reusing "
+        "the per experiment transition index."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--experiments",
+            default=20,
+            type=int,
+            help="number of experiments to read",
+        )
+        parser.add_argument(
+            "--changes",
+            default=300,
+            type=int,
+            help="number of changelog rows per experiment",
+        )
+        parser.add_argument(
+            "--rounds",
+            default=10,
+            type=int,
+            help="number of times every date property is read",
+        )
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            experiment_ids = self.create_experiments(options)
+            self.run_benchmark(experiment_ids, options)
+
+    def create_experiments(self, options):
+        experiment_ids = []
+
+        for i in range(options["experiments"]):
+            experiment = ExperimentFactory.create_with_status(
+                Experiment.STATUS_COMPLETE
+            )
+            latest_change = experiment.changes.latest()
+
+            ExperimentChangeLog.objects.bulk_create(
+                ExperimentChangeLog(
+                    experiment=experiment,
+                    changed_by=latest_change.changed_by,
+                    changed_on=latest_change.changed_on,
+                    old_status=Experiment.STATUS_COMPLETE,
+                    new_status=Experiment.STATUS_COMPLETE,
+                )
+                for j in range(options["changes"])
+            )
+            experiment_ids.append(experiment.id)
+
+        return experiment_ids
+
+    def run_benchmark(self, experiment_ids, options):
+        experiments = list(
+            Experiment.objects.filter(id__in=experiment_ids).prefetch_related(
+                "changes"
+            )
+        )
+
+        self.stdout.write(
+            "{} experiments with {} changes, {} rounds".format(
+                len(experiments), options["changes"], options["rounds"]
+            )
+        )
+
+        scanning = self.time_reads(experiments, options["rounds"], True)
+        indexed = self.time_reads(experiments, options["rounds"], False)
+
+        self.stdout.write("{:>12} {:>10.3f}s".format("scanning", scanning))
+        self.stdout.write("{:>12} {:>10.3f}s".format("indexed", indexed))
+
+    @staticmethod
+    def time_reads(experiments, rounds, clear_index):
+        start = time.monotonic()
+
+        for i in range(rounds):
+            for experiment in experiments:
+                for date_property in DATE_PROPERTIES:
+                    if clear_index:
+                        experiment.__dict__.pop("_transition_dates", None)
+                    getattr(experiment, date_property)
+
+        return time.monotonic() - start
@@ -0,0 +1,150 @@
+import json
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from experimenter.experiments import normandy
+
+
+class StubNormandyHandler(BaseHTTPRequestHandler):
+    """
+    Serves enabled recipes from both the recipe detail endpoint and the
+    paginated recipe list endpoint.
+    """
+
+    latency = 0
+    num_recipes = 0
+    requests_served = 0
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        StubNormandyHandler.requests_served += 1
+
+        url = urlparse(self.path)
+        recipe_id = url.path.rstrip("/").split("/")[-1]
+
+        if recipe_id.isnumeric():
+            data = {"approved_revision": self.approved_revision()}
+        else:
+            data = self.recipe_page(parse_qs(url.query))
+
+        body = json.dumps(data).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def recipe_page(self, query):
+        page = int(query["page"][0])
+        page_size = int(query["page_size"][0])
+        first_id = (page - 1) * page_size + 1
+        last_id = min(page * page_size, self.num_recipes)
+        num_pages = math.ceil(self.num_recipes / page_size)
+
+        return {
+            "count": self.num_recipes,
+            "next": "?page={}".format(page + 1) if page < num_pages else None,
+            "previous": None,
+            "results": [
+                {"id": i, "approved_revision": self.approved_revision()}
+                for i in range(first_id, last_id + 1)
+            ],
+        }
+
+    @staticmethod
+    def approved_revision():
+        return {
+            "enabled": True,
+            "enabled_states": [{"creator": {"email": "dev@example.com"}}],
+        }
+
+    def log_message(self, *args):
+        pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares fetching Normandy recipes one at a time with fetching "
+        "them from the paginated recipe list, against a local stub "
+        "Normandy server"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--counts",
+            default="10,50,100,200",
+            help="comma separated numbers of experiments to sync",
+        )
+        parser.add_argument(
+            "--latency",
+            default=0.05,
+            type=float,
+            help="seconds the stub server waits before each response",
+        )
+        parser.add_argument(
+            "--page-size",
+            default=25,
+            type=int,
+            help="number of recipes per page of the recipe list",
+        )
+
+    def handle(self, *args, **options):
+        StubNormandyHandler.latency = options["latency"]
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StubNormandyHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        host = "http://127.0.0.1:{port}".format(port=server.server_address[1])
+
+        try:
+            with override_settings(
+                NORMANDY_API_RECIPE_URL=host + "/api/v3/recipe/{id}/",
+                NORMANDY_API_RECIPES_URL=host + "/api/v3/recipe/",
+                NORMANDY_API_PAGE_SIZE=options["page_size"],
+            ):
+                self.run_benchmark(options)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def run_benchmark(self, options):
+        counts = [int(count) for count in options["counts"].split(",")]
+
+        self.stdout.write(
+            "{:>12} {:>20} {:>20}".format(
+                "experiments", "per recipe (s/reqs)", "batched (s/reqs)"
+            )
+        )
+
+        for count in counts:
+            StubNormandyHandler.num_recipes = count
+            recipe_ids = range(1, count + 1)
+
+            single = self.time_fetch(
+                lambda: [normandy.get_recipe(i) for i in recipe_ids]
+            )
+            batched = self.time_fetch(
+                lambda: list(normandy.get_recipes(recipe_ids))
+            )
+
+            self.stdout.write(
+                "{:>12} {:>14.3f}/{:<5} {:>14.3f}/{:<5}".format(
+                    count, *single, *batched
+                )
+            )
+
+    @staticmethod
+    def time_fetch(fetch):
+        StubNormandyHandler.requests_served = 0
+        start = time.monotonic()
+
+        fetch()
+
+        return time.monotonic() - start, StubNormandyHandler.requests_served
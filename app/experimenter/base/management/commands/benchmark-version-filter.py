@@ -0,0 +1,119 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Q
+
+from experimenter.base.management.rollback import rolled_back
+from experimenter.experiments.models import Experiment
+
+
+class Command(BaseCommand):
+    help = (
+        "Times filtering experiments by Firefox version, comparing the "
+        "version strings against the indexed integer versions, with and "
+        "without a channel."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--experiments",
+            default=100000,
+            type=int,
+            help="number of experiments to filter",
+        )
+        parser.add_argument(
+            "--rounds",
+            default=10,
+            type=int,
+            help="number of times each query is run",
+        )
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            self.create_experiments(options["experiments"])
+            self.run_benchmark(options)
+
+    def create_experiments(self, count):
+        versions = [version for version, label in Experiment.VERSION_CHOICES]
+        channels = [
+            channel for channel, label in Experiment.CHANNEL_CHOICES[1:]
+        ]
+
+        experiments = []
+        for i in range(count):
+            min_index = random.randrange(len(versions))
+            max_version = random.choice(
+                [None, random.choice(versions[min_index:])]
+            )
+            experiment = Experiment(
+                name="Version benchmark {}".format(i),
+                slug="version-benchmark-{}".format(i),
+                firefox_channel=random.choice(channels),
+                firefox_min_version=versions[min_index],
+                firefox_max_version=max_version,
+            )
+            experiment.compute_version_fields()
+            experiments.append(experiment)
+
+        Experiment.objects.bulk_create(experiments, batch_size=5000)
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE experiments_experiment")
+
+    def run_benchmark(self, options):
+        versions = [version for version, label in Experiment.VERSION_CHOICES]
+
+        self.stdout.write(
+            "{} experiments, {} rounds".format(
+                options["experiments"], options["rounds"]
+            )
+        )
+        self.stdout.write(
+            "{:>10} {:>10} {:>10} {:>10}".format(
+                "version", "channel", "string", "integer"
+            )
+        )
+
+        for version in (versions[0], versions[len(versions) // 2]):
+            for channel in (None, Experiment.CHANNEL_NIGHTLY):
+                queryset = Experiment.objects.all()
+                if channel:
+                    queryset = queryset.filter(firefox_channel=channel)
+
+                string = self.time_count(
+                    queryset.filter(
+                        Q(
+                            firefox_min_version__lte=version,
+                            firefox_max_version__gte=version,
+                        )
+                        | Q(firefox_min_version=version)
+                    ),
+                    options["rounds"],
+                )
+
+                version_int = Experiment.version_to_int(version)
+                integer = self.time_count(
+                    queryset.filter(
+                        Q(firefox_max_version_int__gte=version_int)
+                        | Q(firefox_min_version_int=version_int),
+                        firefox_min_version_int__lte=version_int,
+                    ),
+                    options["rounds"],
+                )
+
+                self.stdout.write(
+                    "{:>10} {:>10} {:>9.3f}s {:>9.3f}s".format(
+                        version, channel or "all", string, integer
+                    )
+                )
+
+    @staticmethod
+    def time_count(queryset, rounds):
+        start = time.monotonic()
+
+        for i in range(rounds):
+            queryset.count()
+
+        return time.monotonic() - start
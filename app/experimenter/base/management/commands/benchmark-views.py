@@ -0,0 +1,332 @@
+import json
+import os
+import random
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.urls import reverse
+from faker import Generator
+
+from experimenter.base.management.rollback import rolled_back
+from experimenter.experiments.views import ExperimentOrderingForm
+from experimenter.experiments.models import Experiment
+from experimenter.experiments.tests.factories import ExperimentFactory
+
+
+BASELINE_PATH = os.path.join(
+    settings.BASE_DIR, "base", "benchmarks", "views.json"
+)
+
+BENCHMARK_EMAIL = "benchmark@example.com"
+
+# Timings below this many seconds are treated as noise when comparing
+# against the baseline
+TIME_TOLERANCE = 0.005
+
+LIST_FILTERS = (
+    ("list", {}),
+    ("list search", {"search": "experiment"}),
+    ("list type", {"type": Experiment.TYPE_PREF}),
+    ("list status", {"status": Experiment.STATUS_DRAFT}),
+    ("list channel", {"firefox_channel": Experiment.CHANNEL_NIGHTLY}),
+    ("list version", {"firefox_version": Experiment.VERSION_CHOICES[1][0]}),
+    ("list archived", {"archived": "on"}),
+    ("list in qa", {"in_qa": "on"}),
+    ("list surveys", {"surveys": "on"}),
+    ("list subscribed", {"subscribed": "on"}),
+    (
+        "list date range",
+        {
+            "experiment_date_field": Experiment.EXPERIMENT_STARTS,
+            "date_range_after": "2000-01-01",
+            "date_range_before": "2100-01-01",
+        },
+    ),
+)
+
+
+class QueryTimer(object):
+    """
+    A database execute wrapper counting queries and the time spent in them.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.duration = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.monotonic()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.duration += time.monotonic() - start
+
+
+class Command(BaseCommand):
+    help = (
+        "Records query counts, database time and wall time for the "
+        "experiment list page with each filter and ordering, the detail "
+        "page for each status and each read only API endpoint, at several "
+        "numbers of experiments, and checks them against a stored "
+        "baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scales",
+            default="10,100",
+            help="comma separated numbers of experiments to seed",
+        )
+        parser.add_argument(
+            "--rounds",
+            default=5,
+            type=int,
+            help="number of times each page is requested, the best round "
+            "is recorded",
+        )
+        parser.add_argument(
+            "--baseline",
+            default=BASELINE_PATH,
+            help="path of the baseline json file",
+        )
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            help="write the results to the baseline file",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="fail if any page regressed against the baseline",
+        )
+        parser.add_argument(
+            "--threshold",
+            default=0.5,
+            type=float,
+            help="fraction by which a timing may exceed the baseline",
+        )
+
+    def handle(self, *args, **options):
+        scales = [int(scale) for scale in options["scales"].split(",")]
+
+        self.stdout.write(
+            "{:>8} {:<40} {:>8} {:>10} {:>10}".format(
+                "scale", "page", "queries", "db", "wall"
+            )
+        )
+
+        # Users and recipes cached while benchmarking are rolled back with
+        # everything else, so keep them out of the shared cache
+        with override_settings(
+            ALLOWED_HOSTS=settings.ALLOWED_HOSTS + ["testserver"],
+            CACHES={
+                "default": {
+                    "BACKEND": (
+                        "django.core.cache.backends.locmem.LocMemCache"
+                    ),
+                    "LOCATION": "benchmark-views",
+                }
+            },
+        ):
+            results = {
+                str(scale): self.run_scale(scale, options["rounds"])
+                for scale in scales
+            }
+
+        if options["check"]:
+            self.check_baseline(results, options)
+
+        if options["save_baseline"]:
+            os.makedirs(os.path.dirname(options["baseline"]), exist_ok=True)
+            with open(options["baseline"], "w") as baseline_file:
+                json.dump(results, baseline_file, indent=2, sort_keys=True)
+                baseline_file.write("\n")
+
+    def run_scale(self, scale, rounds):
+        cache.clear()
+        client = Client(**{settings.OPENIDC_EMAIL_HEADER: BENCHMARK_EMAIL})
+
+        results = {}
+
+        with rolled_back():
+            experiments = self.create_experiments(scale)
+
+            # Sign the benchmark user in before anything is measured
+            client.get(reverse("home"))
+
+            for name, url in self.get_urls(experiments):
+                results[name] = self.measure(client, url, rounds)
+                self.stdout.write(
+                    "{:>8} {:<40} {:>8} {:>9.3f}s {:>9.3f}s".format(
+                        scale,
+                        name,
+                        results[name]["queries"],
+                        results[name]["db_time"],
+                        results[name]["wall_time"],
+                    )
+                )
+
+        return results
+
+    def create_experiments(self, scale):
+        # Seed the factories so every run matches the same experiments and
+        # query counts can be compared with the baseline
+        random.seed(scale)
+        Generator.seed(scale)
+
+        statuses = [status for status, label in Experiment.STATUS_CHOICES]
+
+        experiments = {}
+        for i in range(scale):
+            status = statuses[i % len(statuses)]
+            experiments[status] = ExperimentFactory.create_with_status(status)
+
+        return experiments
+
+    def get_urls(self, experiments):
+        list_url = reverse("home")
+
+        for name, params in LIST_FILTERS:
+            yield name, self.with_params(list_url, params)
+
+        for ordering, label in ExperimentOrderingForm.ORDERING_CHOICES:
+            yield (
+                "list ordering {}".format(ordering),
+                self.with_params(list_url, {"ordering": ordering}),
+            )
+
+        for status, experiment in sorted(experiments.items()):
+            yield (
+                "detail {}".format(status.lower()),
+                reverse(
+                    "experiments-detail", kwargs={"slug": experiment.slug}
+                ),
+            )
+
+        yield "api list", reverse("experiments-api-list")
+
+        for export_format in ("ndjson", "csv"):
+            yield (
+                "api export {}".format(export_format),
+                reverse(
+                    "experiments-api-export",
+                    kwargs={"export_format": export_format},
+                ),
+            )
+
+        for status, experiment in sorted(experiments.items()):
+            yield (
+                "api detail {}".format(status.lower()),
+                reverse(
+                    "experiments-api-detail", kwargs={"slug": experiment.slug}
+                ),
+            )
+
+        if Experiment.STATUS_SHIP in experiments:
+            yield (
+                "api recipe",
+                reverse(
+                    "experiments-api-recipe",
+                    kwargs={"slug": experiments[Experiment.STATUS_SHIP].slug},
+                ),
+            )
+
+    @staticmethod
+    def with_params(url, params):
+        if not params:
+            return url
+
+        return "{url}?{params}".format(url=url, params=urlencode(params))
+
+    def measure(self, client, url, rounds):
+        measurements = []
+        for i in range(rounds):
+            query_timer = QueryTimer()
+            start = time.monotonic()
+
+            with connection.execute_wrapper(query_timer):
+                response = client.get(url)
+
+                # Exports are streamed, so their queries only run as the
+                # content is read
+                if response.streaming:
+                    b"".join(response.streaming_content)
+
+            wall_time = time.monotonic() - start
+
+            if response.status_code != 200:
+                raise CommandError(
+                    "{url} returned {status}".format(
+                        url=url, status=response.status_code
+                    )
+                )
+
+            measurements.append(
+                (query_timer.queries, query_timer.duration, wall_time)
+            )
+
+        queries, db_times, wall_times = zip(*measurements)
+
+        return {
+            "queries": min(queries),
+            "db_time": round(min(db_times), 4),
+            "wall_time": round(min(wall_times), 4),
+        }
+
+    def check_baseline(self, results, options):
+        if not os.path.exists(options["baseline"]):
+            raise CommandError(
+                "No baseline at {path}".format(path=options["baseline"])
+            )
+
+        with open(options["baseline"]) as baseline_file:
+            baseline = json.load(baseline_file)
+
+        regressions = []
+        for scale, pages in sorted(results.items()):
+            for name, result in sorted(pages.items()):
+                expected = baseline.get(scale, {}).get(name)
+
+                if expected is None:
+                    continue
+
+                if result["queries"] > expected["queries"]:
+                    regressions.append(
+                        (scale, name, "queries", expected, result)
+                    )
+
+                for timing in ("db_time", "wall_time"):
+                    limit = max(
+                        expected[timing] * (1 + options["threshold"]),
+                        expected[timing] + TIME_TOLERANCE,
+                    )
+                    if result[timing] > limit:
+                        regressions.append(
+                            (scale, name, timing, expected, result)
+                        )
+
+        for scale, name, measure, expected, result in regressions:
+            self.stdout.write(
+                "Regression at {scale} experiments: {name} {measure} "
+                "{result} (baseline {expected})".format(
+                    scale=scale,
+                    name=name,
+                    measure=measure,
+                    result=result[measure],
+                    expected=expected[measure],
+                )
+            )
+
+        if regressions:
+            raise CommandError(
+                "{count} regressions against {path}".format(
+                    count=len(regressions), path=options["baseline"]
+                )
+            )
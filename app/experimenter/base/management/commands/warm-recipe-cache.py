@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from experimenter.experiments.models import Experiment
+
+
+class Command(BaseCommand):
+    help = "Render and cache the Normandy recipes of shipping experiments"
+
+    def handle(self, **options):
+        experiments = Experiment.objects.filter(
+            status__in=(Experiment.STATUS_SHIP, Experiment.STATUS_ACCEPTED)
+        ).prefetch_related("variants", "locales", "countries")
+
+        for experiment in experiments:
+            experiment.normandy_recipe
+
+        self.stdout.write(
+            "Cached recipes of {} experiments".format(len(experiments))
+        )
@@ -0,0 +1,21 @@
+from contextlib import contextmanager
+
+from django.db import transaction
+
+
+class Rollback(Exception):
+    pass
+
+
+@contextmanager
+def rolled_back():
+    """
+    Run the block in a transaction that is always rolled back, so the data
+    a benchmark creates is never left in the database.
+    """
+    try:
+        with transaction.atomic():
+            yield
+            raise Rollback()
+    except Rollback:
+        pass
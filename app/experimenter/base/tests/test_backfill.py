@@ -0,0 +1,62 @@
+import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from experimenter.experiments.models import Experiment
+from experimenter.experiments.tests.factories import ExperimentFactory
+
+
+class TestBackfillExperimentDates(TestCase):
+
+    def test_backfill_stores_missing_dates(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_LIVE,
+            proposed_start_date=datetime.date(2019, 1, 1),
+            proposed_duration=20,
+            proposed_enrollment=10,
+        )
+        ExperimentFactory.create_with_status(Experiment.STATUS_DRAFT)
+        Experiment.objects.filter(id=experiment.id).update(
+            computed_start_date=None,
+            computed_end_date=None,
+            computed_enrollment_end_date=None,
+        )
+
+        out = StringIO()
+        call_command("backfill-experiment-dates", stdout=out)
+
+        self.assertEqual(
+            out.getvalue().strip(), "Updated dates of 1 experiments"
+        )
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(experiment.computed_start_date, experiment.start_date)
+        self.assertEqual(experiment.computed_end_date, experiment.end_date)
+        self.assertEqual(
+            experiment.computed_enrollment_end_date,
+            experiment.enrollment_end_date,
+        )
+        self.assertIsNotNone(experiment.computed_enrollment_end_date)
+
+
+class TestBackfillExperimentReadiness(TestCase):
+
+    def test_backfill_stores_missing_readiness(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW
+        )
+        ExperimentFactory.create_with_status(Experiment.STATUS_DRAFT)
+        Experiment.objects.filter(id=experiment.id).update(readiness=None)
+
+        out = StringIO()
+        call_command("backfill-experiment-readiness", stdout=out)
+
+        self.assertEqual(
+            out.getvalue().strip(), "Updated readiness of 1 experiments"
+        )
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(experiment.readiness, experiment.compute_readiness())
+        self.assertTrue(experiment.readiness & Experiment.READINESS_VARIANTS)
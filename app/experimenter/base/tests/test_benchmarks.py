@@ -0,0 +1,179 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+import mock
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from experimenter.experiments.models import Experiment
+
+
+class TestBenchmarkNormandySync(TestCase):
+
+    def test_benchmark_reports_requests_for_each_experiment_count(self):
+        out = StringIO()
+
+        call_command(
+            "benchmark-normandy-sync",
+            counts="1,5",
+            latency=0,
+            page_size=2,
+            stdout=out,
+        )
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertIn("experiments", lines[0])
+
+        count, single, batched = lines[2].split()
+        self.assertEqual(count, "5")
+        self.assertEqual(single.split("/")[1], "5")
+        self.assertEqual(batched.split("/")[1], "3")
+
+
+class TestBenchmarkExperimentDates(TestCase):
+
+    def test_benchmark_reports_both_timings_and_leaves_no_data(self):
+        out = StringIO()
+
+        call_command(
+            "benchmark-experiment-dates",
+            experiments=2,
+            changes=10,
+            rounds=1,
+            stdout=out,
+        )
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0], "2 experiments with 10 changes, 1 rounds")
+        self.assertEqual(
+            [line.split()[0] for line in lines[1:]], ["scanning", "indexed"]
+        )
+        self.assertFalse(Experiment.objects.exists())
+
+
+class TestBenchmarkVersionFilter(TestCase):
+
+    def test_benchmark_reports_timings_and_leaves_no_data(self):
+        out = StringIO()
+
+        call_command(
+            "benchmark-version-filter", experiments=20, rounds=1, stdout=out
+        )
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0], "20 experiments, 1 rounds")
+        self.assertEqual(
+            [line.split()[:2] for line in lines[2:]],
+            [
+                ["55.0", "all"],
+                ["55.0", "Nightly"],
+                ["68.0", "all"],
+                ["68.0", "Nightly"],
+            ],
+        )
+        self.assertFalse(Experiment.objects.exists())
+
+
+class TestBenchmarkViews(TestCase):
+
+    def setUp(self):
+        baseline_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(baseline_dir.cleanup)
+        self.baseline = os.path.join(baseline_dir.name, "views.json")
+
+    def benchmark(self, **options):
+        out = StringIO()
+        call_command(
+            "benchmark-views",
+            scales="7",
+            rounds=1,
+            baseline=self.baseline,
+            stdout=out,
+            **options
+        )
+        return out.getvalue().splitlines()
+
+    def test_benchmark_reports_every_page_and_leaves_no_data(self):
+        lines = self.benchmark()
+
+        self.assertEqual(
+            lines[0].split(), ["scale", "page", "queries", "db", "wall"]
+        )
+        pages = [line[9:49].strip() for line in lines[1:]]
+        self.assertIn("list", pages)
+        self.assertIn("list ordering -latest_change", pages)
+        self.assertIn("detail draft", pages)
+        self.assertIn("detail rejected", pages)
+        self.assertIn("api export csv", pages)
+        self.assertIn("api recipe", pages)
+        self.assertFalse(Experiment.objects.exists())
+        self.assertFalse(os.path.exists(self.baseline))
+
+    def test_benchmark_saves_baseline_and_passes_check_against_it(self):
+        self.benchmark(save_baseline=True)
+
+        with open(self.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+
+        self.assertEqual(list(baseline), ["7"])
+        self.assertGreater(baseline["7"]["api list"]["queries"], 0)
+        self.assertGreater(baseline["7"]["api export ndjson"]["queries"], 0)
+
+        # Only query counts are stable enough to check in a test
+        for page in baseline["7"].values():
+            page["db_time"] = page["wall_time"] = 1000
+
+        with open(self.baseline, "w") as baseline_file:
+            json.dump(baseline, baseline_file)
+
+        self.benchmark(check=True)
+
+    def test_benchmark_fails_check_on_regression(self):
+        with open(self.baseline, "w") as baseline_file:
+            json.dump(
+                {
+                    "7": {
+                        "api list": {
+                            "queries": 0,
+                            "db_time": 1000,
+                            "wall_time": 0,
+                        }
+                    }
+                },
+                baseline_file,
+            )
+
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command(
+                "benchmark-views",
+                scales="7",
+                rounds=1,
+                baseline=self.baseline,
+                check=True,
+                stdout=out,
+            )
+
+        regressions = [
+            line
+            for line in out.getvalue().splitlines()
+            if line.startswith("Regression")
+        ]
+        self.assertEqual(len(regressions), 2)
+        self.assertIn("api list queries", regressions[0])
+        self.assertIn("api list wall_time", regressions[1])
+
+    def test_benchmark_fails_check_without_baseline(self):
+        with self.assertRaises(CommandError):
+            self.benchmark(check=True)
+
+    def test_benchmark_fails_on_error_response(self):
+        response = mock.Mock(status_code=500, streaming=False)
+
+        with mock.patch("django.test.Client.get", return_value=response):
+            with self.assertRaises(CommandError):
+                self.benchmark()
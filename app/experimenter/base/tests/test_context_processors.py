@@ -0,0 +1,72 @@
+import mock
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from experimenter.base.context_processors import unread_notifications
+from experimenter.notifications.tests.factories import NotificationFactory
+from experimenter.openidc.tests.factories import UserFactory
+
+
+class TestUnreadNotifications(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory.create()
+
+    def get_unread_notifications(self, user):
+        request = RequestFactory().get("/")
+        request.user = user
+        return unread_notifications(request)["unread_notifications"]
+
+    def test_not_evaluated_until_used(self):
+        NotificationFactory.create(user=self.user)
+
+        with self.assertNumQueries(0):
+            self.get_unread_notifications(self.user)
+
+        self.assertTrue(self.user.notifications.has_unread)
+
+    def test_anonymous_user_has_no_notifications(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                list(self.get_unread_notifications(AnonymousUser())), []
+            )
+
+    def test_returns_unread_notifications_in_one_query(self):
+        notifications = [
+            NotificationFactory.create(user=self.user) for i in range(3)
+        ]
+        NotificationFactory.create(user=self.user, read=True)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                list(self.get_unread_notifications(self.user)), notifications
+            )
+
+        self.assertFalse(self.user.notifications.has_unread)
+
+    def test_no_queries_once_known_to_have_no_unread(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                list(self.get_unread_notifications(self.user)), []
+            )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                list(self.get_unread_notifications(self.user)), []
+            )
+
+    def test_new_notification_is_shown_after_flag_cleared(self):
+        list(self.get_unread_notifications(self.user))
+
+        # The flag is set on commit, which a TestCase never does
+        with mock.patch(
+            "django.db.transaction.on_commit", side_effect=lambda func: func()
+        ):
+            notification = NotificationFactory.create(user=self.user)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                list(self.get_unread_notifications(self.user)), [notification]
+            )
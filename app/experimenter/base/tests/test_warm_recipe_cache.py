@@ -0,0 +1,57 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from experimenter.experiments.models import Experiment
+from experimenter.experiments.tests.factories import (
+    CountryFactory,
+    ExperimentFactory,
+    LocaleFactory,
+)
+
+
+class TestWarmRecipeCache(TestCase):
+
+    def test_warm_recipe_cache_caches_shipping_experiment_recipes(self):
+        cache.clear()
+        ship_experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_SHIP
+        )
+        accepted_experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_ACCEPTED
+        )
+        draft_experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT
+        )
+
+        out = StringIO()
+        call_command("warm-recipe-cache", stdout=out)
+
+        self.assertEqual(
+            out.getvalue().strip(), "Cached recipes of 2 experiments"
+        )
+
+        for experiment, cached in (
+            (ship_experiment, True),
+            (accepted_experiment, True),
+            (draft_experiment, False),
+        ):
+            cache_key = Experiment.RECIPE_CACHE_KEY.format(
+                id=experiment.id, version=experiment.recipe_version
+            )
+            self.assertEqual(cache.get(cache_key) is not None, cached)
+
+    def test_warm_recipe_cache_queries_do_not_grow_with_experiments(self):
+        cache.clear()
+        for i in range(3):
+            experiment = ExperimentFactory.create_with_status(
+                Experiment.STATUS_SHIP
+            )
+            experiment.locales.add(LocaleFactory.create())
+            experiment.countries.add(CountryFactory.create())
+
+        # The experiments, then their variants, locales and countries
+        with self.assertNumQueries(4):
+            call_command("warm-recipe-cache", stdout=StringIO())
@@ -135,6 +135,11 @@ class ExperimentAdmin(admin.ModelAdmin):
     def get_actions(self, request):
         return []
 
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        # The variant inlines are saved after the experiment
+        Experiment.objects.update_readiness(form.instance.id)
+
     def has_delete_permission(self, request, obj=None):
         return False
 
@@ -2,8 +2,12 @@ from django.conf.urls import url
 
 from experimenter.experiments.api_views import (
     ExperimentAcceptView,
+    ExperimentBatchCloneView,
+    ExperimentBulkTransitionView,
     ExperimentDetailView,
+    ExperimentExportView,
     ExperimentListView,
+    ExperimentReadinessView,
     ExperimentRecipeView,
     ExperimentRejectView,
     ExperimentSendIntentToShipEmailView,
@@ -12,6 +16,26 @@ from experimenter.experiments.api_views import (
 
 
 urlpatterns = [
+    url(
+        r"^export\.(?P<export_format>ndjson|csv)$",
+        ExperimentExportView.as_view(),
+        name="experiments-api-export",
+    ),
+    url(
+        r"^clone/$",
+        ExperimentBatchCloneView.as_view(),
+        name="experiments-api-batch-clone",
+    ),
+    url(
+        r"^transition/$",
+        ExperimentBulkTransitionView.as_view(),
+        name="experiments-api-bulk-transition",
+    ),
+    url(
+        r"^readiness/$",
+        ExperimentReadinessView.as_view(),
+        name="experiments-api-readiness",
+    ),
     url(
         r"^(?P<slug>[\w-]+)/accept/$",
         ExperimentAcceptView.as_view(),
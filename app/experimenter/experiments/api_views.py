@@ -1,20 +1,167 @@
-from rest_framework.generics import ListAPIView, UpdateAPIView, RetrieveAPIView
+import csv
+import json
+
+import django_filters.rest_framework as filters
+from django.db import transaction
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
+from django.utils.http import parse_etags
+from rest_framework.generics import (
+    CreateAPIView,
+    GenericAPIView,
+    ListAPIView,
+    UpdateAPIView,
+    RetrieveAPIView,
+)
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework import status
 
-from experimenter.experiments.models import Experiment, ExperimentChangeLog
-from experimenter.experiments import email
+from experimenter.experiments.models import (
+    Experiment,
+    ExperimentChangeLog,
+    ExperimentVariant,
+)
+from experimenter.experiments import tasks
 from experimenter.experiments.serializers import (
     ExperimentSerializer,
     ExperimentRecipeSerializer,
     ExperimentCloneSerializer,
+    ExperimentBatchCloneSerializer,
+    ExperimentBulkTransitionSerializer,
+    get_requested_fields,
 )
 
 
+class ExperimentCursorPagination(CursorPagination):
+    """
+    Experiments are only paginated when a ?page_size= is requested, so
+    clients expecting the full list keep receiving it.
+    """
+
+    ordering = "id"
+    page_size = None
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class ExperimentApiFilterset(filters.FilterSet):
+    readiness = filters.ChoiceFilter(
+        choices=Experiment.READINESS_CHOICES, method="readiness_filter"
+    )
+
+    class Meta:
+        model = Experiment
+        fields = ("project__slug", "status", "readiness")
+
+    def readiness_filter(self, queryset, name, value):
+        return queryset.filter(Experiment.readiness_filter(value))
+
+
 class ExperimentListView(ListAPIView):
-    filter_fields = ("project__slug", "status")
-    queryset = Experiment.objects.all()
+    filterset_class = ExperimentApiFilterset
+    pagination_class = ExperimentCursorPagination
     serializer_class = ExperimentSerializer
+    prefetches = (
+        Prefetch("variants", ExperimentVariant.objects.order_by("id")),
+        Prefetch("locales"),
+        Prefetch("countries"),
+    )
+
+    def get_queryset(self):
+        requested_fields = get_requested_fields(self.request)
+        prefetches = [
+            prefetch
+            for prefetch in self.prefetches
+            if not requested_fields
+            or prefetch.prefetch_through in requested_fields
+        ]
+        return (
+            Experiment.objects.defer("search_vector")
+            .prefetch_related(*prefetches)
+            .order_by("id")
+        )
+
+
+class ExperimentReadinessView(ExperimentListView):
+    """
+    The number of experiments matching the list filters with each
+    readiness.
+    """
+
+    pagination_class = None
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(Experiment.objects.all())
+        return Response(Experiment.readiness_counts(queryset))
+
+
+class Echo(object):
+    """
+    A file-like object whose write returns the written value, so a csv
+    writer can produce one row at a time.
+    """
+
+    def write(self, value):
+        return value
+
+
+class ExperimentExportView(ExperimentListView):
+    """
+    Streams every experiment matching the list filters as newline
+    delimited JSON or CSV.
+
+    Experiments are read in chunks ordered by id, so memory use stays
+    constant however many there are and the first rows are sent while
+    the rest are still being read.
+    """
+
+    pagination_class = None
+    chunk_size = 100
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset()).order_by("id")
+        rows = self.serialize_chunks(queryset)
+
+        if kwargs["export_format"] == "csv":
+            content = self.csv_lines(rows)
+            content_type = "text/csv"
+        else:
+            content = (json.dumps(row) + "\n" for row in rows)
+            content_type = "application/x-ndjson"
+
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response[
+            "Content-Disposition"
+        ] = 'attachment; filename="experiments.{}"'.format(
+            kwargs["export_format"]
+        )
+        return response
+
+    def serialize_chunks(self, queryset):
+        last_id = 0
+        while True:
+            chunk = list(queryset.filter(id__gt=last_id)[: self.chunk_size])
+            if not chunk:
+                return
+
+            yield from self.get_serializer(chunk, many=True).data
+            last_id = chunk[-1].id
+
+    def csv_lines(self, rows):
+        writer = csv.writer(Echo())
+        fields = list(self.get_serializer().fields)
+        yield writer.writerow(fields)
+
+        for row in rows:
+            yield writer.writerow(
+                [
+                    json.dumps(row[field])
+                    if isinstance(row[field], (list, dict))
+                    else row[field]
+                    for field in fields
+                ]
+            )
 
 
 class ExperimentDetailView(RetrieveAPIView):
@@ -28,6 +175,21 @@ class ExperimentRecipeView(RetrieveAPIView):
     queryset = Experiment.objects.all()
     serializer_class = ExperimentRecipeSerializer
 
+    def retrieve(self, request, *args, **kwargs):
+        experiment = self.get_object()
+        etag = '"{id}-{version}"'.format(
+            id=experiment.id, version=experiment.recipe_version
+        )
+        headers = {"ETag": etag}
+
+        if_none_match = request.META.get("HTTP_IF_NONE_MATCH", "")
+        if etag in parse_etags(if_none_match) or if_none_match == "*":
+            return Response(
+                status=status.HTTP_304_NOT_MODIFIED, headers=headers
+            )
+
+        return Response(experiment.normandy_recipe, headers=headers)
+
 
 class ExperimentAcceptView(UpdateAPIView):
     lookup_field = "slug"
@@ -87,10 +249,11 @@ class ExperimentSendIntentToShipEmailView(UpdateAPIView):
                 status=status.HTTP_409_CONFLICT,
             )
 
-        email.send_intent_to_ship_email(experiment.id)
-
-        experiment.review_intent_to_ship = True
-        experiment.save()
+        # Intent to ship is ticked off once the email has been sent
+        tasks.queue_experiment_emails(
+            [(experiment.id, Experiment.INTENT_TO_SHIP_EMAIL_LABEL)],
+            user_id=request.user.id,
+        )
 
         return Response()
 
@@ -99,3 +262,74 @@ class ExperimentCloneView(UpdateAPIView):
     lookup_field = "slug"
     queryset = Experiment.objects.all()
     serializer_class = ExperimentCloneSerializer
+
+
+class ExperimentBatchCloneView(CreateAPIView):
+    """
+    Clones a list of {"experiment": <slug>, "name": <name>} in one
+    transaction. Listing the same experiment several times makes as many
+    copies of it.
+    """
+
+    serializer_class = ExperimentBatchCloneSerializer
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs["many"] = True
+        return super().get_serializer(*args, **kwargs)
+
+
+class ExperimentBulkTransitionView(GenericAPIView):
+    """
+    Accepts or rejects every experiment in a list of slugs at once. Each
+    slug is checked against STATUS_TRANSITIONS on its own, and the ones
+    that can move are moved together in one transaction.
+    """
+
+    serializer_class = ExperimentBulkTransitionSerializer
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        slugs = list(dict.fromkeys(serializer.validated_data["slugs"]))
+        new_status = serializer.validated_data["status"]
+
+        results = []
+        transitioning = []
+
+        with transaction.atomic():
+            experiments = {
+                experiment.slug: experiment
+                for experiment in Experiment.objects.select_for_update()
+                .filter(slug__in=slugs)
+                .only("id", "slug", "status")
+            }
+
+            for slug in slugs:
+                experiment = experiments.get(slug)
+
+                if experiment is None:
+                    results.append({"slug": slug, "error": "not-found"})
+                elif (
+                    new_status
+                    not in Experiment.STATUS_TRANSITIONS[experiment.status]
+                ):
+                    results.append(
+                        {
+                            "slug": slug,
+                            "status": experiment.status,
+                            "error": "invalid-transition",
+                        }
+                    )
+                else:
+                    results.append({"slug": slug, "status": new_status})
+                    transitioning.append(experiment)
+
+            Experiment.objects.transition(
+                transitioning,
+                new_status,
+                request.user,
+                message=serializer.validated_data.get("message"),
+            )
+
+        return Response(results)
@@ -1,17 +1,46 @@
+import hashlib
+import json
 import logging
 import requests
 from urllib.parse import urlparse, parse_qs
 
 from django.conf import settings
 
+from experimenter.experiments.http_client import (
+    APISession,
+    FixedWindowRateLimiter,
+    RateLimitExceeded,
+)
+from experimenter.experiments.models import Experiment
+
 INVALID_USER_ERROR_CODE = 51
 INVALID_PARAMETER_ERROR_CODE = 53
+TOO_MANY_REQUESTS = 429
+
+
+session = APISession("bugzilla")
+rate_limiter = FixedWindowRateLimiter(
+    "bugzilla",
+    settings.BUGZILLA_RATE_LIMIT,
+    settings.BUGZILLA_RATE_LIMIT_PERIOD,
+)
 
 
 class BugzillaError(Exception):
     pass
 
 
+class BugzillaRateLimited(Exception):
+    """
+    Not a BugzillaError, so callers treating those as a negative answer
+    don't mistake being throttled for one.
+    """
+
+    def __init__(self, retry_after):
+        super().__init__(retry_after)
+        self.retry_after = retry_after
+
+
 def format_bug_body(experiment):
     bug_body = ""
     countries = "".join(
@@ -70,19 +99,40 @@ def format_update_body(experiment):
     return {"summary": summary, "cf_user_story": format_bug_body(experiment)}
 
 
+def get_update_body_hash(experiment, body):
+    content = json.dumps([experiment.bugzilla_id, body], sort_keys=True)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
 def update_experiment_bug(experiment):
+    """
+    Send the experiment's details to its bug, unless they are the same as
+    the last ones sent to it. Returns whether the bug was updated.
+    """
     body = format_update_body(experiment)
+    body_hash = get_update_body_hash(experiment, body)
+
+    if body_hash == experiment.bugzilla_body_hash:
+        return False
+
     make_bugzilla_call(
         settings.BUGZILLA_UPDATE_URL.format(id=experiment.bugzilla_id),
-        requests.put,
+        session.put,
         data=body,
     )
 
+    experiment.bugzilla_body_hash = body_hash
+    Experiment.objects.filter(pk=experiment.pk).update(
+        bugzilla_body_hash=body_hash
+    )
+
+    return True
+
 
 def user_exists(user):
     try:
         response = make_bugzilla_call(
-            settings.BUGZILLA_USER_URL.format(email=user), requests.get
+            settings.BUGZILLA_USER_URL.format(email=user), session.get
         )
         users = response["users"]
         return len(users) == 1
@@ -102,7 +152,7 @@ def format_resolution_body(experiment):
 def bug_exists(bug_id):
     try:
         response = make_bugzilla_call(
-            settings.BUGZILLA_BUG_URL.format(bug_id=bug_id), requests.get
+            settings.BUGZILLA_BUG_URL.format(bug_id=bug_id), session.get
         )
         bugs = response["bugs"]
         return len(bugs) == 1
@@ -116,14 +166,21 @@ def update_bug_resolution(experiment):
         status_body = format_resolution_body(experiment)
         make_bugzilla_call(
             settings.BUGZILLA_UPDATE_URL.format(id=experiment.bugzilla_id),
-            requests.put,
+            session.put,
             status_body,
         )
 
 
 def make_bugzilla_call(url, method, data=None):
+    try:
+        rate_limiter.acquire()
+    except RateLimitExceeded as e:
+        raise BugzillaRateLimited(e.retry_after)
+
     try:
         response = method(url, data)
+        if response.status_code == TOO_MANY_REQUESTS:
+            raise BugzillaRateLimited(get_retry_after(response))
         return response.json()
     except requests.exceptions.RequestException as e:
         logging.exception("Error calling Bugzilla API: {}".format(e))
@@ -133,6 +190,13 @@ def make_bugzilla_call(url, method, data=None):
         raise BugzillaError(*e.args)
 
 
+def get_retry_after(response):
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return settings.BUGZILLA_RATE_LIMIT_PERIOD
+
+
 def format_creation_bug_body(experiment, extra_fields):
     bug_data = {
         "product": "Shield",
@@ -168,7 +232,7 @@ def create_experiment_bug(experiment):
 
     bug_data = format_creation_bug_body(experiment, extra_fields)
     response_data = make_bugzilla_call(
-        settings.BUGZILLA_CREATE_URL, requests.post, data=bug_data
+        settings.BUGZILLA_CREATE_URL, session.post, data=bug_data
     )
 
     if "id" not in response_data:
@@ -193,7 +257,7 @@ def add_experiment_comment(experiment, comment):
     comment_data = {"comment": comment}
     response_data = make_bugzilla_call(
         settings.BUGZILLA_COMMENT_URL.format(id=experiment.bugzilla_id),
-        requests.post,
+        session.post,
         comment_data,
     )
 
@@ -18,6 +18,35 @@ class ExperimentConstants(object):
     EXPERIMENT_PAUSES = "pausing"
     EXPERIMENT_ENDS = "ending"
 
+    # search stuff
+    SEARCH_VECTOR_WEIGHTS = (
+        ("A", ("name", "public_name", "slug", "normandy_slug")),
+        (
+            "B",
+            (
+                "short_description",
+                "public_description",
+                "bugzilla_id",
+                "addon_experiment_id",
+                "pref_key",
+            ),
+        ),
+        (
+            "C",
+            (
+                "objectives",
+                "analysis",
+                "related_work",
+                "analysis_owner",
+                "engineering_owner",
+            ),
+        ),
+    )
+    SEARCH_VECTOR_OWNER_WEIGHT = "B"
+
+    # recipe stuff
+    RECIPE_CACHE_KEY = "experiment-recipe:{id}:{version}"
+
     # extra email-type stuff
     INTENT_TO_SHIP_EMAIL_LABEL = "intent to ship"
 
@@ -121,6 +150,12 @@ class ExperimentConstants(object):
     CHANNEL_RELEASE_ORDER = 3
     CHANNEL_UNSET_ORDER = 0
 
+    CHANNEL_ORDERS = {
+        CHANNEL_NIGHTLY: CHANNEL_NIGHTLY_ORDER,
+        CHANNEL_BETA: CHANNEL_BETA_ORDER,
+        CHANNEL_RELEASE: CHANNEL_RELEASE_ORDER,
+    }
+
     # Platform stuff
     PLATFORM_ALL = "All Platforms"
     PLATFORM_WINDOWS = "All Windows"
@@ -179,6 +214,41 @@ class ExperimentConstants(object):
         (SECTION_TESTING, "Testing"),
     )
 
+    # Readiness flags stored in Experiment.readiness, set from the property
+    # of the same name. All sections and reviews are the highest bits so
+    # the readiness filters are ranges of the indexed column
+    READINESS_TIMELINE = 1 << 0
+    READINESS_POPULATION = 1 << 1
+    READINESS_ADDON = 1 << 2
+    READINESS_VARIANTS = 1 << 3
+    READINESS_OBJECTIVES = 1 << 4
+    READINESS_RISKS = 1 << 5
+    READINESS_TESTING = 1 << 6
+    READINESS_ALL_SECTIONS = 1 << 7
+    READINESS_REVIEWS = 1 << 8
+
+    READINESS_PROPERTIES = (
+        (READINESS_TIMELINE, "completed_timeline"),
+        (READINESS_POPULATION, "completed_population"),
+        (READINESS_ADDON, "completed_addon"),
+        (READINESS_VARIANTS, "completed_variants"),
+        (READINESS_OBJECTIVES, "completed_objectives"),
+        (READINESS_RISKS, "completed_risks"),
+        (READINESS_TESTING, "completed_testing"),
+        (READINESS_ALL_SECTIONS, "completed_all_sections"),
+        (READINESS_REVIEWS, "completed_required_reviews"),
+    )
+
+    READINESS_READY_TO_LAUNCH = "ready_to_launch"
+    READINESS_MISSING_REVIEWS = "missing_reviews"
+    READINESS_INCOMPLETE_SECTIONS = "incomplete_sections"
+
+    READINESS_CHOICES = (
+        (READINESS_READY_TO_LAUNCH, "Ready to Launch"),
+        (READINESS_MISSING_REVIEWS, "Missing Reviews"),
+        (READINESS_INCOMPLETE_SECTIONS, "Incomplete Sections"),
+    )
+
     # Labels
     RISK_INTERNAL_ONLY_LABEL = (
         "Is this experiment sensitive and/or internal only?"
@@ -1,13 +1,12 @@
 from django.conf import settings
+from django.core.mail import get_connection
 from django.core.mail.message import EmailMessage
 from django.template.loader import render_to_string
 
-from experimenter.experiments.models import Experiment
+from experimenter.experiments.models import Experiment, ExperimentEmail
 
 
-def send_intent_to_ship_email(experiment_id):
-    experiment = Experiment.objects.get(id=experiment_id)
-
+def intent_to_ship_email(experiment):
     bug_url = settings.BUGZILLA_DETAIL_URL.format(id=experiment.bugzilla_id)
 
     # Because that's how it's done in Experiment.population (property)
@@ -27,7 +26,7 @@ def send_intent_to_ship_email(experiment_id):
     content = content.strip() + "\n"
 
     channel = experiment.firefox_channel
-    email = EmailMessage(
+    return EmailMessage(
         Experiment.INTENT_TO_SHIP_EMAIL_SUBJECT.format(
             name=experiment.name,
             version=experiment.format_firefox_versions,
@@ -38,10 +37,9 @@ def send_intent_to_ship_email(experiment_id):
         [settings.EMAIL_RELEASE_DRIVERS],
         cc=[experiment.owner.email],
     )
-    email.send(fail_silently=False)
 
 
-def send_experiment_launch_email(experiment):
+def experiment_launch_email(experiment):
 
     content = render_to_string(
         "experiments/emails/launch_experiment_email.txt",
@@ -51,11 +49,11 @@ def send_experiment_launch_email(experiment):
     version = experiment.format_firefox_versions
     channel = experiment.firefox_channel
 
-    recipients = [experiment.owner.email] + list(
-        experiment.subscribers.values_list("email", flat=True)
-    )
+    recipients = [experiment.owner.email] + [
+        subscriber.email for subscriber in experiment.subscribers.all()
+    ]
 
-    email = EmailMessage(
+    return EmailMessage(
         Experiment.LAUNCH_EMAIL_SUBJECT.format(
             name=experiment.name, version=version, channel=channel
         ),
@@ -65,4 +63,81 @@ def send_experiment_launch_email(experiment):
         cc=recipients,
     )
 
-    email.send(fail_silently=False)
+
+EMAILS = {
+    Experiment.INTENT_TO_SHIP_EMAIL_LABEL: intent_to_ship_email,
+    Experiment.EXPERIMENT_STARTS: experiment_launch_email,
+}
+
+
+class ExperimentEmailsError(Exception):
+    """
+    Sending a batch of experiment emails stopped at a failure, leaving
+    unsent_emails, starting with the one that failed, still to send.
+    """
+
+    def __init__(self, unsent_emails):
+        super().__init__(
+            "Failed to send {} experiment emails".format(len(unsent_emails))
+        )
+        self.unsent_emails = unsent_emails
+
+
+def send_experiment_emails(emails):
+    """
+    Render and send a batch of (experiment id, email type) pairs over a
+    single connection, recording an ExperimentEmail for each one sent.
+
+    Experiments deleted since their emails were queued are skipped. The
+    intent to ship email is claimed by setting review_intent_to_ship in
+    the database before it is sent, and released again if sending fails,
+    so it is never sent more than once.
+    """
+    experiments = (
+        Experiment.objects.select_related("owner")
+        .prefetch_related("locales", "countries", "subscribers")
+        .in_bulk({experiment_id for experiment_id, email_type in emails})
+    )
+
+    sent = []
+    index = 0
+    try:
+        with get_connection(fail_silently=False) as connection:
+            for index, (experiment_id, email_type) in enumerate(emails):
+                experiment = experiments.get(experiment_id)
+                if experiment is None:
+                    continue
+
+                is_intent_to_ship = (
+                    email_type == Experiment.INTENT_TO_SHIP_EMAIL_LABEL
+                )
+                if is_intent_to_ship and not claim_intent_to_ship(experiment):
+                    continue
+
+                try:
+                    connection.send_messages([EMAILS[email_type](experiment)])
+                except Exception:
+                    if is_intent_to_ship:
+                        Experiment.objects.filter(pk=experiment.id).update(
+                            review_intent_to_ship=False
+                        )
+                    raise
+
+                sent.append(
+                    ExperimentEmail(experiment=experiment, type=email_type)
+                )
+
+                if is_intent_to_ship:
+                    Experiment.objects.update_readiness(experiment.id)
+    except Exception as e:
+        raise ExperimentEmailsError(emails[index:]) from e
+    finally:
+        ExperimentEmail.objects.bulk_create(sent)
+
+
+def claim_intent_to_ship(experiment):
+    return bool(
+        Experiment.objects.filter(pk=experiment.id)
+        .exclude(review_intent_to_ship=True)
+        .update(review_intent_to_ship=True)
+    )
@@ -473,6 +473,8 @@ class ExperimentVariantsBaseForm(ChangeLogMixin, forms.ModelForm):
 
     @transaction.atomic
     def save(self, *args, **kwargs):
+        # The variants are saved first so saving the experiment stores
+        # its readiness with them
         self.variants_formset.save()
         return super().save(*args, **kwargs)
 
@@ -1118,8 +1120,10 @@ class ExperimentStatusForm(
             experiment.normandy_slug = experiment.generate_normandy_slug()
             experiment.save()
 
-            tasks.update_experiment_bug_task.delay(
-                self.request.user.id, experiment.id
+            tasks.delay_coalesced(
+                tasks.update_experiment_bug_task,
+                self.request.user.id,
+                experiment.id,
             )
 
         return experiment
@@ -1151,8 +1155,10 @@ class ExperimentArchiveForm(
             return experiment
 
         experiment = super().save(*args, **kwargs)
-        tasks.update_bug_resolution_task.delay(
-            self.request.user.id, experiment.id
+        tasks.delay_coalesced(
+            tasks.update_bug_resolution_task,
+            self.request.user.id,
+            experiment.id,
         )
         return experiment
 
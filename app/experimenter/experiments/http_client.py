@@ -0,0 +1,112 @@
+import os
+import time
+
+import markus
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+
+class APISession(requests.Session):
+    """
+    A requests session shared by every call to one external API.
+
+    Connections are pooled and kept alive, every request gets a default
+    timeout, connection errors and 5xx responses to idempotent requests
+    are retried with exponential backoff, and the latency of every call
+    is reported to statsd as experiments.<name>.request.timing.
+
+    Pooled connections must not be shared across a fork, so each process
+    mounts its own connection pool the first time it makes a request.
+    """
+
+    def __init__(self, name, pool_maxsize=requests.adapters.DEFAULT_POOLSIZE):
+        super().__init__()
+        self.name = name
+        self.pool_maxsize = pool_maxsize
+        self.metrics = markus.get_metrics("experiments.{}".format(name))
+        self.pid = None
+
+    def mount_adapters(self):
+        retries = Retry(
+            total=settings.HTTP_CLIENT_RETRIES,
+            backoff_factor=settings.HTTP_CLIENT_RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUS_CODES,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_maxsize=self.pool_maxsize, max_retries=retries
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        self.pid = os.getpid()
+
+    def request(self, method, url, *args, **kwargs):
+        if self.pid != os.getpid():
+            self.mount_adapters()
+
+        kwargs.setdefault("timeout", settings.HTTP_CLIENT_TIMEOUT)
+        tags = ["method:{}".format(method.upper())]
+
+        start = time.monotonic()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except requests.exceptions.RequestException:
+            self.metrics.incr("request.error", tags=tags)
+            raise
+
+        tags.append("status:{}".format(response.status_code))
+        self.metrics.timing(
+            "request.timing", (time.monotonic() - start) * 1000, tags=tags
+        )
+        return response
+
+
+class RateLimitExceeded(Exception):
+
+    def __init__(self, retry_after):
+        super().__init__(retry_after)
+        self.retry_after = retry_after
+
+
+class FixedWindowRateLimiter(object):
+    """
+    A fixed window counter for the calls to one external API, shared
+    through the cache by every web and Celery process. It allows `rate`
+    calls in every window of `period` seconds, counted with the cache's
+    atomic add and incr, so a burst at the end of one window and the
+    start of the next can make up to twice `rate` calls in a period.
+
+    A caller over the rate is told how long to wait. Callers are spread
+    over the following windows in the order they were turned away, so
+    they don't all come back at once. How much of the window's rate has
+    been used is reported as experiments.<name>.rate_limit.saturation.
+    """
+
+    CACHE_KEY = "rate-limit:{name}:{window}"
+
+    def __init__(self, name, rate, period):
+        self.name = name
+        self.rate = rate
+        self.period = period
+        self.metrics = markus.get_metrics("experiments.{}".format(name))
+
+    def acquire(self):
+        now = time.time()
+        window = int(now // self.period)
+        cache_key = self.CACHE_KEY.format(name=self.name, window=window)
+
+        cache.add(cache_key, 0, self.period * 2)
+        taken = cache.incr(cache_key)
+        self.metrics.gauge("rate_limit.saturation", taken / self.rate)
+
+        if taken > self.rate:
+            self.metrics.incr("rate_limit.throttled")
+            periods_ahead = (taken - self.rate - 1) // self.rate
+            retry_after = (window + 1 + periods_ahead) * self.period - now
+            raise RateLimitExceeded(retry_after)
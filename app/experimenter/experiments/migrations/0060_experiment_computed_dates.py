@@ -0,0 +1,32 @@
+# Generated by Django 2.1.7 on 2026-10-17 06:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0059_experimentemail")]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="computed_end_date",
+            field=models.DateField(
+                blank=True, db_index=True, editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="experiment",
+            name="computed_enrollment_end_date",
+            field=models.DateField(
+                blank=True, db_index=True, editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="experiment",
+            name="computed_start_date",
+            field=models.DateField(
+                blank=True, db_index=True, editable=False, null=True
+            ),
+        ),
+    ]
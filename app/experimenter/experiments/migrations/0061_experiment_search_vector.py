@@ -0,0 +1,55 @@
+# Generated by Django 2.1.7 on 2026-10-17 06:29
+
+import functools
+import operator
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from experimenter.experiments.constants import ExperimentConstants
+
+
+def populate_search_vector(apps, schema_editor):
+    Experiment = apps.get_model("experiments", "Experiment")
+
+    for experiment in Experiment.objects.select_related("owner"):
+        owner_email = experiment.owner.email if experiment.owner else ""
+        vectors = [
+            SearchVector(*fields, weight=weight)
+            for weight, fields in ExperimentConstants.SEARCH_VECTOR_WEIGHTS
+        ]
+        vectors.append(
+            SearchVector(
+                models.Value(owner_email, output_field=models.CharField()),
+                weight=ExperimentConstants.SEARCH_VECTOR_OWNER_WEIGHT,
+            )
+        )
+
+        Experiment.objects.filter(pk=experiment.pk).update(
+            search_vector=functools.reduce(operator.add, vectors)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0060_experiment_computed_dates")]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="experiments_search__e9a3c8_gin"
+            ),
+        ),
+        migrations.RunPython(
+            populate_search_vector, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 2.1.7 on 2026-10-17 06:33
+
+from django.db import migrations, models
+
+
+def populate_latest_change(apps, schema_editor):
+    Experiment = apps.get_model("experiments", "Experiment")
+    ExperimentChangeLog = apps.get_model("experiments", "ExperimentChangeLog")
+
+    latest_changes = (
+        ExperimentChangeLog.objects.filter(experiment=models.OuterRef("pk"))
+        .order_by("-changed_on")
+        .values("changed_on")[:1]
+    )
+    Experiment.objects.update(latest_change=models.Subquery(latest_changes))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0061_experiment_search_vector")]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="latest_change",
+            field=models.DateTimeField(
+                blank=True, db_index=True, editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(
+            populate_latest_change, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 2.1.7 on 2026-10-17 06:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0062_experiment_latest_change")]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="recipe_version",
+            field=models.PositiveIntegerField(default=1, editable=False),
+        )
+    ]
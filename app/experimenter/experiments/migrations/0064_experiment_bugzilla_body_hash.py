@@ -0,0 +1,18 @@
+# Generated by Django 2.1.7 on 2026-10-17 07:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0063_experiment_recipe_version")]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="bugzilla_body_hash",
+            field=models.CharField(
+                blank=True, editable=False, max_length=64, null=True
+            ),
+        )
+    ]
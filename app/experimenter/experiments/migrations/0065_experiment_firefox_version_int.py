@@ -0,0 +1,82 @@
+# Generated by Django 2.1.7 on 2026-10-17 07:54
+
+import re
+
+from django.db import migrations, models
+
+
+def version_to_int(version):
+    if not version:
+        return None
+
+    # Only the leading digits of each part count, so pre-release
+    # versions like "68.0a1" sort with their release
+    parts = []
+    for part in version.split(".")[:3]:
+        digits = re.match(r"\d+", part)
+        if digits is None:
+            break
+        parts.append(int(digits.group()))
+
+    if not parts:
+        return None
+
+    major, minor, patch = parts + [0] * (3 - len(parts))
+
+    return (major * 1000 + minor) * 1000 + patch
+
+
+def populate_version_ints(apps, schema_editor):
+    Experiment = apps.get_model("experiments", "Experiment")
+
+    for field in ("firefox_min_version", "firefox_max_version"):
+        versions = (
+            Experiment.objects.exclude(**{field: None})
+            .values_list(field, flat=True)
+            .distinct()
+        )
+        for version in versions:
+            Experiment.objects.filter(**{field: version}).update(
+                **{"{}_int".format(field): version_to_int(version)}
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0064_experiment_bugzilla_body_hash")]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="firefox_max_version_int",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="experiment",
+            name="firefox_min_version_int",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(populate_version_ints, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=models.Index(
+                fields=[
+                    "firefox_channel",
+                    "firefox_min_version_int",
+                    "firefox_max_version_int",
+                ],
+                name="experiments_firefox_3c5bf6_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=models.Index(
+                fields=["firefox_min_version_int"],
+                name="experiments_firefox_adb38c_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.1.7 on 2026-10-17 08:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0065_experiment_firefox_version_int")]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="readiness",
+            field=models.PositiveSmallIntegerField(
+                blank=True, db_index=True, editable=False, null=True
+            ),
+        )
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 2.1.7 on 2026-10-17 08:27
+
+from django.db import migrations, models
+
+
+CHANNEL_ORDERS = {"Nightly": 1, "Beta": 2, "Release": 3}
+
+
+def populate_channel_order(apps, schema_editor):
+    Experiment = apps.get_model("experiments", "Experiment")
+
+    for channel, order in CHANNEL_ORDERS.items():
+        Experiment.objects.filter(firefox_channel=channel).update(
+            firefox_channel_order=order
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0066_experiment_readiness")]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="experiment", name="experiments_firefox_adb38c_idx"
+        ),
+        migrations.AddField(
+            model_name="experiment",
+            name="firefox_channel_order",
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(
+            populate_channel_order, migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=models.Index(
+                fields=["firefox_min_version_int", "latest_change"],
+                name="experiments_firefox_b48575_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=models.Index(
+                fields=["firefox_channel_order", "latest_change"],
+                name="experiments_firefox_b808d3_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,62 @@
+import datetime
+
+from django.db import migrations
+from experimenter.experiments.constants import ExperimentConstants
+
+
+def compute_end_date(start_date, duration):
+    if (
+        start_date
+        and duration
+        and 0 <= duration <= ExperimentConstants.MAX_DURATION
+    ):
+        return start_date + datetime.timedelta(days=duration)
+
+
+def populate_computed_dates(apps, schema_editor):
+    Experiment = apps.get_model("experiments", "Experiment")
+
+    for experiment in Experiment.objects.prefetch_related("changes"):
+        transition_dates = {}
+        for change in sorted(
+            experiment.changes.all(), key=lambda change: change.changed_on
+        ):
+            transition_dates.setdefault(
+                (change.old_status, change.new_status),
+                change.changed_on.date(),
+            )
+
+        start_date = (
+            transition_dates.get(
+                (
+                    ExperimentConstants.STATUS_ACCEPTED,
+                    ExperimentConstants.STATUS_LIVE,
+                )
+            )
+            or experiment.proposed_start_date
+        )
+        end_date = transition_dates.get(
+            (
+                ExperimentConstants.STATUS_LIVE,
+                ExperimentConstants.STATUS_COMPLETE,
+            )
+        ) or compute_end_date(start_date, experiment.proposed_duration)
+
+        Experiment.objects.filter(pk=experiment.pk).update(
+            computed_start_date=start_date,
+            computed_end_date=end_date,
+            computed_enrollment_end_date=compute_end_date(
+                start_date, experiment.proposed_enrollment
+            ),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0067_experiment_firefox_channel_order")]
+
+    operations = [
+        migrations.RunPython(
+            populate_computed_dates, migrations.RunPython.noop
+        )
+    ]
@@ -0,0 +1,122 @@
+from django.db import migrations
+from experimenter.experiments.constants import ExperimentConstants
+
+
+RISK_FIELDS = (
+    "risk_internal_only",
+    "risk_partner_related",
+    "risk_brand",
+    "risk_fast_shipped",
+    "risk_confidential",
+    "risk_release_population",
+    "risk_revenue",
+    "risk_data_category",
+    "risk_external_team_impact",
+    "risk_telemetry_data",
+    "risk_ux",
+    "risk_security",
+    "risk_revision",
+    "risk_technical",
+)
+
+DEFAULT_REQUIRED_REVIEWS = (
+    "review_science",
+    "review_engineering",
+    "review_qa_requested",
+    "review_intent_to_ship",
+    "review_bugzilla",
+    "review_qa",
+    "review_relman",
+)
+
+CONDITIONAL_REQUIRED_REVIEWS = (
+    (
+        "review_vp",
+        (
+            "risk_partner_related",
+            "risk_brand",
+            "risk_fast_shipped",
+            "risk_confidential",
+            "risk_release_population",
+            "risk_revenue",
+        ),
+    ),
+    ("review_legal", ("risk_partner_related", "risk_data_category")),
+    ("review_impacted_teams", ("risk_external_team_impact",)),
+    ("review_data_steward", ("risk_telemetry_data",)),
+    ("review_ux", ("risk_ux",)),
+    ("review_security", ("risk_security",)),
+)
+
+
+def compute_readiness(experiment):
+    completed = {
+        ExperimentConstants.READINESS_TIMELINE: bool(
+            experiment.proposed_start_date and experiment.proposed_duration
+        ),
+        ExperimentConstants.READINESS_POPULATION: (
+            float(experiment.population_percent) > 0
+            and experiment.firefox_min_version != ""
+            and experiment.firefox_channel != ""
+        ),
+        ExperimentConstants.READINESS_ADDON: bool(
+            experiment.addon_experiment_id and experiment.addon_release_url
+        ),
+        ExperimentConstants.READINESS_VARIANTS: bool(
+            experiment.variants.all()
+        ),
+        ExperimentConstants.READINESS_OBJECTIVES: (
+            experiment.objectives != ExperimentConstants.OBJECTIVES_DEFAULT
+            and experiment.analysis != ExperimentConstants.ANALYSIS_DEFAULT
+        ),
+        ExperimentConstants.READINESS_RISKS: None
+        not in [getattr(experiment, field) for field in RISK_FIELDS],
+        ExperimentConstants.READINESS_TESTING: bool(experiment.qa_status),
+    }
+
+    completed[ExperimentConstants.READINESS_ALL_SECTIONS] = all(
+        completed[flag]
+        for flag in (
+            ExperimentConstants.READINESS_TIMELINE,
+            ExperimentConstants.READINESS_POPULATION,
+            ExperimentConstants.READINESS_VARIANTS,
+            ExperimentConstants.READINESS_OBJECTIVES,
+            ExperimentConstants.READINESS_RISKS,
+        )
+    ) and (
+        experiment.type != ExperimentConstants.TYPE_ADDON
+        or completed[ExperimentConstants.READINESS_ADDON]
+    )
+
+    required_reviews = list(DEFAULT_REQUIRED_REVIEWS)
+    for review, risks in CONDITIONAL_REQUIRED_REVIEWS:
+        if any(getattr(experiment, risk) for risk in risks):
+            required_reviews.append(review)
+    completed[ExperimentConstants.READINESS_REVIEWS] = all(
+        getattr(experiment, review) for review in required_reviews
+    )
+
+    readiness = 0
+    for flag, is_completed in completed.items():
+        if is_completed:
+            readiness |= flag
+
+    return readiness
+
+
+def populate_readiness(apps, schema_editor):
+    Experiment = apps.get_model("experiments", "Experiment")
+
+    for experiment in Experiment.objects.prefetch_related("variants"):
+        Experiment.objects.filter(pk=experiment.pk).update(
+            readiness=compute_readiness(experiment)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0068_populate_experiment_computed_dates")]
+
+    operations = [
+        migrations.RunPython(populate_readiness, migrations.RunPython.noop)
+    ]
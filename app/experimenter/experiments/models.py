@@ -1,16 +1,25 @@
 import json
 import datetime
+import functools
+import operator
+import re
 import time
 from collections import defaultdict
 from urllib.parse import urljoin
 import copy
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.core.cache import cache
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.utils.text import slugify
 from django.contrib.auth import get_user_model
 from django.core.validators import MaxValueValidator
-from django.db import models
-from django.db.models import Case, Max, Value, When
+from django.db import models, transaction
+from django.db.models import Value, prefetch_related_objects
+from django.db.models.functions import Coalesce
+from django.db.models.signals import m2m_changed, pre_delete
+from django.dispatch import receiver
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.functional import cached_property
@@ -21,22 +30,48 @@ from experimenter.experiments.constants import ExperimentConstants
 
 class ExperimentManager(models.Manager):
 
-    def get_queryset(self):
-        return (
-            super()
-            .get_queryset()
-            .annotate(latest_change=Max("changes__changed_on"))
+    def bump_recipe_version(self, *ids):
+        self.filter(pk__in=ids).update(
+            recipe_version=models.F("recipe_version") + 1
+        )
+
+    def update_readiness(self, *ids):
+        for experiment in self.filter(pk__in=ids):
+            self.filter(pk=experiment.pk).update(
+                readiness=experiment.compute_readiness()
+            )
+
+    def transition(self, experiments, new_status, changed_by, message=None):
+        """
+        Move experiments to new_status with one update and one changelog
+        insert. Only for transitions that leave the start and end dates
+        alone, as those aren't recomputed here.
+        """
+        changed_on = timezone.now()
+
+        self.filter(
+            pk__in=[experiment.id for experiment in experiments]
+        ).update(
+            status=new_status,
+            latest_change=changed_on,
+            recipe_version=models.F("recipe_version") + 1,
+        )
+
+        ExperimentChangeLog.objects.bulk_create(
+            ExperimentChangeLog(
+                experiment=experiment,
+                changed_on=changed_on,
+                changed_by=changed_by,
+                old_status=experiment.status,
+                new_status=new_status,
+                message=message,
+            )
+            for experiment in experiments
         )
 
     def get_prefetched(self):
         return self.get_queryset().prefetch_related(
-            "changes",
-            "changes__changed_by",
-            "owner",
-            "comments",
-            "comments__created_by",
-            "locales",
-            "countries",
+            "changes", "changes__changed_by", "owner", "locales", "countries"
         )
 
 
@@ -93,6 +128,56 @@ class Experiment(ExperimentConstants, models.Model):
         validators=[MaxValueValidator(ExperimentConstants.MAX_DURATION)],
     )
 
+    # Stored copies of start_date, end_date and enrollment_end_date so
+    # experiments can be filtered by date in the database, kept up to date
+    # by save and ExperimentChangeLog.save
+    computed_start_date = models.DateField(
+        blank=True, null=True, db_index=True, editable=False
+    )
+    computed_end_date = models.DateField(
+        blank=True, null=True, db_index=True, editable=False
+    )
+    computed_enrollment_end_date = models.DateField(
+        blank=True, null=True, db_index=True, editable=False
+    )
+
+    # Time of the most recent change, kept up to date by
+    # ExperimentChangeLog.save
+    latest_change = models.DateTimeField(
+        blank=True, null=True, db_index=True, editable=False
+    )
+
+    # Numeric copies of firefox_min_version and firefox_max_version, as
+    # the strings don't compare as versions, kept up to date by save
+    firefox_min_version_int = models.PositiveIntegerField(
+        blank=True, null=True, editable=False
+    )
+    firefox_max_version_int = models.PositiveIntegerField(
+        blank=True, null=True, editable=False
+    )
+
+    # Position of firefox_channel in the CHANNEL_*_ORDER ordering, kept
+    # up to date by save
+    firefox_channel_order = models.PositiveSmallIntegerField(
+        default=ExperimentConstants.CHANNEL_UNSET_ORDER, editable=False
+    )
+
+    # Bitmask of the READINESS_ flags, stored by save. Saving or deleting
+    # variants doesn't update it, so whatever changes the variants has to
+    # save the experiment, or call ExperimentManager.update_readiness,
+    # after them, as the variants form, the admin and clone do
+    readiness = models.PositiveSmallIntegerField(
+        blank=True, null=True, db_index=True, editable=False
+    )
+
+    # Incremented whenever anything the Normandy recipe is built from
+    # changes, and used to key the cached recipe
+    recipe_version = models.PositiveIntegerField(default=1, editable=False)
+
+    # Full text search document, rebuilt by save from the fields in
+    # SEARCH_VECTOR_WEIGHTS
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
+
     addon_experiment_id = models.CharField(
         max_length=255, unique=True, blank=True, null=True
     )
@@ -155,6 +240,9 @@ class Experiment(ExperimentConstants, models.Model):
     engineering_owner = models.CharField(max_length=255, blank=True, null=True)
 
     bugzilla_id = models.CharField(max_length=255, blank=True, null=True)
+    bugzilla_body_hash = models.CharField(
+        max_length=64, blank=True, null=True, editable=False
+    )
     normandy_slug = models.CharField(max_length=255, blank=True, null=True)
     normandy_id = models.PositiveIntegerField(blank=True, null=True)
 
@@ -252,6 +340,124 @@ class Experiment(ExperimentConstants, models.Model):
     class Meta:
         verbose_name = "Experiment"
         verbose_name_plural = "Experiments"
+        indexes = [
+            GinIndex(fields=["search_vector"]),
+            models.Index(
+                fields=[
+                    "firefox_channel",
+                    "firefox_min_version_int",
+                    "firefox_max_version_int",
+                ]
+            ),
+            # Ordering choices of the experiment list
+            models.Index(fields=["firefox_min_version_int", "latest_change"]),
+            models.Index(fields=["firefox_channel_order", "latest_change"]),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.compute_changelog_fields()
+        self.compute_version_fields()
+        self.compute_channel_fields()
+
+        bump_recipe_version = self.pk and not self._state.adding
+        if bump_recipe_version:
+            # Bumped in the database so concurrent saves can't share a
+            # version, and only read back if it's used
+            self.recipe_version = models.F("recipe_version") + 1
+
+        super().save(*args, **kwargs)
+
+        if bump_recipe_version:
+            del self.__dict__["recipe_version"]
+
+        self.readiness = self.compute_readiness()
+        Experiment.objects.filter(pk=self.pk).update(
+            search_vector=self.get_search_vector(), readiness=self.readiness
+        )
+
+    def compute_changelog_fields(self):
+        # Read the changelog once, and afresh, for every field derived
+        # from it
+        self.__dict__.pop("_transition_dates", None)
+        if self.pk:
+            self.__dict__.get("_prefetched_objects_cache", {}).pop(
+                "changes", None
+            )
+            prefetch_related_objects([self], "changes")
+
+        self.computed_start_date = self.start_date
+        self.computed_end_date = self.end_date
+        self.computed_enrollment_end_date = self.enrollment_end_date
+        self.latest_change = max(
+            (change.changed_on for change in self.changes.all()), default=None
+        )
+
+        if self.pk:
+            self._prefetched_objects_cache.pop("changes")
+
+    def compute_version_fields(self):
+        self.firefox_min_version_int = self.version_to_int(
+            self.firefox_min_version
+        )
+        self.firefox_max_version_int = self.version_to_int(
+            self.firefox_max_version
+        )
+
+    def compute_channel_fields(self):
+        self.firefox_channel_order = self.CHANNEL_ORDERS.get(
+            self.firefox_channel, self.CHANNEL_UNSET_ORDER
+        )
+
+    @staticmethod
+    def version_to_int(version):
+        """
+        A version string as an integer in the same order as the versions,
+        so "100.0" comes after "99.0", or None for no version.
+        """
+        if not version:
+            return None
+
+        # Only the leading digits of each part count, so pre-release
+        # versions like "68.0a1" sort with their release
+        parts = []
+        for part in version.split(".")[:3]:
+            digits = re.match(r"\d+", part)
+            if digits is None:
+                break
+            parts.append(int(digits.group()))
+
+        if not parts:
+            return None
+
+        major, minor, patch = parts + [0] * (3 - len(parts))
+
+        return (major * 1000 + minor) * 1000 + patch
+
+    def update_changelog_fields(self):
+        self.compute_changelog_fields()
+        Experiment.objects.filter(pk=self.pk).update(
+            computed_start_date=self.computed_start_date,
+            computed_end_date=self.computed_end_date,
+            computed_enrollment_end_date=self.computed_enrollment_end_date,
+            latest_change=self.latest_change,
+        )
+
+    def get_search_vector(self):
+        owner_email = self.owner.email if self.owner else ""
+        vectors = [
+            SearchVector(*fields, weight=weight)
+            for weight, fields in self.SEARCH_VECTOR_WEIGHTS
+        ]
+        # Joined fields can't be used in an update, so the owner's email
+        # is passed in as a value
+        vectors.append(
+            SearchVector(
+                Value(owner_email, output_field=models.CharField()),
+                weight=self.SEARCH_VECTOR_OWNER_WEIGHT,
+            )
+        )
+
+        return functools.reduce(operator.add, vectors)
 
     def get_absolute_url(self):
         return reverse("experiments-detail", kwargs={"slug": self.slug})
@@ -356,12 +562,26 @@ class Experiment(ExperimentConstants, models.Model):
         return f"{slug_prefix}{truncated_slug}{slug_postfix}".lower()
 
     @property
-    def normandy_recipe_json(self):
+    def normandy_recipe(self):
         from experimenter.experiments.serializers import (
             ExperimentRecipeSerializer
         )
 
-        return json.dumps(ExperimentRecipeSerializer(self).data, indent=2)
+        cache_key = self.RECIPE_CACHE_KEY.format(
+            id=self.id, version=self.recipe_version
+        )
+        recipe = cache.get(cache_key)
+
+        if recipe is None:
+            recipe = ExperimentRecipeSerializer(self).data
+            if self.id:
+                cache.set(cache_key, recipe, settings.RECIPE_CACHE_TIMEOUT)
+
+        return recipe
+
+    @property
+    def normandy_recipe_json(self):
+        return json.dumps(self.normandy_recipe, indent=2)
 
     @property
     def has_normandy_info(self):
@@ -388,13 +608,21 @@ class Experiment(ExperimentConstants, models.Model):
             or self.feature_bugzilla_url
         )
 
-    def _transition_date(self, old_status, new_status):
+    @cached_property
+    def _transition_dates(self):
+        # The date of the first change between each pair of statuses,
+        # read in one pass over the changelog and cleared by
+        # compute_changelog_fields whenever the changelog is read afresh
+        transition_dates = {}
         for change in self.changes.all():
-            if (
-                change.old_status == old_status
-                and change.new_status == new_status
-            ):
-                return change.changed_on.date()
+            transition_dates.setdefault(
+                (change.old_status, change.new_status),
+                change.changed_on.date(),
+            )
+        return transition_dates
+
+    def _transition_date(self, old_status, new_status):
+        return self._transition_dates.get((old_status, new_status))
 
     @property
     def start_date(self):
@@ -468,6 +696,35 @@ class Experiment(ExperimentConstants, models.Model):
     def control(self):
         return self.variants.get(is_control=True)
 
+    @cached_property
+    def comment_sections(self):
+        """
+        The newest comments of each section, newest first, read in one
+        query for every section of the detail page. Only one page of
+        EXPERIMENT_COMMENTS_PAGINATE_BY is read per section, and one more
+        comment if there are earlier ones.
+        """
+        newest = (
+            ExperimentComment.objects.filter(
+                experiment_id=self.id, section=models.OuterRef("section")
+            )
+            .newest_first()
+            .values("id")[: settings.EXPERIMENT_COMMENTS_PAGINATE_BY + 1]
+        )
+        comments = (
+            ExperimentComment.objects.filter(
+                experiment_id=self.id, id__in=models.Subquery(newest)
+            )
+            .select_related("created_by")
+            .newest_first()
+        )
+
+        sections = defaultdict(list)
+        for comment in comments:
+            sections[comment.section].append(comment)
+
+        return sections
+
     @property
     def grouped_changes(self):
         grouped_changes = defaultdict(lambda: defaultdict(set))
@@ -525,7 +782,7 @@ class Experiment(ExperimentConstants, models.Model):
     @property
     def completed_population(self):
         return (
-            self.population_percent > 0
+            float(self.population_percent) > 0
             and self.firefox_min_version != ""
             and self.firefox_channel != ""
         )
@@ -640,6 +897,71 @@ class Experiment(ExperimentConstants, models.Model):
     def is_ready_to_launch(self):
         return self.completed_all_sections and self.completed_required_reviews
 
+    def compute_readiness(self):
+        readiness = 0
+
+        for flag, name in self.READINESS_PROPERTIES:
+            if getattr(self, name):
+                readiness |= flag
+
+        return readiness
+
+    @cached_property
+    def stored_readiness(self):
+        """
+        The READINESS_PROPERTIES read from the stored readiness, computed
+        only when none has been stored yet.
+        """
+        readiness = self.readiness
+        if readiness is None:
+            readiness = self.compute_readiness()
+
+        return {
+            name: bool(readiness & flag)
+            for flag, name in self.READINESS_PROPERTIES
+        }
+
+    @staticmethod
+    def readiness_filter(readiness):
+        """A Q selecting the experiments with one of READINESS_CHOICES."""
+        ready = (
+            ExperimentConstants.READINESS_ALL_SECTIONS
+            | ExperimentConstants.READINESS_REVIEWS
+        )
+
+        return {
+            ExperimentConstants.READINESS_READY_TO_LAUNCH: models.Q(
+                readiness__gte=ready
+            ),
+            ExperimentConstants.READINESS_MISSING_REVIEWS: models.Q(
+                readiness__lt=ExperimentConstants.READINESS_REVIEWS
+            ),
+            ExperimentConstants.READINESS_INCOMPLETE_SECTIONS: (
+                models.Q(
+                    readiness__lt=ExperimentConstants.READINESS_ALL_SECTIONS
+                )
+                | models.Q(
+                    readiness__gte=ExperimentConstants.READINESS_REVIEWS,
+                    readiness__lt=ready,
+                )
+            ),
+        }[readiness]
+
+    @staticmethod
+    def readiness_counts(queryset):
+        """The number of experiments in queryset with each readiness."""
+        counts = queryset.aggregate(
+            **{
+                readiness: models.Count(
+                    "pk", filter=Experiment.readiness_filter(readiness)
+                )
+                for readiness, label in ExperimentConstants.READINESS_CHOICES
+            }
+        )
+
+        # queryset.none() aggregates to None rather than 0
+        return {readiness: count or 0 for readiness, count in counts.items()}
+
     @property
     def format_firefox_versions(self):
         if self.firefox_max_version:
@@ -656,23 +978,31 @@ class Experiment(ExperimentConstants, models.Model):
         )
 
     @staticmethod
-    def firefox_channel_sort():
-        """A Case that can be added to an Experiment QuerySet to sort."""
-        return Case(
-            When(
-                firefox_channel=ExperimentConstants.CHANNEL_RELEASE,
-                then=Value(ExperimentConstants.CHANNEL_RELEASE_ORDER),
-            ),
-            When(
-                firefox_channel=ExperimentConstants.CHANNEL_BETA,
-                then=Value(ExperimentConstants.CHANNEL_BETA_ORDER),
-            ),
-            When(
-                firefox_channel=ExperimentConstants.CHANNEL_NIGHTLY,
-                then=Value(ExperimentConstants.CHANNEL_NIGHTLY_ORDER),
-            ),
-            default=Value(ExperimentConstants.CHANNEL_UNSET_ORDER),
-            output_field=models.IntegerField(),
+    def subscribed_by(user):
+        """
+        An Exists that can be added to an Experiment QuerySet as
+        is_subscribed for the given user.
+        """
+        return models.Exists(
+            Experiment.subscribers.through.objects.filter(
+                experiment=models.OuterRef("pk"), user=user.id
+            )
+        )
+
+    @staticmethod
+    def subscriber_count():
+        """A Subquery that can be added to an Experiment QuerySet."""
+        counts = (
+            Experiment.subscribers.through.objects.filter(
+                experiment=models.OuterRef("pk")
+            )
+            .order_by()
+            .values("experiment")
+            .annotate(count=models.Count("pk"))
+            .values("count")
+        )
+        return Coalesce(
+            models.Subquery(counts, output_field=models.IntegerField()), 0
         )
 
     @property
@@ -680,7 +1010,10 @@ class Experiment(ExperimentConstants, models.Model):
         return self.status != self.STATUS_LIVE
 
     def clone(self, name, user):
+        with transaction.atomic():
+            return self._clone(name, user)
 
+    def _clone(self, name, user):
         cloned = copy.copy(self)
         variants = ExperimentVariant.objects.filter(experiment=self)
 
@@ -690,6 +1023,7 @@ class Experiment(ExperimentConstants, models.Model):
             "normandy_slug",
             "normandy_id",
             "bugzilla_id",
+            "bugzilla_body_hash",
             "review_science",
             "review_engineering",
             "review_qa_requested",
@@ -715,6 +1049,9 @@ class Experiment(ExperimentConstants, models.Model):
         cloned.owner = user
         cloned.parent = self
         cloned.archived = False
+        cloned.recipe_version = Experiment._meta.get_field(
+            "recipe_version"
+        ).get_default()
 
         for field in set_to_none_fields:
             setattr(cloned, field, None)
@@ -722,20 +1059,46 @@ class Experiment(ExperimentConstants, models.Model):
         cloned.save()
 
         # for the variants on the old experiment, duplicate each
-        # with id=none, set the experiment foreignkey to the new clone
+        # with id=none, set the experiment foreignkey to the new clone.
+        # bulk_create skips the recipe version bumps, which is fine as
+        # nothing can have cached the recipe of the new experiment yet
+        cloned_variants = []
         for variant in variants:
             variant.id = None
             variant.experiment = cloned
-            variant.save()
+            cloned_variants.append(variant)
+        ExperimentVariant.objects.bulk_create(cloned_variants)
+
+        Locales = Experiment.locales.through
+        Locales.objects.bulk_create(
+            Locales(experiment_id=cloned.id, locale_id=locale_id)
+            for locale_id in Locales.objects.filter(
+                experiment_id=self.id
+            ).values_list("locale_id", flat=True)
+        )
+
+        Countries = Experiment.countries.through
+        Countries.objects.bulk_create(
+            Countries(experiment_id=cloned.id, country_id=country_id)
+            for country_id in Countries.objects.filter(
+                experiment_id=self.id
+            ).values_list("country_id", flat=True)
+        )
 
         ExperimentChangeLog.objects.create(
             experiment=cloned,
             changed_on=datetime.date.today(),
-            changed_by=get_user_model().objects.get(id=user.id),
+            changed_by=user,
             old_status=None,
             new_status=ExperimentConstants.STATUS_DRAFT,
         )
 
+        # The variants were added after the clone was saved
+        cloned.readiness = cloned.compute_readiness()
+        Experiment.objects.filter(pk=cloned.pk).update(
+            readiness=cloned.readiness
+        )
+
         return cloned
 
 
@@ -759,6 +1122,14 @@ class ExperimentVariant(models.Model):
         verbose_name_plural = "Experiment Variants"
         unique_together = (("slug", "experiment"),)
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        Experiment.objects.bump_recipe_version(self.experiment_id)
+
+    def delete(self, *args, **kwargs):
+        Experiment.objects.bump_recipe_version(self.experiment_id)
+        return super().delete(*args, **kwargs)
+
     def __str__(self):
         return self.name
 
@@ -847,6 +1218,10 @@ class ExperimentChangeLog(models.Model):
         verbose_name_plural = "Experiment Change Logs"
         ordering = ("changed_on",)
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.experiment.update_changelog_fields()
+
     def __str__(self):
         if self.message:
             return self.message
@@ -860,18 +1235,6 @@ class ExperimentChangeLog(models.Model):
         )
 
 
-class ExperimentCommentManager(models.Manager):
-
-    @cached_property
-    def sections(self):
-        sections = defaultdict(list)
-
-        for comment in self.all():
-            sections[comment.section].append(comment)
-
-        return sections
-
-
 class ExperimentEmail(ExperimentConstants, models.Model):
     experiment = models.ForeignKey(
         Experiment, related_name="emails", on_delete=models.CASCADE
@@ -885,6 +1248,27 @@ class ExperimentEmail(ExperimentConstants, models.Model):
     sent_on = models.DateTimeField(auto_now_add=True)
 
 
+class ExperimentCommentQuerySet(models.QuerySet):
+
+    def newest_first(self):
+        return self.order_by("-created_on", "-id")
+
+    def older_than(self, comment_id):
+        """
+        The comments before comment_id, by the same keys as newest_first,
+        so paging back through them isn't shifted by new comments.
+        """
+        created_on = models.Subquery(
+            ExperimentComment.objects.filter(id=comment_id).values(
+                "created_on"
+            )
+        )
+        return self.filter(
+            models.Q(created_on__lt=created_on)
+            | models.Q(created_on=created_on, id__lt=comment_id)
+        )
+
+
 class ExperimentComment(ExperimentConstants, models.Model):
     experiment = models.ForeignKey(
         Experiment, related_name="comments", on_delete=models.CASCADE
@@ -896,7 +1280,7 @@ class ExperimentComment(ExperimentConstants, models.Model):
     )
     text = models.TextField()
 
-    objects = ExperimentCommentManager()
+    objects = ExperimentCommentQuerySet.as_manager()
 
     class Meta:
         verbose_name = "Experiment Comment"
@@ -907,3 +1291,36 @@ class ExperimentComment(ExperimentConstants, models.Model):
         return "{author} ({date}): {text}".format(
             author=self.created_by, date=self.created_on, text=self.text
         )
+
+
+@receiver(m2m_changed, sender=Experiment.locales.through)
+@receiver(m2m_changed, sender=Experiment.countries.through)
+def bump_recipe_version_for_targeting(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if reverse and action == "pre_clear":
+        # A cleared locale or country no longer knows its experiments
+        # once the clear is done
+        instance._cleared_experiment_ids = list(
+            instance.experiment_set.values_list("id", flat=True)
+        )
+    elif action in ("post_add", "post_remove", "post_clear"):
+        if not reverse:
+            experiment_ids = [instance.pk]
+        elif action == "post_clear":
+            experiment_ids = instance.__dict__.pop(
+                "_cleared_experiment_ids", []
+            )
+        else:
+            experiment_ids = pk_set
+
+        if experiment_ids:
+            Experiment.objects.bump_recipe_version(*experiment_ids)
+
+
+@receiver(pre_delete, sender=Locale)
+@receiver(pre_delete, sender=Country)
+def bump_recipe_version_for_deleted_targeting(sender, instance, **kwargs):
+    experiment_ids = instance.experiment_set.values_list("id", flat=True)
+    if experiment_ids:
+        Experiment.objects.bump_recipe_version(*experiment_ids)
@@ -1,6 +1,24 @@
+import collections
+import itertools
+import math
 import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+import markus
 from django.conf import settings
+from django.core.cache import cache
+
+from experimenter.experiments.http_client import APISession
+
+
+session = APISession(
+    "normandy", pool_maxsize=settings.NORMANDY_API_CONCURRENCY
+)
+metrics = markus.get_metrics("experiments.normandy")
+
+RESPONSE_CACHE_KEY = "normandy-response:{url}"
 
 
 class NormandyError(Exception):
@@ -19,11 +37,39 @@ class NormandyDecodeError(NormandyError):
     message = "Error parsing JSON Normandy Response"
 
 
-def make_normandy_call(url):
+def get_response_cache_key(url, params=None):
+    if params:
+        url = "{url}?{query}".format(url=url, query=urlencode(params))
+    return RESPONSE_CACHE_KEY.format(url=url)
+
+
+def make_normandy_call(url, params=None):
+    """
+    GET a Normandy API url and return its decoded JSON.
+
+    Responses that carry an ETag or Last-Modified header are cached, and
+    later calls for the same url send them back as a conditional request,
+    so an unchanged response costs a 304 and no JSON decoding.
+    """
+    cache_key = get_response_cache_key(url, params)
+    cached = cache.get(cache_key)
+
+    headers = {}
+    if cached is not None:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
     try:
-        response = requests.get(url)
+        response = session.get(url, params=params, headers=headers)
+        if cached is not None and response.status_code == 304:
+            metrics.incr("cache.hit")
+            return cached["data"]
+
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+        metrics.incr("cache.miss")
     except requests.exceptions.HTTPError as e:
         logging.exception(
             "Normandy API returned Nonsuccessful Response Code: {}".format(e)
@@ -36,8 +82,85 @@ def make_normandy_call(url):
         logging.exception("Error parsing JSON Normandy response: {}".format(e))
         raise NormandyDecodeError(*e.args)
 
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        cache.set(
+            cache_key,
+            {"etag": etag, "last_modified": last_modified, "data": data},
+            settings.NORMANDY_API_CACHE_TIMEOUT,
+        )
+
+    return data
+
 
 def get_recipe(recipe_id):
     recipe_url = settings.NORMANDY_API_RECIPE_URL.format(id=recipe_id)
     recipe_data = make_normandy_call(recipe_url)
     return recipe_data["approved_revision"]
+
+
+def get_recipes(recipe_ids):
+    """
+    Stream (recipe id, approved revision) pairs for the requested recipes
+    from the paginated Normandy recipe list.
+
+    The first page tells us how many pages there are. The remaining pages
+    are requested in order, up to NORMANDY_API_CONCURRENCY at a time, and
+    yielded in order. No further pages are requested once every recipe has
+    been found, so the cost is at most one request per page rather than
+    one per recipe.
+    """
+    remaining_ids = set(recipe_ids)
+
+    if not remaining_ids:
+        return
+
+    def get_page(page):
+        return make_normandy_call(
+            settings.NORMANDY_API_RECIPES_URL,
+            params={
+                "page": page,
+                "page_size": settings.NORMANDY_API_PAGE_SIZE,
+            },
+        )
+
+    def matching_recipes(page_data):
+        for recipe in page_data["results"]:
+            if recipe["id"] in remaining_ids:
+                remaining_ids.discard(recipe["id"])
+                yield recipe["id"], recipe["approved_revision"]
+
+    first_page = get_page(1)
+    yield from matching_recipes(first_page)
+
+    page_length = len(first_page["results"])
+    if not (remaining_ids and page_length and first_page.get("next")):
+        return
+
+    num_pages = math.ceil(first_page["count"] / page_length)
+
+    pages = iter(range(2, num_pages + 1))
+
+    with ThreadPoolExecutor(
+        max_workers=settings.NORMANDY_API_CONCURRENCY
+    ) as executor:
+        pending = collections.deque(
+            executor.submit(get_page, page)
+            for page in itertools.islice(
+                pages, settings.NORMANDY_API_CONCURRENCY
+            )
+        )
+
+        while pending:
+            yield from matching_recipes(pending.popleft().result())
+
+            if not remaining_ids:
+                break
+
+            next_page = next(pages, None)
+            if next_page is not None:
+                pending.append(executor.submit(get_page, next_page))
+
+        for future in pending:
+            future.cancel()
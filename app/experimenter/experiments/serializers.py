@@ -3,6 +3,7 @@ import json
 from rest_framework import serializers
 from django.utils.text import slugify
 from django.urls import reverse
+from django.db import transaction
 from django.db.models import Q
 
 from experimenter.base.models import Country, Locale
@@ -50,9 +51,30 @@ class CountrySerializer(serializers.ModelSerializer):
         fields = ("code", "name")
 
 
-class ExperimentSerializer(serializers.ModelSerializer):
-    start_date = JSTimestampField()
-    end_date = JSTimestampField()
+class RequestedFieldsMixin(object):
+    """
+    Only serialize the fields named in a comma separated ?fields= query
+    parameter, or every field when it is absent.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        request = self.context.get("request")
+        requested_fields = get_requested_fields(request)
+        if requested_fields:
+            for field_name in set(self.fields) - requested_fields:
+                self.fields.pop(field_name)
+
+
+def get_requested_fields(request):
+    if request is not None and request.query_params.get("fields"):
+        return set(request.query_params["fields"].split(","))
+
+
+class ExperimentSerializer(RequestedFieldsMixin, serializers.ModelSerializer):
+    start_date = JSTimestampField(source="computed_start_date")
+    end_date = JSTimestampField(source="computed_end_date")
     proposed_start_date = JSTimestampField()
     variants = ExperimentVariantSerializer(many=True)
     locales = LocaleSerializer(many=True)
@@ -139,7 +161,8 @@ class FilterObjectLocaleSerializer(serializers.ModelSerializer):
         return "locale"
 
     def get_locales(self, obj):
-        return list(obj.locales.all().values_list("code", flat=True))
+        # Read from the locales, so a prefetch of them is used
+        return [locale.code for locale in obj.locales.all()]
 
 
 class FilterObjectCountrySerializer(serializers.ModelSerializer):
@@ -154,7 +177,7 @@ class FilterObjectCountrySerializer(serializers.ModelSerializer):
         return "country"
 
     def get_countries(self, obj):
-        return list(obj.countries.all().values_list("code", flat=True))
+        return [country.code for country in obj.countries.all()]
 
 
 class ExperimentRecipeVariantSerializer(serializers.ModelSerializer):
@@ -274,3 +297,45 @@ class ExperimentCloneSerializer(serializers.ModelSerializer):
         name = validated_data.get("name")
 
         return instance.clone(name, user)
+
+
+class ExperimentBatchCloneListSerializer(serializers.ListSerializer):
+
+    def validate(self, data):
+        slugs = [slugify(clone["name"]) for clone in data]
+
+        if len(set(slugs)) != len(slugs):
+            raise serializers.ValidationError(
+                "Each clone needs a different name."
+            )
+
+        return data
+
+    def create(self, validated_data):
+        with transaction.atomic():
+            return super().create(validated_data)
+
+
+class ExperimentBatchCloneSerializer(ExperimentCloneSerializer):
+    experiment = serializers.SlugRelatedField(
+        slug_field="slug", queryset=Experiment.objects.all(), write_only=True
+    )
+
+    class Meta(ExperimentCloneSerializer.Meta):
+        fields = ("experiment", "name", "clone_url")
+        list_serializer_class = ExperimentBatchCloneListSerializer
+
+    def create(self, validated_data):
+        user = self.context["request"].user
+
+        return validated_data["experiment"].clone(validated_data["name"], user)
+
+
+class ExperimentBulkTransitionSerializer(serializers.Serializer):
+    slugs = serializers.ListField(
+        child=serializers.SlugField(), allow_empty=False
+    )
+    status = serializers.ChoiceField(
+        choices=(Experiment.STATUS_ACCEPTED, Experiment.STATUS_REJECTED)
+    )
+    message = serializers.CharField(required=False, allow_blank=True)
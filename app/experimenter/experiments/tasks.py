@@ -1,12 +1,17 @@
+import uuid
+from collections import defaultdict
+
 import markus
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import IntegrityError, transaction
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from celery.utils.log import get_task_logger
 
 from experimenter.celery import app
 from experimenter.experiments import bugzilla, normandy, email
-from experimenter.experiments.models import Experiment
+from experimenter.experiments.models import Experiment, ExperimentVariant
 from experimenter.notifications.models import Notification
 
 
@@ -34,6 +39,18 @@ NOTIFICATION_MESSAGE_UPDATE_BUG_FAILED = (
     "Administrator on #ask-experimenter on Slack."
 )
 
+NOTIFICATION_MESSAGE_SEND_EMAIL_FAILED = (
+    "Experimenter failed to send the {email_type} email for {name}.  "
+    "Please contact an Experimenter Administrator on #ask-experimenter "
+    "on Slack."
+)
+
+RECIPE_REVISION_CACHE_KEY = "normandy-revision:{experiment_id}"
+
+EMAIL_QUEUE_DEPTH_CACHE_KEY = "experiment-emails:queued"
+
+LATEST_TASK_CACHE_KEY = "latest-task:{task}:{experiment_id}"
+
 STATUS_UPDATE_MAPPING = {
     Experiment.STATUS_ACCEPTED: Experiment.STATUS_LIVE,
     Experiment.STATUS_LIVE: Experiment.STATUS_COMPLETE,
@@ -71,6 +88,10 @@ def create_experiment_bug_task(user_id, experiment_id):
         )
         metrics.incr("create_experiment_bug.completed")
         logger.info("Bugzilla ticket notification sent")
+    except bugzilla.BugzillaRateLimited as e:
+        raise retry_rate_limited(
+            create_experiment_bug_task, "create_experiment_bug", e
+        )
     except bugzilla.BugzillaError as e:
         metrics.incr("create_experiment_bug.failed")
         logger.info("Bugzilla ticket creation failed")
@@ -82,12 +103,71 @@ def create_experiment_bug_task(user_id, experiment_id):
         raise e
 
 
+def retry_rate_limited(task, name, error):
+    if task.request.retries >= settings.BUGZILLA_RATE_LIMIT_RETRIES:
+        metrics.incr("{}.rate_limit_gave_up".format(name))
+        logger.error(
+            "Bugzilla still rate limited after {} retries, giving up".format(
+                settings.BUGZILLA_RATE_LIMIT_RETRIES
+            )
+        )
+        return error
+
+    metrics.incr("{}.rate_limited".format(name))
+    logger.info(
+        "Bugzilla rate limited, retrying in {:.1f}s".format(error.retry_after)
+    )
+    return task.retry(
+        exc=error,
+        countdown=error.retry_after,
+        max_retries=settings.BUGZILLA_RATE_LIMIT_RETRIES,
+    )
+
+
+def delay_coalesced(task, user_id, experiment_id):
+    """
+    Queue a task for an experiment so that, of the calls still waiting to
+    run for it, only the latest one does.
+    """
+    token = uuid.uuid4().hex
+    cache.set(
+        LATEST_TASK_CACHE_KEY.format(
+            task=task.name, experiment_id=experiment_id
+        ),
+        token,
+        settings.TASK_COALESCE_TIMEOUT,
+    )
+    task.delay(user_id, experiment_id, coalesce_token=token)
+
+
+def is_coalesced(task, experiment_id, coalesce_token):
+    if coalesce_token is None:
+        return False
+
+    latest_token = cache.get(
+        LATEST_TASK_CACHE_KEY.format(
+            task=task.name, experiment_id=experiment_id
+        )
+    )
+    # Run when the latest token has expired rather than drop the update
+    return latest_token not in (None, coalesce_token)
+
+
 @app.task
 @metrics.timer_decorator("update_experiment_bug.timing")
-def update_experiment_bug_task(user_id, experiment_id):
+def update_experiment_bug_task(user_id, experiment_id, coalesce_token=None):
+    if is_coalesced(update_experiment_bug_task, experiment_id, coalesce_token):
+        metrics.incr("update_experiment_bug.coalesced")
+        logger.info("Skipping Bugzilla update superseded by a later one")
+        return
+
     metrics.incr("update_experiment_bug.started")
 
-    experiment = Experiment.objects.get(id=experiment_id)
+    experiment = Experiment.objects.prefetch_related(
+        "countries",
+        "locales",
+        Prefetch("variants", ExperimentVariant.objects.order_by("id")),
+    ).get(id=experiment_id)
 
     if experiment.risk_internal_only:
         logger.info("Skipping Bugzilla update for internal only experiment")
@@ -96,16 +176,23 @@ def update_experiment_bug_task(user_id, experiment_id):
     logger.info("Updating Bugzilla Ticket")
 
     try:
-        bugzilla.update_experiment_bug(experiment)
-        logger.info("Bugzilla Ticket updated")
-        Notification.objects.create(
-            user_id=user_id,
-            message=NOTIFICATION_MESSAGE_UPDATE_BUG.format(
-                bug_url=experiment.bugzilla_url
-            ),
-        )
+        if bugzilla.update_experiment_bug(experiment):
+            logger.info("Bugzilla Ticket updated")
+            Notification.objects.create(
+                user_id=user_id,
+                message=NOTIFICATION_MESSAGE_UPDATE_BUG.format(
+                    bug_url=experiment.bugzilla_url
+                ),
+            )
+            logger.info("Bugzilla Update notification sent")
+        else:
+            metrics.incr("update_experiment_bug.unchanged")
+            logger.info("Bugzilla Ticket already up to date")
         metrics.incr("update_experiment_bug.completed")
-        logger.info("Bugzilla Update notification sent")
+    except bugzilla.BugzillaRateLimited as e:
+        raise retry_rate_limited(
+            update_experiment_bug_task, "update_experiment_bug", e
+        )
     except bugzilla.BugzillaError as e:
         Notification.objects.create(
             user_id=user_id, message=NOTIFICATION_MESSAGE_UPDATE_BUG_FAILED
@@ -124,26 +211,73 @@ def update_experiment_info():
         Q(status=Experiment.STATUS_ACCEPTED) | Q(status=Experiment.STATUS_LIVE)
     )
 
+    launch_emails = []
+    experiments_by_recipe = defaultdict(list)
     for experiment in launch_experiments:
-        try:
-            logger.info("Updating Experiment: {}".format(experiment))
-            if experiment.normandy_id:
-                update_status(experiment)
-            else:
-                logger.info(
-                    "No Normandy ID found skipping: {}".format(experiment)
-                )
+        if experiment.normandy_id:
+            experiments_by_recipe[experiment.normandy_id].append(experiment)
+        else:
+            logger.info("No Normandy ID found skipping: {}".format(experiment))
 
-        except (IntegrityError, KeyError, normandy.NormandyError):
-            logger.info(
-                "Failed to get Normandy Recipe. Recipe ID: {}".format(
-                    experiment.normandy_id
+    try:
+        recipes = normandy.get_recipes(experiments_by_recipe.keys())
+        for recipe_id, recipe_data in recipes:
+            for experiment in experiments_by_recipe.pop(recipe_id):
+                cache_key = RECIPE_REVISION_CACHE_KEY.format(
+                    experiment_id=experiment.id
                 )
-            )
-            metrics.incr("update_experiment_info.failed")
+                revision = get_recipe_revision(recipe_data, experiment.status)
+                if cache.get(cache_key) == revision:
+                    logger.info(
+                        "Recipe unchanged skipping: {}".format(experiment)
+                    )
+                    metrics.incr("update_experiment_info.unchanged")
+                    continue
+
+                try:
+                    logger.info("Updating Experiment: {}".format(experiment))
+                    update_status(experiment, recipe_data, launch_emails)
+                    cache.set(
+                        cache_key,
+                        get_recipe_revision(recipe_data, experiment.status),
+                        settings.NORMANDY_API_CACHE_TIMEOUT,
+                    )
+                except (IntegrityError, KeyError):
+                    logger.info(
+                        "Failed to update Experiment: {}".format(experiment)
+                    )
+                    metrics.incr("update_experiment_info.failed")
+    except normandy.NormandyError:
+        logger.info("Failed to get Normandy Recipes")
+    finally:
+        # Experiments already made live keep their launch emails whatever
+        # goes wrong with the rest of the sync
+        if launch_emails:
+            queue_experiment_emails(launch_emails)
+
+    for recipe_id, experiments in experiments_by_recipe.items():
+        logger.info(
+            "Failed to get Normandy Recipe. Recipe ID: {}".format(recipe_id)
+        )
+        metrics.incr("update_experiment_info.failed", len(experiments))
+
     metrics.incr("update_experiment_info.completed")
 
 
+def get_recipe_revision(recipe_data, status):
+    """
+    Identify the recipe revision and enabled state an experiment's status
+    was last checked against. Nothing update_status looks at can change
+    without changing this value.
+    """
+    approved_revision = recipe_data or {}
+    return "{id}:{enabled}:{status}".format(
+        id=approved_revision.get("id"),
+        enabled=approved_revision.get("enabled"),
+        status=status,
+    )
+
+
 def add_start_date_comment(experiment):
     comment = "Start Date: {} End Date: {}".format(
         experiment.start_date, experiment.end_date
@@ -151,8 +285,51 @@ def add_start_date_comment(experiment):
     bugzilla.add_experiment_comment(experiment, comment)
 
 
-def update_status(experiment):
-    recipe_data = normandy.get_recipe(experiment.normandy_id)
+@app.task
+@metrics.timer_decorator("add_start_date_comment.timing")
+def add_start_date_comment_task(experiment_id):
+    metrics.incr("add_start_date_comment.started")
+    experiment = Experiment.objects.get(id=experiment_id)
+
+    logger.info("Adding start date comment to Bugzilla ticket")
+
+    try:
+        add_start_date_comment(experiment)
+        metrics.incr("add_start_date_comment.completed")
+        logger.info("Start date comment added")
+    except bugzilla.BugzillaRateLimited as e:
+        raise retry_rate_limited(
+            add_start_date_comment_task, "add_start_date_comment", e
+        )
+    except bugzilla.BugzillaError as e:
+        metrics.incr("add_start_date_comment.failed")
+        logger.info("Failed to add start date comment")
+        raise e
+
+
+@app.task
+@metrics.timer_decorator("resolve_completed_bug.timing")
+def resolve_completed_bug_task(experiment_id):
+    metrics.incr("resolve_completed_bug.started")
+    experiment = Experiment.objects.get(id=experiment_id)
+
+    logger.info("Resolving Bugzilla ticket of completed experiment")
+
+    try:
+        bugzilla.update_bug_resolution(experiment)
+        metrics.incr("resolve_completed_bug.completed")
+        logger.info("Bugzilla ticket resolved")
+    except bugzilla.BugzillaRateLimited as e:
+        raise retry_rate_limited(
+            resolve_completed_bug_task, "resolve_completed_bug", e
+        )
+    except bugzilla.BugzillaError as e:
+        metrics.incr("resolve_completed_bug.failed")
+        logger.info("Failed to resolve Bugzilla ticket")
+        raise e
+
+
+def update_status(experiment, recipe_data, launch_emails):
     if needs_to_be_updated(recipe_data, experiment.status):
         logger.info("Updating experiment Status")
         enabler_email = recipe_data["enabled_states"][0]["creator"]["email"]
@@ -173,15 +350,17 @@ def update_status(experiment):
             metrics.incr("update_experiment_info.updated")
             logger.info("Finished updating Experiment: {}".format(experiment))
 
+        # Bugzilla is updated from tasks of its own, which retry when rate
+        # limited, so a throttled call can't stop the sync
         if experiment.status == Experiment.STATUS_LIVE:
-            add_start_date_comment(experiment)
-            email.send_experiment_launch_email(experiment)
+            add_start_date_comment_task.delay(experiment.id)
+            launch_emails.append((experiment.id, Experiment.EXPERIMENT_STARTS))
             logger.info(
-                "Sent launch email for Experiment: {}".format(experiment)
+                "Queued launch email for Experiment: {}".format(experiment)
             )
 
         if experiment.status == Experiment.STATUS_COMPLETE:
-            bugzilla.update_bug_resolution(experiment)
+            resolve_completed_bug_task.delay(experiment.id)
 
 
 def needs_to_be_updated(recipe_data, status):
@@ -195,7 +374,12 @@ def needs_to_be_updated(recipe_data, status):
 
 @app.task
 @metrics.timer_decorator("update_bug_resolution.timing")
-def update_bug_resolution_task(user_id, experiment_id):
+def update_bug_resolution_task(user_id, experiment_id, coalesce_token=None):
+    if is_coalesced(update_bug_resolution_task, experiment_id, coalesce_token):
+        metrics.incr("update_bug_resolution.coalesced")
+        logger.info("Skipping resolution update superseded by a later one")
+        return
+
     metrics.incr("update_bug_resolution.started")
     experiment = Experiment.objects.get(id=experiment_id)
 
@@ -221,6 +405,10 @@ def update_bug_resolution_task(user_id, experiment_id):
         )
         metrics.incr("update_bug_resolution.completed")
         logger.info("Bugzilla resolution update sent")
+    except bugzilla.BugzillaRateLimited as e:
+        raise retry_rate_limited(
+            update_bug_resolution_task, "update_bug_resolution", e
+        )
     except bugzilla.BugzillaError as e:
         metrics.incr("update_bug_resolution.failed")
         logger.info("Failed to update resolution of bugzilla ticket")
@@ -231,3 +419,68 @@ def update_bug_resolution_task(user_id, experiment_id):
             ),
         )
         raise e
+
+
+def queue_experiment_emails(emails, user_id=None):
+    cache.add(EMAIL_QUEUE_DEPTH_CACHE_KEY, 0, None)
+    metrics.gauge(
+        "send_experiment_emails.queue_depth",
+        cache.incr(EMAIL_QUEUE_DEPTH_CACHE_KEY, len(emails)),
+    )
+    send_experiment_emails_task.delay(emails, user_id)
+
+
+@app.task
+@metrics.timer_decorator("send_experiment_emails.timing")
+def send_experiment_emails_task(emails, user_id=None):
+    metrics.incr("send_experiment_emails.started")
+    logger.info("Sending {} experiment emails".format(len(emails)))
+
+    finished = len(emails)
+    try:
+        email.send_experiment_emails(emails)
+        metrics.incr("send_experiment_emails.completed")
+        logger.info("Experiment emails sent")
+    except email.ExperimentEmailsError as e:
+        metrics.incr("send_experiment_emails.failed")
+        logger.info("Failed to send experiment emails")
+
+        retries = send_experiment_emails_task.request.retries
+        if retries < settings.EMAIL_RETRIES:
+            # Only the unsent emails are retried, and they stay queued
+            finished -= len(e.unsent_emails)
+            raise send_experiment_emails_task.retry(
+                args=[e.unsent_emails, user_id],
+                exc=e,
+                countdown=settings.EMAIL_RETRY_BACKOFF * 2 ** retries,
+                max_retries=settings.EMAIL_RETRIES,
+            )
+
+        metrics.incr("send_experiment_emails.gave_up")
+        notify_unsent_emails(e.unsent_emails, user_id)
+        raise e
+    finally:
+        try:
+            cache.decr(EMAIL_QUEUE_DEPTH_CACHE_KEY, finished)
+        except ValueError:
+            pass
+
+
+def notify_unsent_emails(emails, user_id=None):
+    """
+    Tell user_id, or the owner of each experiment when there is no user,
+    about the emails that could not be sent.
+    """
+    experiments = Experiment.objects.in_bulk(
+        {experiment_id for experiment_id, email_type in emails}
+    )
+
+    for experiment_id, email_type in emails:
+        experiment = experiments.get(experiment_id)
+        if experiment is not None:
+            Notification.objects.create(
+                user_id=user_id or experiment.owner_id,
+                message=NOTIFICATION_MESSAGE_SEND_EMAIL_FAILED.format(
+                    email_type=email_type, name=experiment.name
+                ),
+            )
@@ -1,4 +1,5 @@
 from django import template
+from django.conf import settings
 
 register = template.Library()
 
@@ -41,3 +42,27 @@ def pagination_url(context, page, **kwargs):
         return f"?{data.urlencode()}"
     else:
         return "."
+
+
+@register.filter
+def comment_page(comments):
+    """A page of a section's comments, read newest first with one more
+    than EXPERIMENT_COMMENTS_PAGINATE_BY when there are earlier ones.
+
+    Usage:
+
+        {% with page=comments|comment_page %}
+
+    Will, yield the newest comments of the page as page.comments, which
+    experiments/comments.html renders oldest first, and as page.earlier
+    the id of the oldest of them if there are earlier comments to load
+    before it, or None.
+    """
+    page_size = settings.EXPERIMENT_COMMENTS_PAGINATE_BY
+    comments = list(comments)
+
+    earlier = None
+    if len(comments) > page_size:
+        earlier = comments[page_size - 1].id
+
+    return {"comments": comments[:page_size], "earlier": earlier}
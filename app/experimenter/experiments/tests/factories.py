@@ -161,6 +161,8 @@ class ExperimentFactory(
             else:
                 ExperimentVariantFactory.create(experiment=experiment)
 
+        Experiment.objects.update_readiness(experiment.id)
+
         return experiment
 
     @classmethod
@@ -313,7 +315,10 @@ def letter_code_sequence(n):
 
 class CountryFactory(factory.django.DjangoModelFactory):
     code = factory.Sequence(letter_code_sequence)
-    name = factory.LazyAttribute(lambda o: faker.country())
+    # Names are made unique so the name ordering is deterministic
+    name = factory.LazyAttribute(
+        lambda o: "{} {}".format(faker.country(), o.code)
+    )
 
     class Meta:
         model = Country
@@ -322,8 +327,9 @@ class CountryFactory(factory.django.DjangoModelFactory):
 
 class LocaleFactory(factory.django.DjangoModelFactory):
     code = factory.Sequence(letter_code_sequence)
+    # not technically correct, but sure
     name = factory.LazyAttribute(
-        lambda o: faker.word()  # not technically correct, but sure
+        lambda o: "{} {}".format(faker.word(), o.code)
     )
 
     class Meta:
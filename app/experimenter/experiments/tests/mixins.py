@@ -1,4 +1,5 @@
 import mock
+from django.core.cache import cache
 
 from experimenter.experiments import bugzilla
 from experimenter.openidc.tests.factories import UserFactory
@@ -8,9 +9,10 @@ class MockNormandyMixin(object):
 
     def setUp(self):
         super().setUp()
+        cache.clear()
 
         mock_normandy_requests_get_patcher = mock.patch(
-            "experimenter.experiments.normandy.requests.get"
+            "experimenter.experiments.normandy.session.get"
         )
         self.mock_normandy_requests_get = (
             mock_normandy_requests_get_patcher.start()
@@ -20,64 +22,60 @@ class MockNormandyMixin(object):
             self.buildMockSuccessEnabledResponse()
         )
 
-    def buildMockSuccessEnabledResponse(self):
-        mock_response_data = {
-            "approved_revision": {
-                "enabled": True,
-                "enabled_states": [{"creator": {"email": "dev@example.com"}}],
-            }
-        }
-        mock_response = mock.Mock()
-        mock_response.json = mock.Mock()
-        mock_response.json.return_value = mock_response_data
-        mock_response.raise_for_status = mock.Mock()
-        mock_response.raise_for_status.side_effect = None
-        mock_response.status_code = 200
-        return mock_response
-
-    def buildMockFailedResponse(self):
-        mock_response_data = {"message": "id not found"}
+    def buildMockResponse(
+        self, mock_response_data, status_code=200, headers=None
+    ):
         mock_response = mock.Mock()
+        mock_response.headers = headers or {}
         mock_response.json = mock.Mock()
         mock_response.json.return_value = mock_response_data
         mock_response.raise_for_status = mock.Mock()
         mock_response.raise_for_status.side_effect = None
-        mock_response.status_code = 404
+        mock_response.status_code = status_code
         return mock_response
 
-    def buildMockSuccessDisabledResponse(self):
-        mock_response_data = {
-            "approved_revision": {
-                "enabled": False,
-                "enabled_states": [{"creator": {"email": "dev@example.com"}}],
-            }
+    def buildApprovedRevision(self, enabled=True, revision_id=1):
+        return {
+            "id": revision_id,
+            "enabled": enabled,
+            "enabled_states": [{"creator": {"email": "dev@example.com"}}],
         }
-        mock_response = mock.Mock()
-        mock_response.json = mock.Mock()
-        mock_response.json.return_value = mock_response_data
-        mock_response.raise_for_status = mock.Mock()
-        mock_response.raise_for_status.side_effect = None
-        mock_response.status_code = 200
-        return mock_response
 
-    def setUpMockNormandyFailWithSpecifiedID(self, normandy_id):
+    def buildMockSuccessEnabledResponse(self):
+        return self.buildMockResponse(
+            {"approved_revision": self.buildApprovedRevision(enabled=True)}
+        )
 
-        def determine_response(url):
-            if normandy_id in url:
-                return self.buildMockFailedResponse()
-            else:
-                return self.buildMockSuccessEnabledResponse()
+    def buildMockRecipeListResponse(
+        self, approved_revisions, count=None, next_url=None
+    ):
+        results = [
+            {"id": recipe_id, "approved_revision": approved_revision}
+            for recipe_id, approved_revision in approved_revisions.items()
+        ]
+        return self.buildMockResponse(
+            {
+                "count": len(results) if count is None else count,
+                "next": next_url,
+                "previous": None,
+                "results": results,
+            }
+        )
 
-        self.mock_normandy_requests_get.side_effect = determine_response
+    def setUpMockNormandyRecipes(self, approved_revisions):
+        response = self.buildMockRecipeListResponse(approved_revisions)
+        self.mock_normandy_requests_get.return_value = response
 
 
 class MockBugzillaMixin(object):
 
     def setUp(self):
         super().setUp()
+        # Start every test with an unused rate limit window
+        cache.clear()
 
         mock_bugzilla_requests_post_patcher = mock.patch(
-            "experimenter.experiments.bugzilla.requests.post"
+            "experimenter.experiments.bugzilla.session.post"
         )
         self.mock_bugzilla_requests_post = (
             mock_bugzilla_requests_post_patcher.start()
@@ -88,7 +86,7 @@ class MockBugzillaMixin(object):
             self.buildMockSuccessResponse()
         )
         mock_bugzilla_requests_put_patcher = mock.patch(
-            "experimenter.experiments.bugzilla.requests.put"
+            "experimenter.experiments.bugzilla.session.put"
         )
 
         self.mock_bugzilla_requests_put = (
@@ -100,7 +98,7 @@ class MockBugzillaMixin(object):
         )
 
         mock_bugzilla_requests_get_patcher = mock.patch(
-            "experimenter.experiments.bugzilla.requests.get"
+            "experimenter.experiments.bugzilla.session.get"
         )
 
         self.mock_bugzilla_requests_get = (
@@ -4,7 +4,11 @@ from django.urls import reverse
 from django.test import TestCase
 
 from experimenter.experiments.admin import ExperimentAdmin
-from experimenter.experiments.tests.factories import ExperimentFactory
+from experimenter.experiments.models import Experiment
+from experimenter.experiments.tests.factories import (
+    ExperimentFactory,
+    ExperimentVariantFactory,
+)
 from experimenter.openidc.tests.factories import UserFactory
 
 
@@ -35,3 +39,17 @@ class ExperimentAdminTest(TestCase):
             **{settings.OPENIDC_EMAIL_HEADER: user.email},
         )
         self.assertEqual(response.status_code, 200)
+
+    def test_save_related_stores_readiness_with_saved_variants(self):
+        experiment = ExperimentFactory.create()
+        form = mock.Mock(instance=experiment)
+        formset = mock.Mock()
+        formset.save.side_effect = lambda: ExperimentVariantFactory.create(
+            experiment=experiment
+        )
+
+        experiment_admin = ExperimentAdmin(Experiment, mock.Mock())
+        experiment_admin.save_related(mock.Mock(), form, [formset], True)
+
+        stored = Experiment.objects.get(id=experiment.id).readiness
+        self.assertTrue(stored & Experiment.READINESS_VARIANTS)
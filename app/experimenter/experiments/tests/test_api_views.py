@@ -1,19 +1,38 @@
+import csv
+import io
 import json
 
+import mock
+
 from django.conf import settings
-from django.core import mail
 from django.test import TestCase
 from django.urls import reverse
 
-from experimenter.experiments.models import Experiment
+from experimenter.experiments.api_views import (
+    ExperimentExportView,
+    ExperimentListView,
+)
+from experimenter.experiments.models import Experiment, ExperimentChangeLog
 from experimenter.experiments.serializers import (
     ExperimentSerializer,
     ExperimentRecipeSerializer,
 )
 from experimenter.experiments.tests.factories import ExperimentFactory
+from experimenter.openidc.tests.factories import UserFactory
 from experimenter.projects.tests.factories import ProjectFactory
 
 
+def serialize_listed(experiments):
+    """Serialize experiments the way the list view reads them, with the
+    variants in a fixed order."""
+    return ExperimentSerializer(
+        experiments.order_by("id").prefetch_related(
+            *ExperimentListView.prefetches
+        ),
+        many=True,
+    ).data
+
+
 class TestExperimentListView(TestCase):
 
     def test_list_view_serializes_experiments(self):
@@ -28,9 +47,7 @@ class TestExperimentListView(TestCase):
 
         json_data = json.loads(response.content)
 
-        serialized_experiments = ExperimentSerializer(
-            Experiment.objects.all(), many=True
-        ).data
+        serialized_experiments = serialize_listed(Experiment.objects.all())
 
         self.assertEqual(serialized_experiments, json_data)
 
@@ -56,9 +73,7 @@ class TestExperimentListView(TestCase):
 
         json_data = json.loads(response.content)
 
-        serialized_experiments = ExperimentSerializer(
-            project.experiments.all(), many=True
-        ).data
+        serialized_experiments = serialize_listed(project.experiments.all())
 
         self.assertEqual(serialized_experiments, json_data)
 
@@ -84,13 +99,194 @@ class TestExperimentListView(TestCase):
 
         json_data = json.loads(response.content)
 
-        serialized_experiments = ExperimentSerializer(
-            Experiment.objects.filter(status=Experiment.STATUS_REVIEW),
-            many=True,
-        ).data
+        serialized_experiments = serialize_listed(
+            Experiment.objects.filter(status=Experiment.STATUS_REVIEW)
+        )
 
         self.assertEqual(serialized_experiments, json_data)
 
+    def test_list_view_query_count_does_not_depend_on_experiment_count(self):
+        ExperimentFactory.create_with_variants()
+
+        with self.assertNumQueries(4):
+            self.client.get(reverse("experiments-api-list"))
+
+        for i in range(5):
+            ExperimentFactory.create_with_variants()
+
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse("experiments-api-list"))
+
+        self.assertEqual(len(json.loads(response.content)), 6)
+
+    def test_list_view_paginates_with_cursor_when_page_size_given(self):
+        experiments = [
+            ExperimentFactory.create_with_variants() for i in range(3)
+        ]
+
+        response = self.client.get(
+            reverse("experiments-api-list"), {"page_size": 2}
+        )
+        self.assertEqual(response.status_code, 200)
+        json_data = json.loads(response.content)
+
+        self.assertEqual(
+            [experiment["slug"] for experiment in json_data["results"]],
+            [experiment.slug for experiment in experiments[:2]],
+        )
+        self.assertIsNone(json_data["previous"])
+
+        response = self.client.get(json_data["next"])
+        json_data = json.loads(response.content)
+
+        self.assertEqual(
+            [experiment["slug"] for experiment in json_data["results"]],
+            [experiments[2].slug],
+        )
+        self.assertIsNone(json_data["next"])
+
+    def test_list_view_serializes_requested_fields(self):
+        experiment = ExperimentFactory.create_with_variants()
+
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse("experiments-api-list"), {"fields": "slug,variants"}
+            )
+
+        json_data = json.loads(response.content)
+        serialized_experiment = ExperimentSerializer(experiment).data
+
+        self.assertEqual(
+            json_data,
+            [
+                {
+                    "slug": serialized_experiment["slug"],
+                    "variants": serialized_experiment["variants"],
+                }
+            ],
+        )
+
+
+class TestExperimentReadinessView(TestCase):
+
+    def setUp(self):
+        self.ready = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW,
+            review_science=True,
+            review_engineering=True,
+            review_qa_requested=True,
+            review_intent_to_ship=True,
+            review_bugzilla=True,
+            review_qa=True,
+            review_relman=True,
+        )
+        self.draft = ExperimentFactory.create()
+
+    def test_list_view_filters_by_readiness(self):
+        response = self.client.get(
+            reverse("experiments-api-list"),
+            {"readiness": Experiment.READINESS_READY_TO_LAUNCH},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        json_data = json.loads(response.content)
+
+        self.assertEqual([e["slug"] for e in json_data], [self.ready.slug])
+
+    def test_view_counts_experiments_by_readiness(self):
+        response = self.client.get(reverse("experiments-api-readiness"))
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(
+            json.loads(response.content),
+            {
+                Experiment.READINESS_READY_TO_LAUNCH: 1,
+                Experiment.READINESS_MISSING_REVIEWS: 1,
+                Experiment.READINESS_INCOMPLETE_SECTIONS: 1,
+            },
+        )
+
+    def test_view_counts_filtered_experiments(self):
+        response = self.client.get(
+            reverse("experiments-api-readiness"),
+            {"status": Experiment.STATUS_REVIEW},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(
+            json.loads(response.content),
+            {
+                Experiment.READINESS_READY_TO_LAUNCH: 1,
+                Experiment.READINESS_MISSING_REVIEWS: 0,
+                Experiment.READINESS_INCOMPLETE_SECTIONS: 0,
+            },
+        )
+
+
+class TestExperimentExportView(TestCase):
+
+    def test_ndjson_export_streams_serialized_experiments(self):
+        experiments = [
+            ExperimentFactory.create_with_variants() for i in range(5)
+        ]
+
+        with mock.patch.object(ExperimentExportView, "chunk_size", 2):
+            response = self.client.get(
+                reverse(
+                    "experiments-api-export",
+                    kwargs={"export_format": "ndjson"},
+                )
+            )
+
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.streaming)
+            self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+            # four queries for each of the three chunks, and a last
+            # query that finds no more experiments
+            with self.assertNumQueries(13):
+                lines = b"".join(response.streaming_content).splitlines()
+
+        self.assertEqual(
+            [json.loads(line) for line in lines],
+            json.loads(
+                json.dumps(
+                    serialize_listed(
+                        Experiment.objects.filter(
+                            id__in=[
+                                experiment.id for experiment in experiments
+                            ]
+                        )
+                    )
+                )
+            ),
+        )
+
+    def test_csv_export_streams_requested_fields(self):
+        experiment = ExperimentFactory.create_with_variants()
+        experiment.status = Experiment.STATUS_REVIEW
+        experiment.save()
+        ExperimentFactory.create_with_variants()
+
+        response = self.client.get(
+            reverse("experiments-api-export", kwargs={"export_format": "csv"}),
+            {"status": Experiment.STATUS_REVIEW, "fields": "slug,variants"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv")
+
+        content = b"".join(response.streaming_content).decode()
+        rows = list(csv.reader(io.StringIO(content)))
+        variants = serialize_listed(
+            Experiment.objects.filter(id=experiment.id)
+        )[0]["variants"]
+
+        self.assertEqual(
+            rows,
+            [["slug", "variants"], [experiment.slug, json.dumps(variants)]],
+        )
+
 
 class TestExperimentDetailView(TestCase):
 
@@ -129,6 +325,38 @@ class TestExperimentRecipeView(TestCase):
         serialized_experiment = ExperimentRecipeSerializer(experiment).data
         self.assertEqual(serialized_experiment, json_data)
 
+    def test_get_experiment_recipe_returns_not_modified_for_matching_etag(
+        self
+    ):
+        user_email = "user@example.com"
+        experiment = ExperimentFactory.create_with_variants()
+        url = reverse(
+            "experiments-api-recipe", kwargs={"slug": experiment.slug}
+        )
+
+        response = self.client.get(
+            url, **{settings.OPENIDC_EMAIL_HEADER: user_email}
+        )
+        etag = response["ETag"]
+
+        response = self.client.get(
+            url,
+            HTTP_IF_NONE_MATCH=etag,
+            **{settings.OPENIDC_EMAIL_HEADER: user_email},
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+        experiment.save()
+
+        response = self.client.get(
+            url,
+            HTTP_IF_NONE_MATCH=etag,
+            **{settings.OPENIDC_EMAIL_HEADER: user_email},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
 
 class TestExperimentAcceptView(TestCase):
 
@@ -214,27 +442,32 @@ class TestExperimentRejectView(TestCase):
 
 class TestExperimentSendIntentToShipEmailView(TestCase):
 
-    def test_put_to_view_sends_email(self):
-        user_email = "user@example.com"
+    def test_put_to_view_queues_email(self):
+        user = UserFactory.create()
 
         experiment = ExperimentFactory.create_with_variants(
             review_intent_to_ship=False, status=Experiment.STATUS_REVIEW
         )
-        old_outbox_len = len(mail.outbox)
 
-        response = self.client.put(
-            reverse(
-                "experiments-api-send-intent-to-ship-email",
-                kwargs={"slug": experiment.slug},
-            ),
-            **{settings.OPENIDC_EMAIL_HEADER: user_email},
-        )
+        with mock.patch(
+            "experimenter.experiments.api_views.tasks.queue_experiment_emails"
+        ) as mock_queue_emails:
+            response = self.client.put(
+                reverse(
+                    "experiments-api-send-intent-to-ship-email",
+                    kwargs={"slug": experiment.slug},
+                ),
+                **{settings.OPENIDC_EMAIL_HEADER: user.email},
+            )
 
         self.assertEqual(response.status_code, 200)
 
         experiment = Experiment.objects.get(pk=experiment.pk)
-        self.assertEqual(experiment.review_intent_to_ship, True)
-        self.assertEqual(len(mail.outbox), old_outbox_len + 1)
+        self.assertFalse(experiment.review_intent_to_ship)
+        mock_queue_emails.assert_called_once_with(
+            [(experiment.id, Experiment.INTENT_TO_SHIP_EMAIL_LABEL)],
+            user_id=user.id,
+        )
 
     def test_put_raises_409_if_email_already_sent(self):
         experiment = ExperimentFactory.create_with_variants(
@@ -274,3 +507,196 @@ class TestExperimentCloneView(TestCase):
         self.assertEqual(
             response.json()["clone_url"], "/experiments/best-experiment/"
         )
+
+
+class TestExperimentBatchCloneView(TestCase):
+
+    def post_clones(self, clones):
+        return self.client.post(
+            reverse("experiments-api-batch-clone"),
+            json.dumps(clones),
+            content_type="application/json",
+            **{settings.OPENIDC_EMAIL_HEADER: "user@example.com"},
+        )
+
+    def test_post_clones_each_experiment(self):
+        experiment1 = ExperimentFactory.create_with_variants()
+        experiment2 = ExperimentFactory.create_with_variants()
+
+        response = self.post_clones(
+            [
+                {"experiment": experiment1.slug, "name": "copy 1"},
+                {"experiment": experiment1.slug, "name": "copy 2"},
+                {"experiment": experiment2.slug, "name": "copy 3"},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            response.json(),
+            [
+                {"name": "copy 1", "clone_url": "/experiments/copy-1/"},
+                {"name": "copy 2", "clone_url": "/experiments/copy-2/"},
+                {"name": "copy 3", "clone_url": "/experiments/copy-3/"},
+            ],
+        )
+        self.assertEqual(
+            list(
+                Experiment.objects.filter(parent=experiment1)
+                .order_by("name")
+                .values_list("name", "owner__email")
+            ),
+            [("copy 1", "user@example.com"), ("copy 2", "user@example.com")],
+        )
+        self.assertEqual(
+            Experiment.objects.get(parent=experiment2).variants.count(),
+            experiment2.variants.count(),
+        )
+
+    def test_post_rejects_repeated_names(self):
+        experiment = ExperimentFactory.create()
+
+        response = self.post_clones(
+            [
+                {"experiment": experiment.slug, "name": "copy"},
+                {"experiment": experiment.slug, "name": "Copy"},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Experiment.objects.filter(parent=experiment))
+
+    def test_post_rejects_whole_batch_when_one_clone_is_invalid(self):
+        experiment = ExperimentFactory.create()
+
+        response = self.post_clones(
+            [
+                {"experiment": experiment.slug, "name": "copy"},
+                {"experiment": "not-an-experiment", "name": "other copy"},
+                {"experiment": experiment.slug, "name": experiment.name},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(),
+            [
+                {},
+                {
+                    "experiment": [
+                        "Object with slug=not-an-experiment does not exist."
+                    ]
+                },
+                {"name": ["Experiment with this name already exists."]},
+            ],
+        )
+        self.assertFalse(Experiment.objects.filter(parent=experiment))
+
+
+class TestExperimentBulkTransitionView(TestCase):
+
+    def post_transition(self, data):
+        return self.client.post(
+            reverse("experiments-api-bulk-transition"),
+            json.dumps(data),
+            content_type="application/json",
+            **{settings.OPENIDC_EMAIL_HEADER: "user@example.com"},
+        )
+
+    def test_post_transitions_each_valid_experiment(self):
+        in_review = [
+            ExperimentFactory.create_with_status(Experiment.STATUS_REVIEW)
+            for i in range(2)
+        ]
+        live = ExperimentFactory.create_with_status(Experiment.STATUS_LIVE)
+
+        response = self.post_transition(
+            {
+                "slugs": [
+                    in_review[0].slug,
+                    live.slug,
+                    "not-an-experiment",
+                    in_review[1].slug,
+                    in_review[0].slug,
+                ],
+                "status": Experiment.STATUS_REJECTED,
+                "message": "Not this cycle",
+            }
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            [
+                {
+                    "slug": in_review[0].slug,
+                    "status": Experiment.STATUS_REJECTED,
+                },
+                {
+                    "slug": live.slug,
+                    "status": Experiment.STATUS_LIVE,
+                    "error": "invalid-transition",
+                },
+                {"slug": "not-an-experiment", "error": "not-found"},
+                {
+                    "slug": in_review[1].slug,
+                    "status": Experiment.STATUS_REJECTED,
+                },
+            ],
+        )
+
+        for experiment in in_review:
+            experiment = Experiment.objects.get(id=experiment.id)
+            change = experiment.changes.latest()
+
+            self.assertEqual(experiment.status, Experiment.STATUS_REJECTED)
+            self.assertEqual(experiment.latest_change, change.changed_on)
+            self.assertEqual(change.old_status, Experiment.STATUS_REVIEW)
+            self.assertEqual(change.new_status, Experiment.STATUS_REJECTED)
+            self.assertEqual(change.changed_by.email, "user@example.com")
+            self.assertEqual(change.message, "Not this cycle")
+
+        self.assertEqual(
+            Experiment.objects.get(id=live.id).status, Experiment.STATUS_LIVE
+        )
+
+    def test_post_query_count_does_not_grow_with_experiments(self):
+        UserFactory.create(email="user@example.com")
+        slugs = [
+            ExperimentFactory.create_with_status(Experiment.STATUS_SHIP).slug
+            for i in range(5)
+        ]
+
+        with self.assertNumQueries(6):
+            response = self.post_transition(
+                {"slugs": slugs, "status": Experiment.STATUS_ACCEPTED}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            Experiment.objects.filter(
+                status=Experiment.STATUS_ACCEPTED
+            ).count(),
+            5,
+        )
+        self.assertEqual(
+            ExperimentChangeLog.objects.filter(
+                new_status=Experiment.STATUS_ACCEPTED, message=None
+            ).count(),
+            5,
+        )
+
+    def test_post_rejects_other_statuses(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_ACCEPTED
+        )
+
+        response = self.post_transition(
+            {"slugs": [experiment.slug], "status": Experiment.STATUS_LIVE}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            Experiment.objects.get(id=experiment.id).status,
+            Experiment.STATUS_ACCEPTED,
+        )
@@ -1,11 +1,11 @@
 import mock
-import requests
 from django.test import TestCase
 from django.conf import settings
 
 from experimenter.experiments.models import Experiment
 from experimenter.experiments.bugzilla import (
     BugzillaError,
+    BugzillaRateLimited,
     create_experiment_bug,
     format_bug_body,
     make_bugzilla_call,
@@ -14,7 +14,10 @@ from experimenter.experiments.bugzilla import (
     set_bugzilla_id_value,
     update_bug_resolution,
     add_experiment_comment,
+    session,
+    user_exists,
 )
+from experimenter.experiments.http_client import RateLimitExceeded
 from experimenter.experiments.tests.factories import ExperimentFactory
 from experimenter.experiments.tests.mixins import MockBugzillaMixin
 
@@ -225,6 +228,48 @@ class TestUpdateExperimentBug(MockBugzillaMixin, TestCase):
             {"summary": summary, "cf_user_story": format_bug_body(experiment)},
         )
 
+    def test_update_skipped_when_body_unchanged(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT, bugzilla_id="123"
+        )
+
+        self.assertTrue(update_experiment_bug(experiment))
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertFalse(update_experiment_bug(experiment))
+        self.assertEqual(self.mock_bugzilla_requests_put.call_count, 1)
+
+    def test_update_sent_again_when_body_or_bug_changes(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT, bugzilla_id="123"
+        )
+        update_experiment_bug(experiment)
+
+        experiment.name = "A Renamed Experiment"
+        self.assertTrue(update_experiment_bug(experiment))
+
+        experiment.bugzilla_id = "456"
+        self.assertTrue(update_experiment_bug(experiment))
+
+        self.assertEqual(self.mock_bugzilla_requests_put.call_count, 3)
+        self.assertEqual(
+            Experiment.objects.get(id=experiment.id).bugzilla_body_hash,
+            experiment.bugzilla_body_hash,
+        )
+
+    def test_failed_update_is_sent_again(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT, bugzilla_id="123"
+        )
+        self.mock_bugzilla_requests_put.side_effect = ValueError()
+
+        with self.assertRaises(BugzillaError):
+            update_experiment_bug(experiment)
+
+        self.assertIsNone(
+            Experiment.objects.get(id=experiment.id).bugzilla_body_hash
+        )
+
 
 class TestUpdateBugzillaResolution(MockBugzillaMixin, TestCase):
 
@@ -329,14 +374,14 @@ class TestMakeBugzillaCall(MockBugzillaMixin, TestCase):
         mock_response.status_code = 400
         self.mock_bugzilla_requests_post.return_value = mock_response
 
-        response_data = make_bugzilla_call("/url/", requests.post, data={})
+        response_data = make_bugzilla_call("/url/", session.post, data={})
         self.assertEqual(response_data, mock_response_data)
 
     def test_json_parse_error_raises_bugzilla_error(self):
         self.mock_bugzilla_requests_post.side_effect = ValueError()
 
         with self.assertRaises(BugzillaError):
-            make_bugzilla_call("/url/", requests.post, data={})
+            make_bugzilla_call("/url/", session.post, data={})
 
 
 class TestMakePutBugzillaCall(MockBugzillaMixin, TestCase):
@@ -349,10 +394,68 @@ class TestMakePutBugzillaCall(MockBugzillaMixin, TestCase):
         mock_response.status_code = 400
         self.mock_bugzilla_requests_put.return_value = mock_response
 
-        response_data = make_bugzilla_call("/url/", requests.put, data={})
+        response_data = make_bugzilla_call("/url/", session.put, data={})
         self.assertEqual(response_data, mock_response_data)
 
     def test_json_parse_error_raises_bugzilla_error(self):
         self.mock_bugzilla_requests_put.side_effect = ValueError()
         with self.assertRaises(BugzillaError):
-            make_bugzilla_call("/url/", requests.put, data={})
+            make_bugzilla_call("/url/", session.put, data={})
+
+
+class TestRateLimitedBugzillaCall(MockBugzillaMixin, TestCase):
+
+    def test_throttled_call_is_not_sent(self):
+        with mock.patch(
+            "experimenter.experiments.bugzilla.rate_limiter.acquire",
+            side_effect=RateLimitExceeded(2.5),
+        ):
+            with self.assertRaises(BugzillaRateLimited) as e:
+                make_bugzilla_call("/url/", session.put, data={})
+
+        self.assertEqual(e.exception.retry_after, 2.5)
+        self.mock_bugzilla_requests_put.assert_not_called()
+
+    def test_calls_share_the_rate_limit(self):
+        with mock.patch(
+            "experimenter.experiments.bugzilla.rate_limiter.rate", 2
+        ):
+            make_bugzilla_call("/url/", session.put, data={})
+            make_bugzilla_call("/url/", session.post, data={})
+
+            with self.assertRaises(BugzillaRateLimited):
+                make_bugzilla_call("/url/", session.put, data={})
+
+        self.assertEqual(self.mock_bugzilla_requests_put.call_count, 1)
+
+    def test_too_many_requests_response_is_rate_limited(self):
+        mock_response = mock.Mock()
+        mock_response.status_code = 429
+        mock_response.headers = {"Retry-After": "30"}
+        self.mock_bugzilla_requests_put.return_value = mock_response
+
+        with self.assertRaises(BugzillaRateLimited) as e:
+            make_bugzilla_call("/url/", session.put, data={})
+
+        self.assertEqual(e.exception.retry_after, 30)
+
+    def test_too_many_requests_without_retry_after_waits_a_period(self):
+        mock_response = mock.Mock()
+        mock_response.status_code = 429
+        mock_response.headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00"}
+        self.mock_bugzilla_requests_put.return_value = mock_response
+
+        with self.assertRaises(BugzillaRateLimited) as e:
+            make_bugzilla_call("/url/", session.put, data={})
+
+        self.assertEqual(
+            e.exception.retry_after, settings.BUGZILLA_RATE_LIMIT_PERIOD
+        )
+
+    def test_rate_limited_user_lookup_is_not_a_missing_user(self):
+        with mock.patch(
+            "experimenter.experiments.bugzilla.rate_limiter.acquire",
+            side_effect=RateLimitExceeded(1),
+        ):
+            with self.assertRaises(BugzillaRateLimited):
+                user_exists("dev@example.com")
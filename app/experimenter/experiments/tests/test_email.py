@@ -1,12 +1,16 @@
+import mock
 from django.test import TestCase
 from django.conf import settings
 from django.core import mail
 
 from experimenter.experiments.email import (
-    send_intent_to_ship_email,
-    send_experiment_launch_email,
+    EMAILS,
+    ExperimentEmailsError,
+    send_experiment_emails,
 )
+from experimenter.experiments.models import Experiment, ExperimentEmail
 from experimenter.experiments.tests.factories import ExperimentFactory
+from experimenter.openidc.tests.factories import UserFactory
 
 
 class TestIntentToShipEmail(TestCase):
@@ -23,7 +27,9 @@ class TestIntentToShipEmail(TestCase):
             firefox_min_version="56.0",
             firefox_max_version="",
         )
-        send_intent_to_ship_email(experiment.id)
+        send_experiment_emails(
+            [(experiment.id, Experiment.INTENT_TO_SHIP_EMAIL_LABEL)]
+        )
 
         sent_email = mail.outbox[-1]
         self.verify_subject(experiment, sent_email)
@@ -81,7 +87,9 @@ Thank you!!
             firefox_min_version="56.0",
             firefox_max_version="",
         )
-        send_intent_to_ship_email(experiment.id)
+        send_experiment_emails(
+            [(experiment.id, Experiment.INTENT_TO_SHIP_EMAIL_LABEL)]
+        )
 
         sent_email = mail.outbox[-1]
         self.verify_subject(experiment, sent_email)
@@ -169,10 +177,156 @@ class TestLaunchEmail(TestCase):
             firefox_max_version="69.0",
             firefox_channel="Nightly",
         )
-        send_experiment_launch_email(experiment)
+        send_experiment_emails([(experiment.id, Experiment.EXPERIMENT_STARTS)])
 
         sent_email = mail.outbox[-1]
         self.assertEqual(
             sent_email.subject,
             "Experiment launched: Greatest Experiment 68.0 to 69.0 Nightly",
         )
+
+
+class TestSendExperimentEmails(TestCase):
+
+    def test_sends_batch_over_one_connection(self):
+        experiment1 = ExperimentFactory.create_with_variants()
+        experiment2 = ExperimentFactory.create_with_variants()
+        subscriber = UserFactory.create()
+        experiment2.subscribers.add(subscriber)
+
+        with mock.patch(
+            "experimenter.experiments.email.get_connection",
+            wraps=mail.get_connection,
+        ) as mock_get_connection:
+            send_experiment_emails(
+                [
+                    (experiment1.id, Experiment.INTENT_TO_SHIP_EMAIL_LABEL),
+                    (experiment2.id, Experiment.EXPERIMENT_STARTS),
+                ]
+            )
+
+        mock_get_connection.assert_called_once_with(fail_silently=False)
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(
+            mail.outbox[1].cc, [experiment2.owner.email, subscriber.email]
+        )
+        self.assertEqual(
+            set(ExperimentEmail.objects.values_list("experiment", "type")),
+            set(
+                [
+                    (experiment1.id, Experiment.INTENT_TO_SHIP_EMAIL_LABEL),
+                    (experiment2.id, Experiment.EXPERIMENT_STARTS),
+                ]
+            ),
+        )
+
+    def test_records_only_emails_sent_before_a_failure(self):
+        experiment1 = ExperimentFactory.create_with_variants()
+        experiment2 = ExperimentFactory.create_with_variants()
+
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=[1, OSError()],
+        ):
+            with self.assertRaises(ExperimentEmailsError) as e:
+                send_experiment_emails(
+                    [
+                        (experiment1.id, Experiment.EXPERIMENT_STARTS),
+                        (experiment2.id, Experiment.EXPERIMENT_STARTS),
+                    ]
+                )
+
+        self.assertEqual(
+            e.exception.unsent_emails,
+            [(experiment2.id, Experiment.EXPERIMENT_STARTS)],
+        )
+        self.assertEqual(
+            list(ExperimentEmail.objects.values_list("experiment", "type")),
+            [(experiment1.id, Experiment.EXPERIMENT_STARTS)],
+        )
+
+    def test_sets_review_intent_to_ship_once_sent(self):
+        experiment = ExperimentFactory.create_with_variants(
+            review_intent_to_ship=False
+        )
+        emails = [(experiment.id, Experiment.INTENT_TO_SHIP_EMAIL_LABEL)]
+
+        send_experiment_emails(emails)
+        send_experiment_emails(emails)
+
+        self.assertEqual(len(mail.outbox), 1)
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertTrue(experiment.review_intent_to_ship)
+        self.assertEqual(experiment.readiness, experiment.compute_readiness())
+
+    def test_sends_intent_to_ship_once_from_the_same_snapshot(self):
+        experiment = ExperimentFactory.create_with_variants(
+            review_intent_to_ship=False
+        )
+
+        send_experiment_emails(
+            [(experiment.id, Experiment.INTENT_TO_SHIP_EMAIL_LABEL)] * 2
+        )
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(ExperimentEmail.objects.count(), 1)
+
+    def test_intent_to_ship_keeps_edits_made_while_sending(self):
+        experiment = ExperimentFactory.create_with_variants(
+            review_intent_to_ship=False
+        )
+        render_email = EMAILS[Experiment.INTENT_TO_SHIP_EMAIL_LABEL]
+
+        def edit_and_render(experiment):
+            Experiment.objects.filter(id=experiment.id).update(
+                name="Edited name"
+            )
+            return render_email(experiment)
+
+        with mock.patch.dict(
+            EMAILS, {Experiment.INTENT_TO_SHIP_EMAIL_LABEL: edit_and_render}
+        ):
+            send_experiment_emails(
+                [(experiment.id, Experiment.INTENT_TO_SHIP_EMAIL_LABEL)]
+            )
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(experiment.name, "Edited name")
+        self.assertTrue(experiment.review_intent_to_ship)
+
+    def test_failed_intent_to_ship_leaves_review_unset(self):
+        experiment = ExperimentFactory.create_with_variants(
+            review_intent_to_ship=False
+        )
+
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=OSError(),
+        ):
+            with self.assertRaises(ExperimentEmailsError):
+                send_experiment_emails(
+                    [(experiment.id, Experiment.INTENT_TO_SHIP_EMAIL_LABEL)]
+                )
+
+        self.assertFalse(
+            Experiment.objects.get(id=experiment.id).review_intent_to_ship
+        )
+
+    def test_skips_deleted_experiments(self):
+        experiment = ExperimentFactory.create_with_variants()
+        deleted_experiment = ExperimentFactory.create_with_variants()
+        deleted_id = deleted_experiment.id
+        deleted_experiment.delete()
+
+        send_experiment_emails(
+            [
+                (deleted_id, Experiment.EXPERIMENT_STARTS),
+                (experiment.id, Experiment.EXPERIMENT_STARTS),
+            ]
+        )
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(
+            list(ExperimentEmail.objects.values_list("experiment", "type")),
+            [(experiment.id, Experiment.EXPERIMENT_STARTS)],
+        )
@@ -2,6 +2,8 @@ import datetime
 import decimal
 import json
 
+import mock
+
 from django import forms
 from django.conf import settings
 from django.core.exceptions import ValidationError
@@ -487,6 +489,25 @@ class TestExperimentVariantsBaseForm(MockRequestMixin, TestCase):
             branch2.description, self.data["variants-2-description"]
         )
 
+    def test_form_stores_readiness_once_with_saved_variants(self):
+        form = self.form_class(
+            request=self.request, data=self.data, instance=self.experiment
+        )
+
+        self.assertTrue(form.is_valid())
+
+        with mock.patch.object(
+            Experiment,
+            "compute_readiness",
+            autospec=True,
+            side_effect=Experiment.compute_readiness,
+        ) as compute_readiness:
+            experiment = form.save()
+
+        compute_readiness.assert_called_once_with(experiment)
+        stored = Experiment.objects.get(id=experiment.id).readiness
+        self.assertTrue(stored & Experiment.READINESS_VARIANTS)
+
     def test_formset_edits_existing_variants(self):
         form = self.form_class(
             request=self.request, data=self.data, instance=self.experiment
@@ -1527,7 +1548,7 @@ class TestExperimentStatusForm(
             "pref-experiment-slug-nightly-57.0-bug-12345",
         )
         self.mock_tasks_update_experiment_bug.delay.assert_called_with(
-            self.user.id, experiment.id
+            self.user.id, experiment.id, coalesce_token=mock.ANY
         )
 
 
@@ -0,0 +1,216 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import markus
+import mock
+import requests
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from markus.testing import MetricsMock
+
+from experimenter.experiments.http_client import (
+    APISession,
+    FixedWindowRateLimiter,
+    RateLimitExceeded,
+)
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Responds with 503 until it has failed `failures` times."""
+
+    failures = 0
+    requests_served = 0
+
+    def respond(self):
+        FlakyHandler.requests_served += 1
+        if FlakyHandler.requests_served <= FlakyHandler.failures:
+            self.send_response(503)
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = respond
+    do_POST = respond
+
+    def log_message(self, *args):
+        pass
+
+
+@override_settings(HTTP_CLIENT_RETRIES=2, HTTP_CLIENT_RETRY_BACKOFF=0)
+class TestAPISessionRetries(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        FlakyHandler.requests_served = 0
+        self.server = HTTPServer(("127.0.0.1", 0), FlakyHandler)
+        threading.Thread(target=self.server.serve_forever).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = "http://127.0.0.1:{}/".format(self.server.server_port)
+
+    def test_get_is_retried_on_server_error(self):
+        FlakyHandler.failures = 2
+
+        response = APISession("test").get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(FlakyHandler.requests_served, 3)
+
+    def test_last_error_response_returned_when_retries_run_out(self):
+        FlakyHandler.failures = 5
+
+        response = APISession("test").get(self.url)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(FlakyHandler.requests_served, 3)
+
+    def test_post_is_not_retried_on_server_error(self):
+        FlakyHandler.failures = 1
+
+        response = APISession("test").post(self.url)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(FlakyHandler.requests_served, 1)
+
+
+class TestAPISession(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        mock_request_patcher = mock.patch(
+            "experimenter.experiments.http_client.requests.Session.request"
+        )
+        self.mock_request = mock_request_patcher.start()
+        self.addCleanup(mock_request_patcher.stop)
+        self.mock_request.return_value = mock.Mock(status_code=200)
+
+        self.session = APISession("test", pool_maxsize=4)
+
+    @override_settings(HTTP_CLIENT_TIMEOUT=3)
+    def test_request_uses_default_timeout(self):
+        self.session.get("/url/")
+
+        self.mock_request.assert_called_with(
+            "GET", "/url/", allow_redirects=True, timeout=3
+        )
+
+    def test_request_keeps_explicit_timeout(self):
+        self.session.put("/url/", {"a": 1}, timeout=1)
+
+        self.mock_request.assert_called_with(
+            "PUT", "/url/", data={"a": 1}, timeout=1
+        )
+
+    def test_adapters_are_mounted_once_per_process(self):
+        self.session.get("/url/")
+        adapter = self.session.get_adapter("https://example.com")
+        self.assertEqual(adapter._pool_maxsize, 4)
+
+        self.session.get("/url/")
+        self.assertIs(self.session.get_adapter("https://example.com"), adapter)
+
+        with mock.patch("experimenter.experiments.http_client.os.getpid") as (
+            mock_getpid
+        ):
+            mock_getpid.return_value = -1
+            self.session.get("/url/")
+
+        self.assertIsNot(
+            self.session.get_adapter("https://example.com"), adapter
+        )
+
+    def test_request_timing_is_recorded(self):
+        with MetricsMock() as mm:
+            self.session.post("/url/")
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.TIMING,
+                    "experiments.test.request.timing",
+                    tags=["method:POST", "status:200"],
+                )
+            )
+
+    def test_request_error_is_counted_and_raised(self):
+        self.mock_request.side_effect = requests.exceptions.ConnectionError()
+
+        with MetricsMock() as mm:
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                self.session.get("/url/")
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.test.request.error",
+                    value=1,
+                    tags=["method:GET"],
+                )
+            )
+
+
+class TestRateLimiter(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.rate_limiter = FixedWindowRateLimiter("api", 2, 10)
+
+        mock_time_patcher = mock.patch(
+            "experimenter.experiments.http_client.time.time",
+            return_value=1004.0,
+        )
+        self.mock_time = mock_time_patcher.start()
+        self.addCleanup(mock_time_patcher.stop)
+
+    def acquire(self):
+        try:
+            self.rate_limiter.acquire()
+        except RateLimitExceeded as e:
+            return e.retry_after
+
+    def test_callers_over_the_rate_wait_for_later_periods(self):
+        self.assertEqual(
+            [self.acquire() for i in range(6)],
+            [None, None, 6.0, 6.0, 16.0, 16.0],
+        )
+
+    def test_rate_reset_every_window(self):
+        for i in range(3):
+            self.acquire()
+
+        self.mock_time.return_value = 1010.0
+        self.assertIsNone(self.acquire())
+
+    def test_window_shared_by_name(self):
+        for i in range(2):
+            self.acquire()
+
+        self.assertEqual(
+            FixedWindowRateLimiter("other", 2, 10).acquire(), None
+        )
+        with self.assertRaises(RateLimitExceeded):
+            FixedWindowRateLimiter("api", 2, 10).acquire()
+
+    def test_saturation_and_throttling_reported(self):
+        with MetricsMock() as mm:
+            for i in range(3):
+                self.acquire()
+
+            self.assertEqual(
+                [
+                    record[2]
+                    for record in mm.filter_records(
+                        markus.GAUGE,
+                        stat="experiments.api.rate_limit.saturation",
+                    )
+                ],
+                [0.5, 1.0, 1.5],
+            )
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.api.rate_limit.throttled",
+                    value=1,
+                )
+            )
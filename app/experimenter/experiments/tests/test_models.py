@@ -2,7 +2,9 @@ import datetime
 import json
 
 from django.conf import settings
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from experimenter.openidc.tests.factories import UserFactory
@@ -13,9 +15,12 @@ from experimenter.experiments.models import (
 )
 from experimenter.experiments.serializers import ExperimentRecipeSerializer
 from experimenter.experiments.tests.factories import (
+    CountryFactory,
     ExperimentFactory,
     ExperimentChangeLogFactory,
     ExperimentCommentFactory,
+    ExperimentVariantFactory,
+    LocaleFactory,
 )
 
 
@@ -56,6 +61,25 @@ class TestExperimentManager(TestCase):
             [experiment1, experiment2],
         )
 
+    def test_queryset_does_not_aggregate_changes(self):
+        self.assertNotIn("GROUP BY", str(Experiment.objects.all().query))
+
+    def test_latest_change_is_set_for_cloned_experiment(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_LIVE
+        )
+
+        cloned_experiment = experiment.clone("Cloned", experiment.owner)
+
+        self.assertEqual(
+            Experiment.objects.get(id=cloned_experiment.id).latest_change,
+            cloned_experiment.changes.get().changed_on,
+        )
+        self.assertEqual(
+            Experiment.objects.get(id=experiment.id).latest_change,
+            experiment.changes.latest().changed_on,
+        )
+
 
 class TestExperimentModel(TestCase):
 
@@ -355,6 +379,121 @@ class TestExperimentModel(TestCase):
             recipe_json, ExperimentRecipeSerializer(experiment).data
         )
 
+    def test_normandy_recipe_is_cached_until_recipe_version_changes(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_SHIP
+        )
+        recipe = experiment.normandy_recipe
+
+        with self.assertNumQueries(0):
+            self.assertEqual(experiment.normandy_recipe, recipe)
+
+        experiment.pref_key = "new.pref.key"
+        experiment.save()
+
+        self.assertEqual(
+            experiment.normandy_recipe["arguments"]["preferenceName"],
+            "new.pref.key",
+        )
+
+    def test_saving_experiment_bumps_recipe_version(self):
+        experiment = ExperimentFactory.create()
+        version = experiment.recipe_version
+
+        experiment.save()
+
+        self.assertEqual(experiment.recipe_version, version + 1)
+        self.assertEqual(
+            Experiment.objects.get(id=experiment.id).recipe_version,
+            version + 1,
+        )
+
+    def test_changing_variants_bumps_recipe_version(self):
+        experiment = ExperimentFactory.create()
+        version = experiment.recipe_version
+
+        variant = ExperimentVariantFactory.create(experiment=experiment)
+        self.assertEqual(
+            Experiment.objects.get(id=experiment.id).recipe_version,
+            version + 1,
+        )
+
+        variant.delete()
+        self.assertEqual(
+            Experiment.objects.get(id=experiment.id).recipe_version,
+            version + 2,
+        )
+
+    def test_changing_locales_and_countries_bumps_recipe_version(self):
+        experiment = ExperimentFactory.create(locales=[], countries=[])
+        version = experiment.recipe_version
+
+        experiment.locales.add(LocaleFactory.create())
+        experiment.countries.add(CountryFactory.create())
+        experiment.countries.clear()
+
+        self.assertEqual(
+            Experiment.objects.get(id=experiment.id).recipe_version,
+            version + 3,
+        )
+
+    def test_changing_locale_experiments_bumps_recipe_version(self):
+        experiment = ExperimentFactory.create(locales=[])
+        version = experiment.recipe_version
+
+        locale = LocaleFactory.create()
+        locale.experiment_set.add(experiment)
+
+        self.assertEqual(
+            Experiment.objects.get(id=experiment.id).recipe_version,
+            version + 1,
+        )
+
+    def test_clearing_locale_experiments_bumps_recipe_version(self):
+        locale = LocaleFactory.create()
+        experiment = ExperimentFactory.create(locales=[locale])
+        version = experiment.recipe_version
+
+        locale.experiment_set.clear()
+
+        self.assertEqual(
+            Experiment.objects.get(id=experiment.id).recipe_version,
+            version + 1,
+        )
+
+    def test_deleting_locale_or_country_bumps_recipe_version(self):
+        locale = LocaleFactory.create()
+        country = CountryFactory.create()
+        experiment = ExperimentFactory.create(
+            locales=[locale], countries=[country]
+        )
+        version = experiment.recipe_version
+
+        locale.delete()
+        country.delete()
+
+        self.assertEqual(
+            Experiment.objects.get(id=experiment.id).recipe_version,
+            version + 2,
+        )
+
+    def test_saving_experiment_reads_recipe_version_only_when_used(self):
+        experiment = ExperimentFactory.create()
+        version = experiment.recipe_version
+
+        with CaptureQueriesContext(connection) as save_queries:
+            experiment.save()
+
+        self.assertFalse(
+            any(
+                query["sql"].startswith('SELECT "experiments_experiment"')
+                for query in save_queries.captured_queries
+            )
+        )
+
+        with self.assertNumQueries(1):
+            self.assertEqual(experiment.recipe_version, version + 1)
+
     def test_has_normandy_info_not_true_if_missing_normandy_info(self):
         experiment = ExperimentFactory.create(
             normandy_id=None, normandy_slug=None
@@ -416,6 +555,32 @@ class TestExperimentModel(TestCase):
             change.experiment.start_date, change.changed_on.date()
         )
 
+    def test_date_properties_read_changelog_once(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_COMPLETE
+        )
+        experiment = Experiment.objects.get(id=experiment.id)
+
+        with self.assertNumQueries(1):
+            experiment.dates
+            experiment.enrollment_dates
+            experiment.observation_dates
+
+    def test_transition_dates_are_refreshed_when_changes_are_added(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_ACCEPTED, proposed_start_date=None
+        )
+        self.assertIsNone(experiment.start_date)
+
+        experiment.changes.create(
+            changed_by=experiment.owner,
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+            changed_on=datetime.date(2019, 1, 5),
+        )
+
+        self.assertEqual(experiment.start_date, datetime.date(2019, 1, 5))
+
     def test_observation_duration_returns_duration_minus_enrollment(self):
         experiment = ExperimentFactory.create_with_variants(
             proposed_duration=20, proposed_enrollment=10
@@ -478,6 +643,80 @@ class TestExperimentModel(TestCase):
         )
         self.assertEqual(experiment.end_date, datetime.date(2019, 1, 21))
 
+    def test_save_stores_proposed_dates(self):
+        experiment = ExperimentFactory.create_with_variants(
+            proposed_start_date=datetime.date(2019, 1, 1),
+            proposed_duration=20,
+            proposed_enrollment=10,
+        )
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(
+            experiment.computed_start_date, datetime.date(2019, 1, 1)
+        )
+        self.assertEqual(
+            experiment.computed_end_date, datetime.date(2019, 1, 21)
+        )
+        self.assertEqual(
+            experiment.computed_enrollment_end_date, datetime.date(2019, 1, 11)
+        )
+
+    def test_changelog_save_stores_transition_dates(self):
+        experiment = ExperimentFactory.create_with_variants(
+            proposed_start_date=datetime.date(2019, 1, 1),
+            proposed_duration=20,
+            proposed_enrollment=10,
+        )
+
+        ExperimentChangeLogFactory.create(
+            experiment=experiment,
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+            changed_on=datetime.date(2019, 1, 5),
+        )
+        experiment.changes.create(
+            changed_by=experiment.owner,
+            old_status=Experiment.STATUS_LIVE,
+            new_status=Experiment.STATUS_COMPLETE,
+            changed_on=datetime.date(2019, 1, 15),
+        )
+
+        self.assertEqual(
+            experiment.computed_start_date, datetime.date(2019, 1, 5)
+        )
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(
+            experiment.computed_start_date, datetime.date(2019, 1, 5)
+        )
+        self.assertEqual(
+            experiment.computed_end_date, datetime.date(2019, 1, 15)
+        )
+        self.assertEqual(
+            experiment.computed_enrollment_end_date, datetime.date(2019, 1, 15)
+        )
+
+    def test_save_ignores_stale_prefetched_changes(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_ACCEPTED
+        )
+        experiment = Experiment.objects.get_prefetched().get(id=experiment.id)
+        ExperimentChangeLog.objects.create(
+            experiment_id=experiment.id,
+            changed_by=experiment.owner,
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+            changed_on=datetime.date(2019, 1, 5),
+        )
+
+        experiment.status = Experiment.STATUS_LIVE
+        experiment.save()
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(
+            experiment.computed_start_date, datetime.date(2019, 1, 5)
+        )
+
     def test_format_date_string_accepts_none_for_start(self):
         experiment = ExperimentFactory.create_with_variants()
         output = experiment._format_date_string(
@@ -1049,28 +1288,68 @@ class TestExperimentModel(TestCase):
         )
         self.assertEqual(experiment.population, "0.5% of Nightly Firefox 57.0")
 
-    def test_experiment_firefox_channel_sort_does_sorting(self):
-        ExperimentFactory.create(firefox_channel=Experiment.CHANNEL_NIGHTLY)
-        ExperimentFactory.create(firefox_channel=Experiment.CHANNEL_RELEASE)
-        ExperimentFactory.create(firefox_channel=Experiment.CHANNEL_BETA)
-        ExperimentFactory.create(firefox_channel="")
-        sorted_experiments = (
-            Experiment.objects.annotate(
-                firefox_channel_sort=Experiment.firefox_channel_sort()
-            )
-            .order_by("firefox_channel_sort")
-            .values("firefox_channel_sort")
+    def test_subscribed_by_and_subscriber_count_annotations(self):
+        user = UserFactory.create()
+        subscribed = ExperimentFactory.create()
+        subscribed.subscribers.add(user, UserFactory.create())
+        other = ExperimentFactory.create()
+        other.subscribers.add(UserFactory.create())
+        unsubscribed = ExperimentFactory.create()
+
+        experiments = Experiment.objects.annotate(
+            is_subscribed=Experiment.subscribed_by(user),
+            subscriber_count=Experiment.subscriber_count(),
+        ).in_bulk()
+
+        self.assertTrue(experiments[subscribed.id].is_subscribed)
+        self.assertEqual(experiments[subscribed.id].subscriber_count, 2)
+        self.assertFalse(experiments[other.id].is_subscribed)
+        self.assertEqual(experiments[other.id].subscriber_count, 1)
+        self.assertFalse(experiments[unsubscribed.id].is_subscribed)
+        self.assertEqual(experiments[unsubscribed.id].subscriber_count, 0)
+
+    def test_version_to_int_orders_versions_numerically(self):
+        self.assertIsNone(Experiment.version_to_int(None))
+        self.assertIsNone(Experiment.version_to_int(""))
+        self.assertEqual(Experiment.version_to_int("57.0"), 57000000)
+        self.assertEqual(Experiment.version_to_int("68.0.1"), 68000001)
+        self.assertEqual(Experiment.version_to_int("68.0a1"), 68000000)
+        self.assertEqual(Experiment.version_to_int("70.x"), 70000000)
+        self.assertIsNone(Experiment.version_to_int("nightly"))
+        self.assertLess(
+            Experiment.version_to_int("99.0"),
+            Experiment.version_to_int("100.0"),
+        )
+
+    def test_save_stores_version_ints(self):
+        experiment = ExperimentFactory.create(
+            firefox_min_version="57.0", firefox_max_version=""
         )
+        experiment.refresh_from_db()
+        self.assertEqual(experiment.firefox_min_version_int, 57000000)
+        self.assertIsNone(experiment.firefox_max_version_int)
+
+        experiment.firefox_max_version = "60.0"
+        experiment.save()
+        experiment.refresh_from_db()
+        self.assertEqual(experiment.firefox_max_version_int, 60000000)
+
+    def test_save_stores_firefox_channel_order(self):
+        experiment = ExperimentFactory.create(firefox_channel="")
         self.assertEqual(
-            [r["firefox_channel_sort"] for r in sorted_experiments],
-            [
-                Experiment.CHANNEL_UNSET_ORDER,
-                Experiment.CHANNEL_NIGHTLY_ORDER,
-                Experiment.CHANNEL_BETA_ORDER,
-                Experiment.CHANNEL_RELEASE_ORDER,
-            ],
+            experiment.firefox_channel_order, Experiment.CHANNEL_UNSET_ORDER
         )
 
+        for channel, order in (
+            (Experiment.CHANNEL_NIGHTLY, Experiment.CHANNEL_NIGHTLY_ORDER),
+            (Experiment.CHANNEL_BETA, Experiment.CHANNEL_BETA_ORDER),
+            (Experiment.CHANNEL_RELEASE, Experiment.CHANNEL_RELEASE_ORDER),
+        ):
+            experiment.firefox_channel = channel
+            experiment.save()
+            experiment.refresh_from_db()
+            self.assertEqual(experiment.firefox_channel_order, order)
+
     def test_clone(self):
         user_1 = UserFactory.create()
         user_2 = UserFactory.create()
@@ -1135,6 +1414,176 @@ class TestExperimentModel(TestCase):
         self.assertEqual(change.old_status, None)
         self.assertEqual(change.new_status, experiment.STATUS_DRAFT)
 
+    def test_clone_copies_variants_locales_and_countries(self):
+        experiment = ExperimentFactory.create_with_variants()
+        experiment.locales.add(LocaleFactory.create(), LocaleFactory.create())
+        experiment.countries.add(CountryFactory.create())
+
+        cloned_experiment = experiment.clone(
+            "best experiment", experiment.owner
+        )
+
+        self.assertEqual(
+            [
+                (variant.name, variant.ratio, variant.is_control)
+                for variant in cloned_experiment.variants.order_by("id")
+            ],
+            [
+                (variant.name, variant.ratio, variant.is_control)
+                for variant in experiment.variants.order_by("id")
+            ],
+        )
+        self.assertEqual(
+            set(cloned_experiment.locales.all()), set(experiment.locales.all())
+        )
+        self.assertEqual(
+            set(cloned_experiment.countries.all()),
+            set(experiment.countries.all()),
+        )
+
+    def test_clone_query_count_does_not_grow_with_variants(self):
+        experiment = ExperimentFactory.create_with_variants()
+        experiment.locales.set([LocaleFactory.create()])
+        experiment.countries.set([CountryFactory.create()])
+        user = UserFactory.create()
+
+        with self.assertNumQueries(16):
+            experiment.clone("clone 1", user)
+
+        for i in range(3):
+            ExperimentVariantFactory.create(experiment=experiment)
+        experiment.locales.add(LocaleFactory.create(), LocaleFactory.create())
+        experiment.countries.add(CountryFactory.create())
+
+        with self.assertNumQueries(16):
+            experiment.clone("clone 2", user)
+
+
+class TestExperimentReadiness(TestCase):
+
+    REQUIRED_REVIEWS = {
+        "review_science": True,
+        "review_engineering": True,
+        "review_qa_requested": True,
+        "review_intent_to_ship": True,
+        "review_bugzilla": True,
+        "review_qa": True,
+        "review_relman": True,
+    }
+
+    def test_save_stores_readiness(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW, **self.REQUIRED_REVIEWS
+        )
+        stored = Experiment.objects.get(id=experiment.id).readiness
+
+        self.assertEqual(stored, experiment.compute_readiness())
+        self.assertTrue(stored & Experiment.READINESS_ALL_SECTIONS)
+        self.assertTrue(stored & Experiment.READINESS_REVIEWS)
+
+        experiment.review_qa = False
+        experiment.save()
+
+        stored = Experiment.objects.get(id=experiment.id).readiness
+        self.assertFalse(stored & Experiment.READINESS_REVIEWS)
+
+    def test_update_readiness_stores_readiness_with_variants(self):
+        experiment = ExperimentFactory.create()
+
+        def stored_readiness():
+            return Experiment.objects.get(id=experiment.id).readiness
+
+        variant = ExperimentVariantFactory.create(experiment=experiment)
+        self.assertFalse(stored_readiness() & Experiment.READINESS_VARIANTS)
+
+        Experiment.objects.update_readiness(experiment.id)
+        self.assertTrue(stored_readiness() & Experiment.READINESS_VARIANTS)
+
+        variant.delete()
+        Experiment.objects.update_readiness(experiment.id)
+        self.assertFalse(stored_readiness() & Experiment.READINESS_VARIANTS)
+
+    def test_variant_save_does_not_recompute_readiness(self):
+        experiment = ExperimentFactory.create()
+        variant = ExperimentVariantFactory.build(experiment=experiment)
+
+        with self.assertNumQueries(2):
+            variant.save()
+
+    def test_clone_stores_readiness_with_variants(self):
+        experiment = ExperimentFactory.create_with_variants()
+
+        cloned = experiment.clone("clone 1", UserFactory.create())
+
+        stored = Experiment.objects.get(id=cloned.id).readiness
+        self.assertTrue(stored & Experiment.READINESS_VARIANTS)
+        self.assertEqual(stored, cloned.compute_readiness())
+
+    def test_stored_readiness_reads_stored_value(self):
+        experiment = ExperimentFactory.create_with_variants()
+        Experiment.objects.filter(id=experiment.id).update(
+            readiness=Experiment.READINESS_TIMELINE
+        )
+        experiment = Experiment.objects.get(id=experiment.id)
+
+        with self.assertNumQueries(0):
+            stored_readiness = experiment.stored_readiness
+
+        self.assertTrue(stored_readiness["completed_timeline"])
+        self.assertFalse(stored_readiness["completed_variants"])
+
+    def test_stored_readiness_computes_missing_readiness(self):
+        experiment = ExperimentFactory.create_with_variants()
+        Experiment.objects.filter(id=experiment.id).update(readiness=None)
+        experiment = Experiment.objects.get(id=experiment.id)
+
+        self.assertEqual(
+            experiment.stored_readiness,
+            {
+                name: bool(getattr(experiment, name))
+                for flag, name in Experiment.READINESS_PROPERTIES
+            },
+        )
+
+    def test_readiness_filters_and_counts(self):
+        ready = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW, **self.REQUIRED_REVIEWS
+        )
+        missing_reviews = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW
+        )
+        incomplete = ExperimentFactory.create(**self.REQUIRED_REVIEWS)
+        incomplete_without_reviews = ExperimentFactory.create()
+        not_backfilled = ExperimentFactory.create()
+        Experiment.objects.filter(id=not_backfilled.id).update(readiness=None)
+
+        def filtered(readiness):
+            return set(
+                Experiment.objects.filter(
+                    Experiment.readiness_filter(readiness)
+                )
+            )
+
+        self.assertEqual(
+            filtered(Experiment.READINESS_READY_TO_LAUNCH), {ready}
+        )
+        self.assertEqual(
+            filtered(Experiment.READINESS_MISSING_REVIEWS),
+            {missing_reviews, incomplete_without_reviews},
+        )
+        self.assertEqual(
+            filtered(Experiment.READINESS_INCOMPLETE_SECTIONS),
+            {incomplete, incomplete_without_reviews},
+        )
+        self.assertEqual(
+            Experiment.readiness_counts(Experiment.objects.all()),
+            {
+                Experiment.READINESS_READY_TO_LAUNCH: 1,
+                Experiment.READINESS_MISSING_REVIEWS: 2,
+                Experiment.READINESS_INCOMPLETE_SECTIONS: 2,
+            },
+        )
+
 
 class TestExperimentChangeLog(TestCase):
 
@@ -1178,7 +1627,36 @@ class TestExperimentChangeLog(TestCase):
 
 class TestExperimentComments(TestCase):
 
-    def test_manager_returns_sections(self):
+    @override_settings(EXPERIMENT_COMMENTS_PAGINATE_BY=2)
+    def test_comment_sections_reads_newest_page_of_each_section_at_once(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT
+        )
+        comments = [
+            ExperimentCommentFactory.create(
+                experiment=experiment, section=section
+            )
+            for section in (
+                Experiment.SECTION_RISKS,
+                Experiment.SECTION_TESTING,
+                Experiment.SECTION_RISKS,
+                Experiment.SECTION_RISKS,
+                Experiment.SECTION_RISKS,
+            )
+        ]
+        experiment = Experiment.objects.get_prefetched().get(id=experiment.id)
+
+        with self.assertNumQueries(1):
+            risks = experiment.comment_sections[Experiment.SECTION_RISKS]
+            testing = experiment.comment_sections[Experiment.SECTION_TESTING]
+            overview = experiment.comment_sections[Experiment.SECTION_OVERVIEW]
+            str(risks[0].created_by)
+
+        self.assertEqual(risks, [comments[4], comments[3], comments[2]])
+        self.assertEqual(testing, [comments[1]])
+        self.assertEqual(overview, [])
+
+    def test_comment_sections_groups_comments(self):
         experiment = ExperimentFactory.create_with_status(
             Experiment.STATUS_DRAFT
         )
@@ -1189,18 +1667,17 @@ class TestExperimentComments(TestCase):
             experiment=experiment, section=Experiment.SECTION_TESTING
         )
         self.assertIn(
-            risk_comment,
-            experiment.comments.sections[experiment.SECTION_RISKS],
+            risk_comment, experiment.comment_sections[experiment.SECTION_RISKS]
         )
         self.assertIn(
             testing_comment,
-            experiment.comments.sections[experiment.SECTION_TESTING],
+            experiment.comment_sections[experiment.SECTION_TESTING],
         )
         self.assertNotIn(
             risk_comment,
-            experiment.comments.sections[experiment.SECTION_TESTING],
+            experiment.comment_sections[experiment.SECTION_TESTING],
         )
         self.assertNotIn(
             testing_comment,
-            experiment.comments.sections[experiment.SECTION_RISKS],
+            experiment.comment_sections[experiment.SECTION_RISKS],
         )
@@ -1,12 +1,18 @@
+import markus
 import mock
+from markus.testing import MetricsMock
 from requests.exceptions import RequestException, HTTPError
-from django.test import TestCase
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from experimenter.experiments.normandy import (
     APINormandyError,
     NonsuccessfulNormandyCall,
     NormandyDecodeError,
-    make_normandy_call,
     get_recipe,
+    get_recipes,
+    get_response_cache_key,
+    make_normandy_call,
 )
 from experimenter.experiments.tests.mixins import MockNormandyMixin
 
@@ -20,6 +26,7 @@ class TestMakeNormandyCall(MockNormandyMixin, TestCase):
         mock_response.json.return_value = mock_response_data
         mock_response.raise_for_status = mock.Mock()
         mock_response.raise_for_status.side_effect = None
+        mock_response.headers = {}
         self.mock_normandy_requests_get.return_value = mock_response
 
         response_data = make_normandy_call("/url/")
@@ -50,3 +57,189 @@ class TestMakeNormandyCall(MockNormandyMixin, TestCase):
     def test_successful_get_recipe_returns_recipe_data(self):
         response_data = get_recipe(1234)
         self.assertTrue(response_data["enabled"])
+
+
+class TestMakeNormandyCallCache(MockNormandyMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.data = {"approved_revision": self.buildApprovedRevision()}
+        self.mock_normandy_requests_get.return_value = self.buildMockResponse(
+            self.data,
+            headers={"ETag": '"abc"', "Last-Modified": "Tue, 01 Jan 2019"},
+        )
+
+    def test_response_with_validators_is_cached(self):
+        with MetricsMock() as mm:
+            make_normandy_call("/url/", params={"page": 2})
+
+            self.assertTrue(
+                mm.has_record(markus.INCR, "experiments.normandy.cache.miss")
+            )
+
+        self.mock_normandy_requests_get.assert_called_with(
+            "/url/", params={"page": 2}, headers={}
+        )
+        self.assertEqual(
+            cache.get(get_response_cache_key("/url/", {"page": 2})),
+            {
+                "etag": '"abc"',
+                "last_modified": "Tue, 01 Jan 2019",
+                "data": self.data,
+            },
+        )
+
+    def test_response_without_validators_is_not_cached(self):
+        self.mock_normandy_requests_get.return_value = self.buildMockResponse(
+            self.data
+        )
+
+        make_normandy_call("/url/")
+
+        self.assertIsNone(cache.get(get_response_cache_key("/url/")))
+
+    def test_not_modified_response_returns_cached_data(self):
+        make_normandy_call("/url/")
+
+        not_modified = self.buildMockResponse(None, status_code=304)
+        not_modified.json.side_effect = ValueError()
+        self.mock_normandy_requests_get.return_value = not_modified
+
+        with MetricsMock() as mm:
+            self.assertEqual(make_normandy_call("/url/"), self.data)
+
+            self.assertTrue(
+                mm.has_record(markus.INCR, "experiments.normandy.cache.hit")
+            )
+            self.assertFalse(
+                mm.has_record(markus.INCR, "experiments.normandy.cache.miss")
+            )
+
+        self.mock_normandy_requests_get.assert_called_with(
+            "/url/",
+            params=None,
+            headers={
+                "If-None-Match": '"abc"',
+                "If-Modified-Since": "Tue, 01 Jan 2019",
+            },
+        )
+
+    def test_modified_response_replaces_cached_data(self):
+        make_normandy_call("/url/")
+
+        new_data = {"approved_revision": self.buildApprovedRevision(2)}
+        self.mock_normandy_requests_get.return_value = self.buildMockResponse(
+            new_data, headers={"ETag": '"def"'}
+        )
+
+        with MetricsMock() as mm:
+            self.assertEqual(make_normandy_call("/url/"), new_data)
+
+            # The cached response was sent back but not used
+            self.assertTrue(
+                mm.has_record(markus.INCR, "experiments.normandy.cache.miss")
+            )
+            self.assertFalse(
+                mm.has_record(markus.INCR, "experiments.normandy.cache.hit")
+            )
+
+        self.mock_normandy_requests_get.assert_called_with(
+            "/url/",
+            params=None,
+            headers={
+                "If-None-Match": '"abc"',
+                "If-Modified-Since": "Tue, 01 Jan 2019",
+            },
+        )
+
+        self.mock_normandy_requests_get.return_value = self.buildMockResponse(
+            None, status_code=304
+        )
+        self.assertEqual(make_normandy_call("/url/"), new_data)
+        self.mock_normandy_requests_get.assert_called_with(
+            "/url/", params=None, headers={"If-None-Match": '"def"'}
+        )
+
+
+class TestGetRecipes(MockNormandyMixin, TestCase):
+
+    def test_get_recipes_without_ids_makes_no_request(self):
+        self.assertEqual(list(get_recipes([])), [])
+        self.mock_normandy_requests_get.assert_not_called()
+
+    def test_get_recipes_yields_requested_recipes_from_single_page(self):
+        revision = self.buildApprovedRevision()
+        self.setUpMockNormandyRecipes({1: revision, 2: revision, 3: revision})
+
+        recipes = dict(get_recipes([1, 3, 4]))
+
+        self.assertEqual(recipes, {1: revision, 3: revision})
+        self.mock_normandy_requests_get.assert_called_once_with(
+            settings.NORMANDY_API_RECIPES_URL,
+            params={"page": 1, "page_size": settings.NORMANDY_API_PAGE_SIZE},
+            headers={},
+        )
+
+    def test_get_recipes_stops_once_all_recipes_are_found(self):
+        revision = self.buildApprovedRevision()
+        response = self.buildMockRecipeListResponse(
+            {1: revision, 2: revision}, count=10, next_url="/?page=2"
+        )
+        self.mock_normandy_requests_get.return_value = response
+
+        recipes = dict(get_recipes([2]))
+
+        self.assertEqual(recipes, {2: revision})
+        self.assertEqual(self.mock_normandy_requests_get.call_count, 1)
+
+    def test_get_recipes_fetches_remaining_pages(self):
+        revision = self.buildApprovedRevision(enabled=False)
+
+        def page_response(url, params, headers):
+            page = params["page"]
+            return self.buildMockRecipeListResponse(
+                {page * 2 - 1: revision, page * 2: revision},
+                count=5,
+                next_url="/?page={}".format(page + 1) if page < 3 else None,
+            )
+
+        self.mock_normandy_requests_get.side_effect = page_response
+
+        recipes = list(get_recipes([1, 4, 5]))
+
+        self.assertEqual(
+            recipes, [(1, revision), (4, revision), (5, revision)]
+        )
+        self.assertEqual(self.mock_normandy_requests_get.call_count, 3)
+
+    @override_settings(NORMANDY_API_CONCURRENCY=2)
+    def test_get_recipes_stops_fetching_pages_once_all_recipes_are_found(self):
+        revision = self.buildApprovedRevision()
+
+        def page_response(url, params, headers):
+            page = params["page"]
+            return self.buildMockRecipeListResponse(
+                {page * 2 - 1: revision, page * 2: revision},
+                count=12,
+                next_url="/?page={}".format(page + 1) if page < 6 else None,
+            )
+
+        self.mock_normandy_requests_get.side_effect = page_response
+
+        recipes = list(get_recipes([1, 5]))
+
+        self.assertEqual(recipes, [(1, revision), (5, revision)])
+
+        # Page 4 may already have been requested when page 3 comes back,
+        # but no page is requested after that
+        requested_pages = {
+            call[1]["params"]["page"]
+            for call in self.mock_normandy_requests_get.call_args_list
+        }
+        self.assertIn(requested_pages, [{1, 2, 3}, {1, 2, 3, 4}])
+
+    def test_get_recipes_raises_normandy_error(self):
+        self.mock_normandy_requests_get.side_effect = RequestException()
+
+        with self.assertRaises(APINormandyError):
+            list(get_recipes([1234]))
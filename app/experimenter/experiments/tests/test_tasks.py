@@ -2,13 +2,16 @@ import markus
 import mock
 
 from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 
+from celery.exceptions import Retry
 from markus.testing import MetricsMock
 from requests.exceptions import RequestException
 from django.core import mail
-from experimenter.experiments import bugzilla, tasks
+from experimenter.experiments import bugzilla, email, tasks
+from experimenter.experiments.http_client import RateLimitExceeded
 from experimenter.experiments.models import Experiment
 from experimenter.experiments.tests.factories import (
     ExperimentFactory,
@@ -188,6 +191,36 @@ class TestUpdateTask(MockRequestMixin, MockBugzillaMixin, TestCase):
             ),
         )
 
+    def test_unchanged_experiment_bug_is_not_updated_again(self):
+        tasks.update_experiment_bug_task(self.user.id, self.experiment.id)
+
+        with MetricsMock() as mm:
+            tasks.update_experiment_bug_task(self.user.id, self.experiment.id)
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.update_experiment_bug.unchanged",
+                    value=1,
+                )
+            )
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.update_experiment_bug.completed",
+                    value=1,
+                )
+            )
+
+        self.mock_bugzilla_requests_put.assert_called_once()
+        self.assertEqual(Notification.objects.count(), 1)
+
+    def test_experiment_bug_related_rows_read_once(self):
+        # the experiment, its countries, locales, variants and changes,
+        # then the stored hash and the notification
+        with self.assertNumQueries(7):
+            tasks.update_experiment_bug_task(self.user.id, self.experiment.id)
+
     def test_bugzilla_error_creates_notifications(self):
         self.assertEqual(Notification.objects.count(), 0)
 
@@ -274,20 +307,34 @@ class TestUpdateExperimentStatus(
     MockRequestMixin, MockNormandyMixin, MockBugzillaMixin, TestCase
 ):
 
+    def setUp(self):
+        super().setUp()
+        self.setUpMockNormandyRecipes({1234: self.buildApprovedRevision()})
+
+        # Send queued emails straight away
+        mock_send_emails_patcher = mock.patch.object(
+            tasks.send_experiment_emails_task,
+            "delay",
+            side_effect=tasks.send_experiment_emails_task,
+        )
+        self.mock_send_emails = mock_send_emails_patcher.start()
+        self.addCleanup(mock_send_emails_patcher.stop)
+
+        # And update Bugzilla straight away
+        for task in (
+            tasks.add_start_date_comment_task,
+            tasks.resolve_completed_bug_task,
+        ):
+            patcher = mock.patch.object(task, "delay", side_effect=task)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
     def test_experiment_with_no_recipe_data(self):
         ExperimentFactory.create_with_status(
             target_status=Experiment.STATUS_ACCEPTED, normandy_id=1234
         )
 
-        mock_response_data = {"approved_revision": None}
-        mock_response = mock.Mock()
-        mock_response.json = mock.Mock()
-        mock_response.json.return_value = mock_response_data
-        mock_response.raise_for_status = mock.Mock()
-        mock_response.raise_for_status.side_effect = None
-        mock_response.status_code = 200
-
-        self.mock_normandy_requests_get.return_value = mock_response
+        self.setUpMockNormandyRecipes({1234: None})
         tasks.update_experiment_info()
         experiment = Experiment.objects.get(normandy_id=1234)
 
@@ -337,14 +384,17 @@ class TestUpdateExperimentStatus(
         self.assertEqual(
             mail.outbox[0].cc, [experiment.owner.email, subscribing_user.email]
         )
+        self.mock_send_emails.assert_called_once_with(
+            [(experiment.id, Experiment.EXPERIMENT_STARTS)], None
+        )
 
     def test_accepted_experiment_stays_accepted_if_normandy_disabled(self):
         ExperimentFactory.create_with_status(
             target_status=Experiment.STATUS_ACCEPTED, normandy_id=1234
         )
 
-        self.mock_normandy_requests_get.return_value = (
-            self.buildMockSuccessDisabledResponse()
+        self.setUpMockNormandyRecipes(
+            {1234: self.buildApprovedRevision(enabled=False)}
         )
         tasks.update_experiment_info()
         updated_experiment = Experiment.objects.get(normandy_id=1234)
@@ -379,8 +429,8 @@ class TestUpdateExperimentStatus(
         ExperimentFactory.create_with_status(
             target_status=Experiment.STATUS_LIVE, normandy_id=1234
         )
-        self.mock_normandy_requests_get.return_value = (
-            self.buildMockSuccessDisabledResponse()
+        self.setUpMockNormandyRecipes(
+            {1234: self.buildApprovedRevision(enabled=False)}
         )
 
         tasks.update_experiment_info()
@@ -402,7 +452,7 @@ class TestUpdateExperimentStatus(
         )
 
     def test_one_failure_does_not_affect_other_experiment_status_updates(self):
-        self.setUpMockNormandyFailWithSpecifiedID("1234")
+        self.setUpMockNormandyRecipes({1235: self.buildApprovedRevision()})
         ExperimentFactory.create_with_status(
             target_status=Experiment.STATUS_ACCEPTED, normandy_id=1234
         )
@@ -431,6 +481,213 @@ class TestUpdateExperimentStatus(
             ).exists()
         )
 
+    def test_launch_emails_queued_when_a_later_experiment_fails(self):
+        self.setUpMockNormandyRecipes(
+            {
+                1234: self.buildApprovedRevision(),
+                1235: self.buildApprovedRevision(),
+            }
+        )
+        experiment = ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1234
+        )
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1235
+        )
+
+        update_status = tasks.update_status
+
+        def fail_second_experiment(experiment, recipe_data, launch_emails):
+            if experiment.normandy_id == 1235:
+                raise RuntimeError()
+            update_status(experiment, recipe_data, launch_emails)
+
+        with mock.patch.object(
+            tasks, "update_status", side_effect=fail_second_experiment
+        ):
+            with self.assertRaises(RuntimeError):
+                tasks.update_experiment_info()
+
+        self.mock_send_emails.assert_called_once_with(
+            [(experiment.id, Experiment.EXPERIMENT_STARTS)], None
+        )
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_rate_limited_bugzilla_does_not_stop_status_sync(self):
+        self.setUpMockNormandyRecipes(
+            {
+                1234: self.buildApprovedRevision(),
+                1235: self.buildApprovedRevision(enabled=False),
+            }
+        )
+        launched = ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1234
+        )
+        completed = ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_LIVE, normandy_id=1235
+        )
+
+        with mock.patch(
+            "experimenter.experiments.bugzilla.rate_limiter.acquire",
+            side_effect=RateLimitExceeded(7.5),
+        ), mock.patch.object(
+            tasks.add_start_date_comment_task, "delay"
+        ) as mock_comment, mock.patch.object(
+            tasks.resolve_completed_bug_task, "delay"
+        ) as mock_resolve:
+            tasks.update_experiment_info()
+
+        self.assertEqual(
+            Experiment.objects.get(id=launched.id).status,
+            Experiment.STATUS_LIVE,
+        )
+        self.assertEqual(
+            Experiment.objects.get(id=completed.id).status,
+            Experiment.STATUS_COMPLETE,
+        )
+        mock_comment.assert_called_once_with(launched.id)
+        mock_resolve.assert_called_once_with(completed.id)
+        self.mock_send_emails.assert_called_once_with(
+            [(launched.id, Experiment.EXPERIMENT_STARTS)], None
+        )
+
+    def test_normandy_error_leaves_experiments_unchanged(self):
+        self.mock_normandy_requests_get.side_effect = RequestException()
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1234
+        )
+
+        with MetricsMock() as mm:
+            tasks.update_experiment_info()
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.update_experiment_info.failed",
+                    value=1,
+                )
+            )
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.update_experiment_info.completed",
+                    value=1,
+                )
+            )
+
+        experiment = Experiment.objects.get(normandy_id=1234)
+        self.assertEqual(experiment.status, Experiment.STATUS_ACCEPTED)
+
+    def test_malformed_recipe_does_not_affect_other_experiments(self):
+        self.setUpMockNormandyRecipes(
+            {1234: {"enabled": True}, 1235: self.buildApprovedRevision()}
+        )
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1234
+        )
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1235
+        )
+
+        with MetricsMock() as mm:
+            tasks.update_experiment_info()
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.update_experiment_info.failed",
+                    value=1,
+                )
+            )
+
+        self.assertEqual(
+            Experiment.objects.get(normandy_id=1234).status,
+            Experiment.STATUS_ACCEPTED,
+        )
+        self.assertEqual(
+            Experiment.objects.get(normandy_id=1235).status,
+            Experiment.STATUS_LIVE,
+        )
+
+    def test_experiments_fetched_in_a_single_request(self):
+        for normandy_id in (1234, 1235, 1236):
+            ExperimentFactory.create_with_status(
+                target_status=Experiment.STATUS_LIVE, normandy_id=normandy_id
+            )
+
+        tasks.update_experiment_info()
+
+        self.mock_normandy_requests_get.assert_called_once_with(
+            settings.NORMANDY_API_RECIPES_URL,
+            params={"page": 1, "page_size": settings.NORMANDY_API_PAGE_SIZE},
+            headers={},
+        )
+
+    def test_unchanged_recipe_revision_is_not_checked_again(self):
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_LIVE, normandy_id=1234
+        )
+
+        with mock.patch(
+            "experimenter.experiments.tasks.needs_to_be_updated"
+        ) as mock_needs_to_be_updated:
+            mock_needs_to_be_updated.return_value = False
+            tasks.update_experiment_info()
+
+            with MetricsMock() as mm:
+                tasks.update_experiment_info()
+
+                self.assertTrue(
+                    mm.has_record(
+                        markus.INCR,
+                        "experiments.tasks.update_experiment_info.unchanged",
+                        value=1,
+                    )
+                )
+
+        mock_needs_to_be_updated.assert_called_once()
+
+    def test_new_recipe_revision_is_checked(self):
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_LIVE, normandy_id=1234
+        )
+        tasks.update_experiment_info()
+
+        self.setUpMockNormandyRecipes(
+            {1234: self.buildApprovedRevision(enabled=False, revision_id=2)}
+        )
+        tasks.update_experiment_info()
+
+        experiment = Experiment.objects.get(normandy_id=1234)
+        self.assertEqual(experiment.status, Experiment.STATUS_COMPLETE)
+
+    def test_updated_experiment_is_checked_against_its_new_status(self):
+        ExperimentFactory.create_with_status(
+            target_status=Experiment.STATUS_ACCEPTED, normandy_id=1234
+        )
+        tasks.update_experiment_info()
+
+        with MetricsMock() as mm:
+            tasks.update_experiment_info()
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.update_experiment_info.unchanged",
+                    value=1,
+                )
+            )
+
+        experiment = Experiment.objects.get(normandy_id=1234)
+        self.assertEqual(experiment.status, Experiment.STATUS_LIVE)
+        self.assertEqual(
+            experiment.changes.filter(
+                changed_by__email="dev@example.com",
+                new_status=Experiment.STATUS_LIVE,
+            ).count(),
+            1,
+        )
+
     def test_experiment_status_updates_by_existing_user(self):
         User = get_user_model()
         user = UserFactory(email="dev@example.com")
@@ -469,6 +726,381 @@ class TestUpdateExperimentStatus(
         )
 
 
+class TestRateLimitedTasks(MockRequestMixin, MockBugzillaMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        self.experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_SHIP, bugzilla_id=self.bugzilla_id
+        )
+
+        mock_acquire_patcher = mock.patch(
+            "experimenter.experiments.bugzilla.rate_limiter.acquire",
+            side_effect=RateLimitExceeded(7.5),
+        )
+        mock_acquire_patcher.start()
+        self.addCleanup(mock_acquire_patcher.stop)
+
+    def assert_retried(self, task, name, with_user=True):
+        args = [self.experiment.id]
+        if with_user:
+            args.insert(0, self.user.id)
+
+        with mock.patch.object(
+            task, "retry", return_value=Retry()
+        ) as mock_retry, MetricsMock() as mm:
+            with self.assertRaises(Retry):
+                task(*args)
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.{}.rate_limited".format(name),
+                    value=1,
+                )
+            )
+            self.assertFalse(
+                mm.has_record(
+                    markus.INCR, "experiments.tasks.{}.failed".format(name)
+                )
+            )
+
+        mock_retry.assert_called_once_with(
+            exc=mock.ANY,
+            countdown=7.5,
+            max_retries=settings.BUGZILLA_RATE_LIMIT_RETRIES,
+        )
+        self.assertEqual(Notification.objects.count(), 0)
+
+    def test_create_bug_retried(self):
+        self.experiment.bugzilla_id = None
+        self.experiment.save()
+
+        self.assert_retried(
+            tasks.create_experiment_bug_task, "create_experiment_bug"
+        )
+
+    def test_update_bug_retried(self):
+        self.assert_retried(
+            tasks.update_experiment_bug_task, "update_experiment_bug"
+        )
+
+    def test_update_bug_resolution_retried(self):
+        self.assert_retried(
+            tasks.update_bug_resolution_task, "update_bug_resolution"
+        )
+
+    def test_add_start_date_comment_retried(self):
+        self.assert_retried(
+            tasks.add_start_date_comment_task,
+            "add_start_date_comment",
+            with_user=False,
+        )
+
+    def test_resolve_completed_bug_retried(self):
+        self.assert_retried(
+            tasks.resolve_completed_bug_task,
+            "resolve_completed_bug",
+            with_user=False,
+        )
+
+    def test_task_called_directly_raises_rate_limited(self):
+        with self.assertRaises(bugzilla.BugzillaRateLimited):
+            tasks.update_bug_resolution_task(self.user.id, self.experiment.id)
+
+    def test_gives_up_once_rate_limit_retries_run_out(self):
+        task = tasks.update_experiment_bug_task
+
+        with mock.patch.object(
+            task, "retry"
+        ) as mock_retry, MetricsMock() as mm:
+            with self.assertRaises(bugzilla.BugzillaRateLimited):
+                task.apply(
+                    [self.user.id, self.experiment.id],
+                    retries=settings.BUGZILLA_RATE_LIMIT_RETRIES,
+                    throw=True,
+                )
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.update_experiment_bug."
+                    "rate_limit_gave_up",
+                    value=1,
+                )
+            )
+            self.assertFalse(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.update_experiment_bug.rate_limited",
+                )
+            )
+
+        mock_retry.assert_not_called()
+
+
+class TestCoalescedTasks(MockRequestMixin, MockBugzillaMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+        self.experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_SHIP, bugzilla_id=self.bugzilla_id
+        )
+
+    def queue(self, task, experiment=None):
+        experiment = experiment or self.experiment
+
+        with mock.patch.object(task, "delay") as mock_delay:
+            tasks.delay_coalesced(task, self.user.id, experiment.id)
+
+        mock_delay.assert_called_once_with(
+            self.user.id, experiment.id, coalesce_token=mock.ANY
+        )
+        return mock_delay.call_args[1]["coalesce_token"]
+
+    def test_only_latest_queued_update_runs(self):
+        tokens = [
+            self.queue(tasks.update_experiment_bug_task) for i in range(3)
+        ]
+
+        with MetricsMock() as mm:
+            for token in tokens:
+                tasks.update_experiment_bug_task(
+                    self.user.id, self.experiment.id, coalesce_token=token
+                )
+
+            self.assertEqual(
+                len(
+                    mm.filter_records(
+                        markus.INCR,
+                        "experiments.tasks.update_experiment_bug.coalesced",
+                    )
+                ),
+                2,
+            )
+            self.assertEqual(
+                len(
+                    mm.filter_records(
+                        markus.INCR,
+                        "experiments.tasks.update_experiment_bug.started",
+                    )
+                ),
+                1,
+            )
+
+        self.mock_bugzilla_requests_put.assert_called_once()
+
+    def test_updates_coalesced_per_task_and_experiment(self):
+        other_experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_SHIP, bugzilla_id=self.bugzilla_id
+        )
+        token = self.queue(tasks.update_bug_resolution_task)
+        self.queue(tasks.update_experiment_bug_task)
+        self.queue(tasks.update_bug_resolution_task, other_experiment)
+
+        self.assertFalse(
+            tasks.is_coalesced(
+                tasks.update_bug_resolution_task, self.experiment.id, token
+            )
+        )
+
+    def test_resolution_update_coalesced(self):
+        token = self.queue(tasks.update_bug_resolution_task)
+        self.queue(tasks.update_bug_resolution_task)
+
+        with MetricsMock() as mm:
+            tasks.update_bug_resolution_task(
+                self.user.id, self.experiment.id, coalesce_token=token
+            )
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.update_bug_resolution.coalesced",
+                    value=1,
+                )
+            )
+
+        self.mock_bugzilla_requests_put.assert_not_called()
+
+    def test_runs_when_latest_token_expired(self):
+        token = self.queue(tasks.update_experiment_bug_task)
+        cache.clear()
+
+        self.assertFalse(
+            tasks.is_coalesced(
+                tasks.update_experiment_bug_task, self.experiment.id, token
+            )
+        )
+
+    def test_runs_when_queued_without_token(self):
+        self.queue(tasks.update_experiment_bug_task)
+
+        tasks.update_experiment_bug_task(self.user.id, self.experiment.id)
+
+        self.mock_bugzilla_requests_put.assert_called_once()
+
+
+class TestSendExperimentEmailsTask(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory.create()
+        self.experiment = ExperimentFactory.create_with_variants()
+        self.emails = [
+            (self.experiment.id, Experiment.INTENT_TO_SHIP_EMAIL_LABEL)
+        ]
+
+    def test_queue_experiment_emails_reports_queue_depth(self):
+        with mock.patch.object(
+            tasks.send_experiment_emails_task, "delay"
+        ) as mock_delay, MetricsMock() as mm:
+            tasks.queue_experiment_emails(self.emails)
+            tasks.queue_experiment_emails(self.emails * 2)
+
+            self.assertEqual(
+                [
+                    record[2]
+                    for record in mm.filter_records(
+                        "gauge",
+                        stat="experiments.tasks.send_experiment_emails."
+                        "queue_depth",
+                    )
+                ],
+                [1, 3],
+            )
+
+        mock_delay.assert_called_with(self.emails * 2, None)
+
+    def test_emails_sent(self):
+        cache.set(tasks.EMAIL_QUEUE_DEPTH_CACHE_KEY, 3)
+
+        with MetricsMock() as mm:
+            tasks.send_experiment_emails_task(self.emails)
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.send_experiment_emails.completed",
+                    value=1,
+                )
+            )
+            self.assertTrue(
+                mm.has_record(
+                    markus.TIMING,
+                    "experiments.tasks.send_experiment_emails.timing",
+                )
+            )
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(cache.get(tasks.EMAIL_QUEUE_DEPTH_CACHE_KEY), 2)
+
+    def test_failed_emails_retried_without_the_sent_ones(self):
+        other_experiment = ExperimentFactory.create_with_variants()
+        emails = self.emails + [
+            (other_experiment.id, Experiment.EXPERIMENT_STARTS)
+        ]
+        unsent_emails = emails[1:]
+        cache.set(tasks.EMAIL_QUEUE_DEPTH_CACHE_KEY, 2)
+
+        with mock.patch(
+            "experimenter.experiments.email.send_experiment_emails",
+            side_effect=email.ExperimentEmailsError(unsent_emails),
+        ), mock.patch.object(
+            tasks.send_experiment_emails_task, "retry", return_value=Retry()
+        ) as mock_retry, MetricsMock() as mm:
+            with self.assertRaises(Retry):
+                tasks.send_experiment_emails_task(emails, self.user.id)
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.send_experiment_emails.failed",
+                    value=1,
+                )
+            )
+
+        mock_retry.assert_called_once_with(
+            args=[unsent_emails, self.user.id],
+            exc=mock.ANY,
+            countdown=settings.EMAIL_RETRY_BACKOFF,
+            max_retries=settings.EMAIL_RETRIES,
+        )
+        self.assertEqual(cache.get(tasks.EMAIL_QUEUE_DEPTH_CACHE_KEY), 1)
+        self.assertEqual(Notification.objects.count(), 0)
+
+    def test_retries_back_off_exponentially(self):
+        with mock.patch(
+            "experimenter.experiments.email.send_experiment_emails",
+            side_effect=email.ExperimentEmailsError(self.emails),
+        ), mock.patch.object(
+            tasks.send_experiment_emails_task, "retry", return_value=Retry()
+        ) as mock_retry:
+            tasks.send_experiment_emails_task.apply([self.emails], retries=2)
+
+        self.assertEqual(
+            mock_retry.call_args[1]["countdown"],
+            settings.EMAIL_RETRY_BACKOFF * 4,
+        )
+
+    def test_failed_emails_notify_user_once_retries_run_out(self):
+        cache.set(tasks.EMAIL_QUEUE_DEPTH_CACHE_KEY, 1)
+
+        with mock.patch(
+            "experimenter.experiments.email.send_experiment_emails",
+            side_effect=email.ExperimentEmailsError(self.emails),
+        ), MetricsMock() as mm:
+            with self.assertRaises(email.ExperimentEmailsError):
+                tasks.send_experiment_emails_task.apply(
+                    [self.emails, self.user.id],
+                    retries=settings.EMAIL_RETRIES,
+                    throw=True,
+                )
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.send_experiment_emails.gave_up",
+                    value=1,
+                )
+            )
+
+        notification = Notification.objects.get()
+        self.assertEqual(notification.user, self.user)
+        self.assertEqual(
+            notification.message,
+            tasks.NOTIFICATION_MESSAGE_SEND_EMAIL_FAILED.format(
+                email_type=Experiment.INTENT_TO_SHIP_EMAIL_LABEL,
+                name=self.experiment.name,
+            ),
+        )
+        self.assertEqual(cache.get(tasks.EMAIL_QUEUE_DEPTH_CACHE_KEY), 0)
+
+    def test_failed_launch_emails_notify_owners_once_retries_run_out(self):
+        deleted_experiment = ExperimentFactory.create_with_variants()
+        emails = [
+            (self.experiment.id, Experiment.EXPERIMENT_STARTS),
+            (deleted_experiment.id, Experiment.EXPERIMENT_STARTS),
+        ]
+        deleted_experiment.delete()
+
+        with mock.patch(
+            "experimenter.experiments.email.send_experiment_emails",
+            side_effect=email.ExperimentEmailsError(emails),
+        ):
+            with self.assertRaises(email.ExperimentEmailsError):
+                tasks.send_experiment_emails_task.apply(
+                    [emails], retries=settings.EMAIL_RETRIES, throw=True
+                )
+
+        self.assertEqual(
+            Notification.objects.get().user, self.experiment.owner
+        )
+
+
 class TestUpdateResolutionTask(MockRequestMixin, MockBugzillaMixin, TestCase):
 
     def setUp(self):
@@ -527,3 +1159,83 @@ class TestUpdateResolutionTask(MockRequestMixin, MockBugzillaMixin, TestCase):
             self.assertEqual(
                 Notification.objects.filters(message=message).exists()
             )
+
+
+class TestStatusSyncBugzillaTasks(
+    MockRequestMixin, MockBugzillaMixin, TestCase
+):
+
+    def setUp(self):
+        super().setUp()
+
+        self.experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_COMPLETE, bugzilla_id=self.bugzilla_id
+        )
+
+    def test_start_date_comment_added(self):
+        with MetricsMock() as mm:
+            tasks.add_start_date_comment_task(self.experiment.id)
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.add_start_date_comment.completed",
+                    value=1,
+                )
+            )
+
+        self.mock_bugzilla_requests_post.assert_called_with(
+            settings.BUGZILLA_COMMENT_URL.format(id=self.bugzilla_id),
+            {
+                "comment": "Start Date: {} End Date: {}".format(
+                    self.experiment.start_date, self.experiment.end_date
+                )
+            },
+        )
+
+    def test_start_date_comment_bugzilla_error_raises(self):
+        self.mock_bugzilla_requests_post.side_effect = RequestException()
+
+        with MetricsMock() as mm:
+            with self.assertRaises(bugzilla.BugzillaError):
+                tasks.add_start_date_comment_task(self.experiment.id)
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.add_start_date_comment.failed",
+                    value=1,
+                )
+            )
+
+    def test_completed_bug_resolved(self):
+        with MetricsMock() as mm:
+            tasks.resolve_completed_bug_task(self.experiment.id)
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.resolve_completed_bug.completed",
+                    value=1,
+                )
+            )
+
+        self.mock_bugzilla_requests_put.assert_called_with(
+            settings.BUGZILLA_UPDATE_URL.format(id=self.bugzilla_id),
+            {"status": "RESOLVED", "resolution": "FIXED"},
+        )
+
+    def test_completed_bug_bugzilla_error_raises(self):
+        self.mock_bugzilla_requests_put.side_effect = RequestException()
+
+        with MetricsMock() as mm:
+            with self.assertRaises(bugzilla.BugzillaError):
+                tasks.resolve_completed_bug_task(self.experiment.id)
+
+            self.assertTrue(
+                mm.has_record(
+                    markus.INCR,
+                    "experiments.tasks.resolve_completed_bug.failed",
+                    value=1,
+                )
+            )
@@ -1,5 +1,6 @@
+import mock
 from django.template import Context, Template
-from django.test import RequestFactory, SimpleTestCase
+from django.test import RequestFactory, SimpleTestCase, override_settings
 
 
 class TestPaginationUrl(SimpleTestCase):
@@ -47,3 +48,33 @@ class TestPaginationUrl(SimpleTestCase):
         )
         rendered_template = template_to_render.render(context)
         self.assertEqual("?foo=bar", rendered_template)
+
+
+@override_settings(EXPERIMENT_COMMENTS_PAGINATE_BY=2)
+class TestCommentPage(SimpleTestCase):
+
+    def render(self, comment_ids):
+        context = Context(
+            {
+                "comments": [
+                    mock.Mock(id=comment_id) for comment_id in comment_ids
+                ]
+            }
+        )
+        template_to_render = Template(
+            "{% load experiment_extras %}"
+            "{% with page=comments|comment_page %}"
+            "{% for comment in page.comments %}{{ comment.id }} {% endfor %}"
+            "{{ page.earlier }}"
+            "{% endwith %}"
+        )
+        return template_to_render.render(context)
+
+    def test_returns_newest_page_and_comment_to_load_earlier_before(self):
+        self.assertEqual(self.render([3, 2, 1]), "3 2 2")
+
+    def test_returns_all_comments_of_short_section(self):
+        self.assertEqual(self.render([2, 1]), "2 1 None")
+
+    def test_returns_empty_page_without_comments(self):
+        self.assertEqual(self.render([]), "None")
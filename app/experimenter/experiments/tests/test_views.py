@@ -4,9 +4,12 @@ import random
 import re
 from urllib.parse import urlencode
 
+import factory
 import mock
 from django.conf import settings
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -16,8 +19,11 @@ from experimenter.experiments.forms import (
     ExperimentVariantsPrefForm,
 )
 from experimenter.experiments.forms import NormandyIdForm
-from experimenter.experiments.models import Experiment
-from experimenter.experiments.tests.factories import ExperimentFactory
+from experimenter.experiments.models import Experiment, ExperimentComment
+from experimenter.experiments.tests.factories import (
+    ExperimentCommentFactory,
+    ExperimentFactory,
+)
 from experimenter.experiments.tests.mixins import (
     MockTasksMixin,
     MockRequestMixin,
@@ -172,6 +178,30 @@ class TestExperimentFilterset(MockRequestMixin, TestCase):
         )
         self.assertEqual(set(filter.qs), set([exp_1, exp_2, exp_3]))
 
+    def test_filters_by_firefox_version_numerically(self):
+        exp_1 = ExperimentFactory.create_with_variants(
+            firefox_min_version="99.0", firefox_max_version="101.0"
+        )
+        exp_2 = ExperimentFactory.create_with_variants(
+            firefox_min_version="100.0", firefox_max_version=""
+        )
+        ExperimentFactory.create_with_variants(
+            firefox_min_version="100.0.1", firefox_max_version="101.0"
+        )
+        ExperimentFactory.create_with_variants(
+            firefox_min_version="98.0", firefox_max_version="99.0"
+        )
+
+        filter = ExperimentFilterset({}, queryset=Experiment.objects.all())
+        self.assertEqual(
+            set(
+                filter.version_filter(
+                    Experiment.objects.all(), "firefox_version", "100.0"
+                )
+            ),
+            set([exp_1, exp_2]),
+        )
+
     def test_filters_by_firefox_channel(self):
         include_channel = Experiment.CHANNEL_CHOICES[1][0]
         exclude_channel = Experiment.CHANNEL_CHOICES[2][0]
@@ -271,6 +301,44 @@ class TestExperimentFilterset(MockRequestMixin, TestCase):
             set(second_response_context["experiments"]), set([exp_3])
         )
 
+    def test_search_ranks_name_matches_above_objectives_matches(self):
+        exp_1 = ExperimentFactory.create(
+            name="Experiment One", objectives="Check the pocket button"
+        )
+        exp_2 = ExperimentFactory.create(
+            name="Experiment Two Pocket", objectives=""
+        )
+        ExperimentFactory.create(name="Experiment Three", objectives="")
+
+        filter = ExperimentFilterset(
+            {"search": "pocket"}, queryset=Experiment.objects.all()
+        )
+
+        self.assertEqual(list(filter.qs), [exp_2, exp_1])
+
+    def test_search_matches_owner_email(self):
+        owner = UserFactory.create(email="searchable@example.com")
+        experiment = ExperimentFactory.create(owner=owner)
+        ExperimentFactory.create()
+
+        filter = ExperimentFilterset(
+            {"search": "searchable@example.com"},
+            queryset=Experiment.objects.all(),
+        )
+
+        self.assertEqual(list(filter.qs), [experiment])
+
+    def test_search_matches_updated_fields(self):
+        experiment = ExperimentFactory.create(name="Experiment One")
+        experiment.name = "Experiment Renamed"
+        experiment.save()
+
+        filter = ExperimentFilterset(
+            {"search": "renamed"}, queryset=Experiment.objects.all()
+        )
+
+        self.assertEqual(list(filter.qs), [experiment])
+
     def test_filters_by_review_in_qa(self):
         exp_1 = ExperimentFactory.create_with_variants(
             review_qa_requested=True, review_qa=False
@@ -358,6 +426,40 @@ class TestExperimentListView(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(list(context["experiments"]), list(experiments))
 
+    def test_list_view_annotates_subscriptions_without_extra_queries(self):
+        user = UserFactory.create(email="user@example.com")
+
+        def get_list():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(
+                    reverse("home"),
+                    **{settings.OPENIDC_EMAIL_HEADER: user.email},
+                )
+            return response, len(queries)
+
+        subscribed = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT
+        )
+        subscribed.subscribers.add(user)
+        get_list()
+        response, num_queries = get_list()
+
+        for i in range(3):
+            experiment = ExperimentFactory.create_with_status(
+                Experiment.STATUS_DRAFT
+            )
+            experiment.subscribers.add(*UserFactory.create_batch(3))
+        response, more_num_queries = get_list()
+
+        self.assertEqual(num_queries, more_num_queries)
+        is_subscribed = {
+            experiment.id: experiment.is_subscribed
+            for experiment in response.context[0]["experiments"]
+        }
+        self.assertEqual(len(is_subscribed), 4)
+        self.assertTrue(is_subscribed.pop(subscribed.id))
+        self.assertFalse(any(is_subscribed.values()))
+
     def set_up_date_tests(self):
 
         self.exp_1 = ExperimentFactory.create_with_status(
@@ -627,6 +729,117 @@ class TestExperimentListView(TestCase):
             ],
         )
 
+    def test_list_view_orders_channel_descending_by_latest_change(self):
+        user_email = "user@example.com"
+        now = timezone.now()
+        older_nightly = ExperimentFactory.create(
+            firefox_channel=Experiment.CHANNEL_NIGHTLY
+        )
+        newer_nightly = ExperimentFactory.create(
+            firefox_channel=Experiment.CHANNEL_NIGHTLY
+        )
+        release = ExperimentFactory.create(
+            firefox_channel=Experiment.CHANNEL_RELEASE
+        )
+        for experiment, days in (
+            (older_nightly, 2),
+            (newer_nightly, 1),
+            (release, 3),
+        ):
+            Experiment.objects.filter(pk=experiment.pk).update(
+                latest_change=now - datetime.timedelta(days=days)
+            )
+
+        response = self.client.get(
+            "{url}?{params}".format(
+                url=reverse("home"),
+                params=urlencode({"ordering": "-firefox_channel_sort"}),
+            ),
+            **{settings.OPENIDC_EMAIL_HEADER: user_email},
+        )
+
+        self.assertEqual(
+            list(response.context["experiments"]),
+            [release, newer_nightly, older_nightly],
+        )
+
+    def test_list_view_orders_experiments_by_numeric_min_version(self):
+        user_email = "user@example.com"
+        for version in ("99.0", "100.0", "9.0"):
+            ExperimentFactory.create(firefox_min_version=version)
+
+        response = self.client.get(
+            "{url}?{params}".format(
+                url=reverse("home"),
+                params=urlencode({"ordering": "-firefox_min_version"}),
+            ),
+            **{settings.OPENIDC_EMAIL_HEADER: user_email},
+        )
+
+        context = response.context[0]
+        self.assertEqual(
+            list(exp.firefox_min_version for exp in context["experiments"]),
+            ["100.0", "99.0", "9.0"],
+        )
+        self.assertEqual(
+            context["ordering_form"].cleaned_data["ordering"],
+            "-firefox_min_version",
+        )
+
+    def test_list_view_filters_and_counts_by_readiness(self):
+        user_email = "user@example.com"
+        reviews = {
+            "review_science": True,
+            "review_engineering": True,
+            "review_qa_requested": True,
+            "review_intent_to_ship": True,
+            "review_bugzilla": True,
+            "review_qa": True,
+            "review_relman": True,
+        }
+        ready = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW, type=Experiment.TYPE_PREF, **reviews
+        )
+        ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW,
+            type=Experiment.TYPE_PREF,
+            **dict(reviews, review_science=False),
+        )
+        ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW, type=Experiment.TYPE_ADDON, **reviews
+        )
+
+        response = self.client.get(
+            reverse("home"),
+            {
+                "readiness": Experiment.READINESS_READY_TO_LAUNCH,
+                "type": Experiment.TYPE_PREF,
+            },
+            **{settings.OPENIDC_EMAIL_HEADER: user_email},
+        )
+
+        context = response.context[0]
+        self.assertEqual(list(context["experiments"]), [ready])
+        self.assertIn(
+            "Experiment ready to launch",
+            " ".join(response.content.decode().split()),
+        )
+        # Counted with every filter but readiness
+        self.assertContains(response, "Ready to Launch (1)")
+        self.assertContains(response, "Missing Reviews (1)")
+
+    def test_list_view_counts_no_readiness_for_invalid_filters(self):
+        ExperimentFactory.create_with_status(Experiment.STATUS_REVIEW)
+
+        response = self.client.get(
+            reverse("home"),
+            {"readiness": "invalid"},
+            **{settings.OPENIDC_EMAIL_HEADER: "user@example.com"},
+        )
+
+        self.assertEqual(list(response.context[0]["experiments"]), [])
+        self.assertContains(response, "Missing Reviews (0)")
+
     def test_list_view_total_experiments_count(self):
         user_email = "user@example.com"
 
@@ -1082,6 +1295,23 @@ class TestExperimentDetailView(TestCase):
         self.assertTemplateUsed(response, "experiments/detail_draft.html")
         self.assertTemplateUsed(response, "experiments/detail_base.html")
 
+    def test_view_annotates_subscriptions(self):
+        user = UserFactory.create(email="user@example.com")
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT
+        )
+        experiment.subscribers.add(user, UserFactory.create())
+
+        response = self.client.get(
+            reverse("experiments-detail", kwargs={"slug": experiment.slug}),
+            **{settings.OPENIDC_EMAIL_HEADER: user.email},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context[0]["experiment"].is_subscribed)
+        self.assertContains(response, "Unsubscribe from this experiment")
+        self.assertContains(response, "2 subscribers")
+
     def test_view_renders_locales_correctly(self):
         user_email = "user@example.com"
         experiment = ExperimentFactory.create_with_status(
@@ -1239,6 +1469,118 @@ class TestExperimentReviewUpdateView(TestCase):
         self.assertEqual(change.new_status, experiment.STATUS_REVIEW)
 
 
+class TestExperimentCommentListView(TestCase):
+
+    def setUp(self):
+        self.user_email = "user@example.com"
+        self.experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT
+        )
+        self.comments = ExperimentCommentFactory.create_batch(
+            5,
+            experiment=self.experiment,
+            section=Experiment.SECTION_RISKS,
+            text=factory.Sequence(lambda n: "Comment text {}".format(n)),
+        )
+        ExperimentCommentFactory.create(
+            experiment=self.experiment, section=Experiment.SECTION_TESTING
+        )
+
+    def get_page(self, before):
+        url = reverse(
+            "experiments-comments",
+            kwargs={
+                "slug": self.experiment.slug,
+                "section": Experiment.SECTION_RISKS,
+            },
+        )
+        return self.client.get(
+            url,
+            {"before": before},
+            **{settings.OPENIDC_EMAIL_HEADER: self.user_email},
+        )
+
+    @override_settings(EXPERIMENT_COMMENTS_PAGINATE_BY=2)
+    def test_view_returns_pages_of_section_comments_before_a_comment(self):
+        first_page = self.get_page(self.comments[3].id)
+        last_page = self.get_page(self.comments[1].id)
+
+        self.assertEqual(first_page.status_code, 200)
+        self.assertEqual(
+            list(first_page.context["comments"][:2]), self.comments[2:0:-1]
+        )
+        self.assertContains(first_page, "Show earlier comments")
+        self.assertContains(
+            first_page, "before={}".format(self.comments[1].id)
+        )
+
+        self.assertEqual(
+            list(last_page.context["comments"]), self.comments[:1]
+        )
+        self.assertNotContains(last_page, "Show earlier comments")
+
+    @override_settings(EXPERIMENT_COMMENTS_PAGINATE_BY=2)
+    def test_view_pages_are_not_shifted_by_new_comments(self):
+        ExperimentCommentFactory.create(
+            experiment=self.experiment, section=Experiment.SECTION_RISKS
+        )
+
+        response = self.get_page(self.comments[3].id)
+
+        self.assertEqual(
+            list(response.context["comments"][:2]), self.comments[2:0:-1]
+        )
+
+    def test_view_orders_comments_made_at_the_same_time_by_id(self):
+        ExperimentComment.objects.filter(
+            id__in=[comment.id for comment in self.comments]
+        ).update(created_on=self.comments[0].created_on)
+
+        response = self.get_page(self.comments[2].id)
+
+        self.assertEqual(
+            list(response.context["comments"]), self.comments[1::-1]
+        )
+
+    def test_view_returns_404_past_the_last_page(self):
+        response = self.get_page(self.comments[0].id)
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_view_returns_404_without_a_comment_to_load_before(self):
+        response = self.get_page("latest")
+
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(EXPERIMENT_COMMENTS_PAGINATE_BY=2)
+    def test_detail_page_shows_latest_comments_with_link_to_earlier(self):
+        response = self.client.get(
+            reverse(
+                "experiments-detail", kwargs={"slug": self.experiment.slug}
+            ),
+            **{settings.OPENIDC_EMAIL_HEADER: self.user_email},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        for comment in self.comments[:3]:
+            self.assertNotContains(response, comment.text)
+        for comment in self.comments[3:]:
+            self.assertContains(response, comment.text)
+        self.assertContains(
+            response,
+            "{url}?before={before}".format(
+                before=self.comments[3].id,
+                url=reverse(
+                    "experiments-comments",
+                    kwargs={
+                        "slug": self.experiment.slug,
+                        "section": Experiment.SECTION_RISKS,
+                    },
+                ),
+            ),
+        )
+
+
 class TestExperimentCommentCreateView(TestCase):
 
     def test_view_creates_comment_redirects_to_detail_page(self):
@@ -1268,7 +1610,7 @@ class TestExperimentCommentCreateView(TestCase):
             ),
             fetch_redirect_response=False,
         )
-        comment = experiment.comments.sections[section][0]
+        comment = experiment.comment_sections[section][0]
         self.assertEqual(comment.text, text)
         self.assertEqual(comment.created_by.email, user_email)
 
@@ -2,17 +2,14 @@ import django_filters as filters
 from django import forms
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.db.models import F, Q
+from django.http import Http404
 from django.shortcuts import redirect
 from django.urls import reverse
-from django.views.generic import CreateView, DetailView, UpdateView
+from django.views.generic import CreateView, DetailView, ListView, UpdateView
 from django.views.generic.edit import ModelFormMixin
 from django_filters.views import FilterView
-from django.contrib.postgres.search import (
-    SearchQuery,
-    SearchRank,
-    SearchVector,
-)
+from django.contrib.postgres.search import SearchQuery, SearchRank
 import django_filters.widgets as widgets
 
 from experimenter.projects.models import Project
@@ -29,7 +26,7 @@ from experimenter.experiments.forms import (
     ExperimentVariantsPrefForm,
     NormandyIdForm,
 )
-from experimenter.experiments.models import Experiment
+from experimenter.experiments.models import Experiment, ExperimentComment
 
 
 class ExperimentFiltersetForm(forms.ModelForm):
@@ -66,6 +63,22 @@ class ExperimentFiltersetForm(forms.ModelForm):
 
         return False
 
+    def get_readiness_display_value(self):
+        return dict(Experiment.READINESS_CHOICES).get(
+            self.data.get("readiness")
+        )
+
+    def set_readiness_counts(self, counts):
+        self.fields["readiness"].choices = [("", "Any Readiness")] + [
+            (
+                readiness,
+                "{label} ({count})".format(
+                    label=label, count=counts[readiness]
+                ),
+            )
+            for readiness, label in Experiment.READINESS_CHOICES
+        ]
+
     def get_type_display_value(self):
         return dict(Experiment.TYPE_CHOICES).get(self.data.get("type"))
 
@@ -152,6 +165,13 @@ class ExperimentFilterset(filters.FilterSet):
         widget=forms.Select(attrs={"class": "form-control"}),
     )
 
+    readiness = filters.ChoiceFilter(
+        empty_label="Any Readiness",
+        choices=Experiment.READINESS_CHOICES,
+        widget=forms.Select(attrs={"class": "form-control"}),
+        method="readiness_filter",
+    )
+
     archived = filters.BooleanFilter(
         label="Show archived experiments", widget=forms.CheckboxInput()
     )
@@ -196,29 +216,11 @@ class ExperimentFilterset(filters.FilterSet):
         fields = ExperimentFiltersetForm.Meta.fields
 
     def filter_search(self, queryset, name, value):
-        vector = SearchVector(
-            "name",
-            "short_description",
-            "owner__email",
-            "slug",
-            "related_work",
-            "addon_experiment_id",
-            "pref_key",
-            "public_name",
-            "public_description",
-            "objectives",
-            "analysis",
-            "analysis_owner",
-            "engineering_owner",
-            "bugzilla_id",
-            "normandy_slug",
-        )
-
         query = SearchQuery(value)
 
         return (
-            queryset.annotate(rank=SearchRank(vector, query), search=vector)
-            .filter(search=value)
+            queryset.annotate(rank=SearchRank(F("search_vector"), query))
+            .filter(search_vector=query)
             .order_by("-rank")
         )
 
@@ -229,37 +231,54 @@ class ExperimentFilterset(filters.FilterSet):
         return queryset
 
     def version_filter(self, queryset, name, value):
+        version = Experiment.version_to_int(value)
 
+        # Written as one range on the min version, so the version indexes
+        # can be used
         return queryset.filter(
-            Q(firefox_min_version__lte=value, firefox_max_version__gte=value)
-            | Q(firefox_min_version=value)
+            Q(firefox_max_version_int__gte=version)
+            | Q(firefox_min_version_int=version),
+            firefox_min_version_int__lte=version,
         )
 
+    def readiness_filter(self, queryset, name, value):
+        return queryset.filter(Experiment.readiness_filter(value))
+
+    def filter_queryset_except(self, queryset, excluded_name):
+        """
+        Filter the queryset like filter_queryset, but without the filter
+        called excluded_name, so each of its choices can be counted
+        against the other filters.
+        """
+        for name, value in self.form.cleaned_data.items():
+            if name != excluded_name:
+                queryset = self.filters[name].filter(queryset, value)
+
+        return queryset
+
     def date_range_filter(self, queryset, name, value):
 
         date_type = self.form.cleaned_data["experiment_date_field"]
 
         experiment_date_field = {
-            Experiment.EXPERIMENT_STARTS: "start_date",
-            Experiment.EXPERIMENT_PAUSES: "enrollment_end_date",
-            Experiment.EXPERIMENT_ENDS: "end_date",
+            Experiment.EXPERIMENT_STARTS: "computed_start_date",
+            Experiment.EXPERIMENT_PAUSES: "computed_enrollment_end_date",
+            Experiment.EXPERIMENT_ENDS: "computed_end_date",
         }[date_type]
 
-        results = []
+        # enrollment end dates are optional, so there won't always
+        # be a pause date for an experiment
+        date_filters = {"{}__isnull".format(experiment_date_field): False}
+        if value.start:
+            date_filters[
+                "{}__gte".format(experiment_date_field)
+            ] = value.start.date()
+        if value.stop:
+            date_filters[
+                "{}__lte".format(experiment_date_field)
+            ] = value.stop.date()
 
-        for experiment in queryset.all():
-            date = getattr(experiment, experiment_date_field)
-
-            # enrollment end dates are optional, so there won't always
-            # be a pause date for an experiment
-            if date:
-                if value.start and date < value.start.date():
-                    continue
-                if value.stop and date > value.stop.date():
-                    continue
-                results.append(experiment.id)
-
-        return queryset.filter(pk__in=results)
+        return queryset.filter(**date_filters)
 
     def in_qa_filter(self, queryset, name, value):
         if value:
@@ -290,6 +309,16 @@ class ExperimentOrderingForm(forms.Form):
         ("-firefox_channel_sort", "Firefox Channel Descending"),
     )
 
+    # Choices ordered by stored copies of the fields rather than the
+    # fields, with the latest change breaking ties, so each is read in
+    # order from an index
+    ORDERING_FIELDS = {
+        "firefox_min_version": ("firefox_min_version_int", "latest_change"),
+        "-firefox_min_version": ("-firefox_min_version_int", "-latest_change"),
+        "firefox_channel_sort": ("firefox_channel_order", "latest_change"),
+        "-firefox_channel_sort": ("-firefox_channel_order", "-latest_change"),
+    }
+
     ordering = forms.ChoiceField(
         choices=ORDERING_CHOICES,
         widget=forms.Select(attrs={"class": "form-control"}),
@@ -320,7 +349,7 @@ class ExperimentListView(FilterView):
     def get_queryset(self):
         qs = super().get_queryset()
         qs = qs.annotate(
-            firefox_channel_sort=Experiment.firefox_channel_sort()
+            is_subscribed=Experiment.subscribed_by(self.request.user)
         )
         return qs
 
@@ -328,11 +357,23 @@ class ExperimentListView(FilterView):
         self.ordering_form = ExperimentOrderingForm(self.request.GET)
 
         if self.ordering_form.is_valid():
-            return self.ordering_form.cleaned_data["ordering"]
+            ordering = self.ordering_form.cleaned_data["ordering"]
+            return self.ordering_form.ORDERING_FIELDS.get(ordering, ordering)
 
         return self.ordering_form.ORDERING_CHOICES[0][0]
 
     def get_context_data(self, *args, **kwargs):
+        readiness_queryset = self.object_list
+        if self.filterset.is_valid():
+            # Counted without the readiness filter, so each readiness
+            # shows how many experiments choosing it would list
+            readiness_queryset = self.filterset.filter_queryset_except(
+                self.filterset.queryset.all(), "readiness"
+            )
+
+        self.filterset.form.set_readiness_counts(
+            Experiment.readiness_counts(readiness_queryset)
+        )
         return super().get_context_data(
             ordering_form=self.ordering_form, *args, **kwargs
         )
@@ -403,6 +444,16 @@ class ExperimentDetailView(ExperimentFormMixin, ModelFormMixin, DetailView):
     form_class = ExperimentReviewForm
     queryset = Experiment.objects.get_prefetched()
 
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .annotate(
+                is_subscribed=Experiment.subscribed_by(self.request.user),
+                subscriber_count=Experiment.subscriber_count(),
+            )
+        )
+
     def get_template_names(self):
         return [
             "experiments/detail_{status}.html".format(
@@ -478,6 +529,42 @@ class ExperimentNormandyUpdateView(ExperimentFormMixin, UpdateView):
         )
 
 
+class ExperimentCommentListView(ListView):
+    """
+    Pages of a section's comments, newest first, for the detail page to
+    load the earlier comments of long discussions. Each page starts
+    before the oldest comment of the page shown above it.
+    """
+
+    template_name = "experiments/comments.html"
+    context_object_name = "comments"
+    allow_empty = False
+
+    def get_queryset(self):
+        comments = ExperimentComment.objects.filter(
+            experiment__slug=self.kwargs["slug"],
+            section=self.kwargs["section"],
+        )
+
+        before = self.request.GET.get("before", "")
+        if not before.isdigit():
+            raise Http404("Invalid comment to load comments before")
+
+        return (
+            comments.older_than(int(before))
+            .select_related("created_by")
+            .newest_first()[: settings.EXPERIMENT_COMMENTS_PAGINATE_BY + 1]
+        )
+
+    def get_context_data(self, *args, **kwargs):
+        return super().get_context_data(
+            slug=self.kwargs["slug"],
+            section_name=self.kwargs["section"],
+            *args,
+            **kwargs,
+        )
+
+
 class ExperimentCommentCreateView(ExperimentFormMixin, CreateView):
     form_class = ExperimentCommentForm
 
@@ -3,6 +3,7 @@ from django.urls import re_path
 from experimenter.experiments.views import (
     ExperimentArchiveUpdateView,
     ExperimentCommentCreateView,
+    ExperimentCommentListView,
     ExperimentCreateView,
     ExperimentDetailView,
     ExperimentNormandyUpdateView,
@@ -70,6 +71,11 @@ urlpatterns = [
         ExperimentCommentCreateView.as_view(),
         name="experiments-comment-create",
     ),
+    re_path(
+        r"^(?P<slug>[\w-]+)/comments/(?P<section>[\w-]+)/$",
+        ExperimentCommentListView.as_view(),
+        name="experiments-comments",
+    ),
     re_path(
         r"^(?P<slug>[\w-]+)/$",
         ExperimentDetailView.as_view(),
@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.core.cache import cache
+from django.db import connection, models, transaction
 
 
 class NotificationManager(models.Manager):
@@ -9,14 +10,32 @@ class NotificationManager(models.Manager):
         return self.filter(read=False).count() > 0
 
     def get_unread(self):
-        unread = list(self.filter(read=False))
+        """
+        Mark unread notifications as read and return them, in a single
+        UPDATE ... RETURNING so none created meanwhile can be missed.
+        """
+        unread_ids_sql, params = (
+            self.filter(read=False).values("id").query.sql_with_params()
+        )
+        unread = self.model.objects.raw(
+            (
+                "UPDATE {table} SET {read} = true "
+                "WHERE {read} = false AND {id} IN ({unread_ids}) "
+                "RETURNING *"
+            ).format(
+                table=connection.ops.quote_name(self.model._meta.db_table),
+                read=connection.ops.quote_name("read"),
+                id=connection.ops.quote_name("id"),
+                unread_ids=unread_ids_sql,
+            ),
+            params,
+        )
 
-        self.update(read=True)
-
-        return unread
+        return sorted(unread, key=lambda notification: notification.created_on)
 
 
 class Notification(models.Model):
+    HAS_UNREAD_CACHE_KEY = "notifications-has-unread:{user_id}"
 
     user = models.ForeignKey(
         get_user_model(),
@@ -36,3 +55,13 @@ class Notification(models.Model):
 
     def __str__(self):  # pragma: no cover
         return self.message
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+
+        if adding and not self.read:
+            # Set once committed, so a page reading the notifications in
+            # between can't clear the flag without seeing this one
+            cache_key = self.HAS_UNREAD_CACHE_KEY.format(user_id=self.user_id)
+            transaction.on_commit(lambda: cache.set(cache_key, True))
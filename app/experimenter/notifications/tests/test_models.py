@@ -1,5 +1,8 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase
 
+from experimenter.notifications.models import Notification
 from experimenter.openidc.tests.factories import UserFactory
 from experimenter.notifications.tests.factories import NotificationFactory
 
@@ -63,3 +66,44 @@ class TestNotificationModel(TestCase):
             set(user2.notifications.get_unread()), set(user2_notifications)
         )
         self.assertEqual(set(user2.notifications.get_unread()), set([]))
+
+    def test_get_unread_makes_one_query(self):
+        user = UserFactory.create()
+        notifications = [
+            NotificationFactory.create(user=user) for i in range(3)
+        ]
+
+        with self.assertNumQueries(1):
+            self.assertEqual(user.notifications.get_unread(), notifications)
+
+
+class TestNotificationHasUnreadFlag(TransactionTestCase):
+
+    def setUp(self):
+        self.user = UserFactory.create()
+        self.cache_key = Notification.HAS_UNREAD_CACHE_KEY.format(
+            user_id=self.user.id
+        )
+        cache.set(self.cache_key, False)
+
+    def test_creating_unread_notification_sets_has_unread_flag(self):
+        NotificationFactory.create(user=self.user, read=True)
+        self.assertFalse(cache.get(self.cache_key))
+
+        NotificationFactory.create(user=self.user, read=False)
+        self.assertTrue(cache.get(self.cache_key))
+
+    def test_has_unread_flag_is_set_once_committed(self):
+        with transaction.atomic():
+            NotificationFactory.create(user=self.user)
+            self.assertFalse(cache.get(self.cache_key))
+
+        self.assertTrue(cache.get(self.cache_key))
+
+    def test_has_unread_flag_is_not_set_when_rolled_back(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                NotificationFactory.create(user=self.user)
+                raise RuntimeError()
+
+        self.assertFalse(cache.get(self.cache_key))
@@ -1,10 +1,27 @@
+import functools
+
+import markus
 from django.urls import resolve, Resolver404
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.http import HttpResponse
 from rest_framework.authentication import SessionAuthentication
 
 
+metrics = markus.get_metrics("openidc.middleware")
+
+USER_CACHE_KEY = "openidc-user:{email}"
+
+
+@functools.lru_cache(maxsize=1024)
+def get_url_name(path):
+    try:
+        return resolve(path).url_name
+    except Resolver404:
+        return None
+
+
 class OpenIDCAuthMiddleware(object):
     """
     An authentication middleware that depends on a header being set in the
@@ -20,14 +37,19 @@ class OpenIDCAuthMiddleware(object):
         self.User = get_user_model()
 
     def __call__(self, request):
-        try:
-            resolved = resolve(request.path)
-            if resolved.url_name in settings.OPENIDC_AUTH_WHITELIST:
-                # If the requested path is in our auth whitelist,
-                # skip authentication entirely
-                return self.get_response(request)
-        except Resolver404:
-            pass
+        with metrics.timer("timing"):
+            response = self.authenticate(request)
+
+        if response is None:
+            response = self.get_response(request)
+
+        return response
+
+    def authenticate(self, request):
+        if get_url_name(request.path) in settings.OPENIDC_AUTH_WHITELIST:
+            # If the requested path is in our auth whitelist,
+            # skip authentication entirely
+            return
 
         openidc_email = request.META.get(settings.OPENIDC_EMAIL_HEADER, None)
 
@@ -38,18 +60,38 @@ class OpenIDCAuthMiddleware(object):
                 "Please login using OpenID Connect", status=401
             )
 
-        try:
-            user = self.User.objects.get(username=openidc_email)
-        except self.User.DoesNotExist:
-            user = self.User(username=openidc_email, email=openidc_email)
-            if user.email == settings.DEV_USER_EMAIL and settings.DEBUG:
-                user.is_superuser = True
-                user.is_staff = True
-            user.save()
+        request.user = self.get_user(openidc_email)
+
+    def get_user(self, email):
+        """
+        Look the user up in the shared cache and only then in the database.
+        Every request gets its own copy from the cache, so one request can't
+        change the user seen by another.
+        """
+        cache_key = USER_CACHE_KEY.format(email=email)
+        user = cache.get(cache_key)
+
+        if user is None:
+            user = self.get_or_create_user(email)
+            cache.set(cache_key, user, settings.OPENIDC_USER_CACHE_TIMEOUT)
+
+        return user
+
+    def get_or_create_user(self, email):
+        is_dev_user = email == settings.DEV_USER_EMAIL and settings.DEBUG
 
-        request.user = user
+        # get_or_create falls back to fetching the row if a concurrent first
+        # login created it first
+        user, created = self.User.objects.get_or_create(
+            username=email,
+            defaults={
+                "email": email,
+                "is_superuser": is_dev_user,
+                "is_staff": is_dev_user,
+            },
+        )
 
-        return self.get_response(request)
+        return user
 
 
 class OpenIDCRestFrameworkAuthenticator(SessionAuthentication):
@@ -1,16 +1,21 @@
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.urls import Resolver404
 from django.test import TestCase
 
 import mock
 
-from experimenter.openidc.middleware import OpenIDCAuthMiddleware
+from experimenter.openidc.middleware import OpenIDCAuthMiddleware, get_url_name
+from experimenter.openidc.tests.factories import UserFactory
 
 
 class OpenIDCAuthMiddlewareTests(TestCase):
 
     def setUp(self):
+        cache.clear()
+        get_url_name.cache_clear()
+
         self.response = "Response"
         self.middleware = OpenIDCAuthMiddleware(lambda request: self.response)
 
@@ -117,3 +122,125 @@ class OpenIDCAuthMiddlewareTests(TestCase):
         self.assertEqual(request.user.email, dev_email)
         self.assertFalse(request.user.is_staff)
         self.assertFalse(request.user.is_superuser)
+
+    def test_url_name_resolved_once_per_path(self):
+        mock_view = mock.Mock()
+        mock_view.url_name = "whitelisted-view"
+        self.mock_resolve.return_value = mock_view
+
+        with self.settings(OPENIDC_AUTH_WHITELIST=["whitelisted-view"]):
+            for i in range(3):
+                request = mock.Mock()
+                request.path = "/whitelisted-view/"
+                self.assertEqual(self.middleware(request), self.response)
+
+        self.mock_resolve.assert_called_once_with("/whitelisted-view/")
+
+    def test_whitelist_checked_on_every_request(self):
+        mock_view = mock.Mock()
+        mock_view.url_name = "whitelisted-view"
+        self.mock_resolve.return_value = mock_view
+
+        request = mock.Mock()
+        request.path = "/whitelisted-view/"
+        request.META = {}
+
+        with self.settings(OPENIDC_AUTH_WHITELIST=["whitelisted-view"]):
+            self.assertEqual(self.middleware(request), self.response)
+
+        with self.settings(OPENIDC_AUTH_WHITELIST=[]):
+            self.assertEqual(self.middleware(request).status_code, 401)
+
+    def test_user_is_cached_between_requests(self):
+        user = UserFactory.create()
+
+        with self.settings(
+            OPENIDC_AUTH_WHITELIST=[], OPENIDC_USER_CACHE_TIMEOUT=60
+        ):
+            request = mock.Mock()
+            request.META = {settings.OPENIDC_EMAIL_HEADER: user.email}
+            with self.assertNumQueries(1):
+                self.middleware(request)
+            self.assertEqual(request.user, user)
+
+            # A fresh process still finds it in the shared cache
+            for middleware in (
+                self.middleware,
+                OpenIDCAuthMiddleware(lambda request: self.response),
+            ):
+                request = mock.Mock()
+                request.META = {settings.OPENIDC_EMAIL_HEADER: user.email}
+                with self.assertNumQueries(0):
+                    middleware(request)
+                self.assertEqual(request.user, user)
+
+    def test_user_is_only_cached_in_the_shared_cache(self):
+        user = UserFactory.create()
+
+        with self.settings(
+            OPENIDC_AUTH_WHITELIST=[], OPENIDC_USER_CACHE_TIMEOUT=60
+        ):
+            request = mock.Mock()
+            request.META = {settings.OPENIDC_EMAIL_HEADER: user.email}
+            self.middleware(request)
+
+            cache.clear()
+            user.is_staff = True
+            user.save()
+
+            request = mock.Mock()
+            request.META = {settings.OPENIDC_EMAIL_HEADER: user.email}
+            with self.assertNumQueries(1):
+                self.middleware(request)
+            self.assertTrue(request.user.is_staff)
+
+    def test_each_request_gets_its_own_user(self):
+        user = UserFactory.create()
+
+        with self.settings(
+            OPENIDC_AUTH_WHITELIST=[], OPENIDC_USER_CACHE_TIMEOUT=60
+        ):
+            users = []
+            for i in range(2):
+                request = mock.Mock()
+                request.META = {settings.OPENIDC_EMAIL_HEADER: user.email}
+                self.middleware(request)
+                users.append(request.user)
+
+        users[0].is_staff = True
+        self.assertFalse(users[1].is_staff)
+
+    def test_expired_user_is_looked_up_again(self):
+        user = UserFactory.create()
+
+        with self.settings(
+            OPENIDC_AUTH_WHITELIST=[], OPENIDC_USER_CACHE_TIMEOUT=0
+        ):
+            for i in range(2):
+                request = mock.Mock()
+                request.META = {settings.OPENIDC_EMAIL_HEADER: user.email}
+                with self.assertNumQueries(1):
+                    self.middleware(request)
+
+    def test_existing_user_is_not_created_again(self):
+        user = UserFactory.create()
+
+        request = mock.Mock()
+        request.META = {settings.OPENIDC_EMAIL_HEADER: user.email}
+
+        with self.settings(OPENIDC_AUTH_WHITELIST=[]):
+            self.middleware(request)
+
+        self.assertEqual(get_user_model().objects.count(), 1)
+        self.assertEqual(request.user, user)
+
+    def test_middleware_is_timed(self):
+        request = mock.Mock()
+        request.META = {}
+
+        with mock.patch(
+            "experimenter.openidc.middleware.metrics"
+        ) as mock_metrics:
+            self.middleware(request)
+
+        mock_metrics.timer.assert_called_once_with("timing")
@@ -87,6 +87,7 @@ TEMPLATES = [
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
                 "experimenter.base.context_processors.google_analytics",
+                "experimenter.base.context_processors.unread_notifications",
             ],
             "debug": DEBUG,
         },
@@ -129,7 +130,14 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 OPENIDC_EMAIL_HEADER = config("OPENIDC_HEADER")
-OPENIDC_AUTH_WHITELIST = ("experiments-api-list",)
+OPENIDC_AUTH_WHITELIST = (
+    "experiments-api-list",
+    "experiments-api-export",
+    "experiments-api-readiness",
+)
+OPENIDC_USER_CACHE_TIMEOUT = config(
+    "OPENIDC_USER_CACHE_TIMEOUT", default=60, cast=int
+)
 
 
 # Internationalization
@@ -232,6 +240,12 @@ EXPERIMENTS_PAGINATE_BY = config(
     "EXPERIMENTS_PAGINATE_BY", default=10, cast=int
 )
 
+# Comments shown per section of the detail page, earlier comments are
+# loaded a page at a time on request
+EXPERIMENT_COMMENTS_PAGINATE_BY = config(
+    "EXPERIMENT_COMMENTS_PAGINATE_BY", default=20, cast=int
+)
+
 USE_GOOGLE_ANALYTICS = config("USE_GOOGLE_ANALYTICS", default=True, cast=bool)
 
 # Automated email destinations
@@ -247,6 +261,10 @@ EMAIL_HOST_USER = config("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD")
 EMAIL_USE_TLS = not DEBUG
 EMAIL_USE_SSL = False
+# Times a failed batch of experiment emails is retried, with exponential
+# backoff starting at EMAIL_RETRY_BACKOFF seconds
+EMAIL_RETRIES = config("EMAIL_RETRIES", default=5, cast=int)
+EMAIL_RETRY_BACKOFF = config("EMAIL_RETRY_BACKOFF", default=60, cast=float)
 
 # Email to send to when an experiment is ready for review
 EMAIL_REVIEW = config("EMAIL_REVIEW")
@@ -257,8 +275,26 @@ EMAIL_SHIP = config("EMAIL_SHIP")
 # Email to send to when an experiment is being signed-off
 EMAIL_RELEASE_DRIVERS = config("EMAIL_RELEASE_DRIVERS")
 
+# Outbound API calls to Bugzilla and Normandy
+# Seconds to wait for a connection or response before giving up
+HTTP_CLIENT_TIMEOUT = config("HTTP_CLIENT_TIMEOUT", default=10, cast=float)
+# Retries for connection errors and 5xx responses, with exponential backoff
+HTTP_CLIENT_RETRIES = config("HTTP_CLIENT_RETRIES", default=3, cast=int)
+HTTP_CLIENT_RETRY_BACKOFF = config(
+    "HTTP_CLIENT_RETRY_BACKOFF", default=0.5, cast=float
+)
+
 # Bugzilla API Integration
 BUGZILLA_HOST = config("BUGZILLA_HOST")
+# Calls to Bugzilla allowed per period (in seconds) across all processes
+BUGZILLA_RATE_LIMIT = config("BUGZILLA_RATE_LIMIT", default=5, cast=int)
+BUGZILLA_RATE_LIMIT_PERIOD = config(
+    "BUGZILLA_RATE_LIMIT_PERIOD", default=1, cast=float
+)
+# Times a throttled Bugzilla task is rescheduled before it fails
+BUGZILLA_RATE_LIMIT_RETRIES = config(
+    "BUGZILLA_RATE_LIMIT_RETRIES", default=10, cast=int
+)
 BUGZILLA_API_KEY = config("BUGZILLA_API_KEY")
 BUGZILLA_CC_LIST = config("BUGZILLA_CC_LIST")
 BUGZILLA_CREATE_PATH = "/rest/bug"
@@ -287,16 +323,31 @@ REDIS_HOST = config("REDIS_HOST")
 REDIS_PORT = config("REDIS_PORT")
 REDIS_DB = config("REDIS_DB")
 
-# Celery
-CELERY_BROKER_URL = "redis://{host}:{port}/{db}".format(
+REDIS_URL = "redis://{host}:{port}/{db}".format(
     host=REDIS_HOST, port=REDIS_PORT, db=REDIS_DB
 )
+
+# Cache
+CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": REDIS_URL,
+        "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+    }
+}
+
+# Celery
+CELERY_BROKER_URL = REDIS_URL
 CELERY_BEAT_SCHEDULE = {
     "debug_task": {
         "task": "experimenter.experiments.tasks.update_experiment_info",
         "schedule": 300,
     }
 }
+# How long to remember the latest queued Bugzilla update of an experiment
+TASK_COALESCE_TIMEOUT = config(
+    "TASK_COALESCE_TIMEOUT", default=60 * 60 * 24, cast=int
+)
 
 # Normandy Configuration
 NORMANDY_SLUG_MAX_LEN = 80
@@ -333,6 +384,27 @@ DELIVERY_CONSOLE_NEW_RECIPE_URL = urljoin(DELIVERY_CONSOLE_HOST, "/recipe/new")
 DELIVERY_CONSOLE_RECIPE_URL = urljoin(DELIVERY_CONSOLE_HOST, "/recipe/{id}/")
 NORMANDY_API_HOST = config("NORMANDY_API_HOST")
 NORMANDY_API_RECIPE_URL = urljoin(NORMANDY_API_HOST, "/api/v3/recipe/{id}/")
+NORMANDY_API_RECIPES_URL = urljoin(NORMANDY_API_HOST, "/api/v3/recipe/")
+
+# Number of recipes requested per page of the Normandy recipe list
+NORMANDY_API_PAGE_SIZE = config(
+    "NORMANDY_API_PAGE_SIZE", default=100, cast=int
+)
+
+# Number of recipe pages fetched in parallel when syncing experiment statuses
+NORMANDY_API_CONCURRENCY = config(
+    "NORMANDY_API_CONCURRENCY", default=8, cast=int
+)
+
+# Seconds a rendered experiment recipe is cached for
+RECIPE_CACHE_TIMEOUT = config(
+    "RECIPE_CACHE_TIMEOUT", default=60 * 60 * 24 * 7, cast=int
+)
+
+# Seconds a Normandy response is kept for conditional requests
+NORMANDY_API_CACHE_TIMEOUT = config(
+    "NORMANDY_API_CACHE_TIMEOUT", default=60 * 60 * 24, cast=int
+)
 
 # Jira URL
 JIRA_URL = "https://moz-pi-test.atlassian.net/servicedesk/customer/portal/9"
@@ -10,6 +10,13 @@ LOGGING = {
     "loggers": {},
 }
 
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+# Test cases roll back the users they create, so don't remember them
+OPENIDC_USER_CACHE_TIMEOUT = 0
+
 HOSTNAME = "experimenter.moz"
 
 EMAIL_REVIEW = "testreview@example.com"
@@ -38,3 +38,16 @@ jQuery(function($) {
     }
   });
 });
+
+// Load the earlier comments of a section in place of the link to them
+jQuery(function($) {
+  $(document).on("click", "a.load-earlier-comments", async function(e) {
+    e.preventDefault();
+
+    const row = $(this).closest(".row");
+    const resp = await fetch(this.href, {credentials: "same-origin"});
+    if (resp.status == 200) {
+      row.replaceWith(await resp.text());
+    }
+  });
+});